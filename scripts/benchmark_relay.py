@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# This script measures the cost of relaying a message (as done by the network engine of components forwarding messages),
+# depending on the size of its payload. For both wire formats, relaying only the envelope of a message is compared to fully
+# decoding and re-encoding it.
+#
+# Run this script from the root directory of the repository (the Python requirements of the components need to be installed).
+
+import dataclasses
+import sys
+import time
+import typing
+
+sys.path.insert(0, "./src")
+
+# pylint: disable=wrong-import-position
+from common.py.api.network import PingCommand
+from common.py.core.messaging import Channel
+from common.py.core.messaging.networking import (
+    EncodedMessage,
+    ReceivedMessage,
+    WireFormat,
+)
+from common.py.utils import UnitID
+
+ITERATIONS = 2000
+PAYLOAD_SIZES = [16, 1024, 16 * 1024, 256 * 1024]
+
+RELAY_ID = UnitID("infra", "gate", "default")
+
+
+def relay_envelope(msg_type: type, data: str | bytes, wire_format: WireFormat) -> None:
+    """
+    Relays a message by only decoding its envelope.
+    """
+    received_msg = ReceivedMessage(msg_type, data)
+    received_msg.envelope.hops.append(RELAY_ID)
+    envelope = dataclasses.replace(received_msg.envelope, sender=RELAY_ID)
+    EncodedMessage(envelope, payload=received_msg.payload).encode(wire_format)
+
+
+def relay_full(msg_type: type, data: str | bytes, wire_format: WireFormat) -> None:
+    """
+    Relays a message by fully decoding and re-encoding it.
+    """
+    msg = ReceivedMessage(msg_type, data).decode()
+    msg.hops.append(RELAY_ID)
+    EncodedMessage(dataclasses.replace(msg, sender=RELAY_ID)).encode(wire_format)
+
+
+def measure(func: typing.Callable[[], typing.Any]) -> float:
+    """
+    Measures the average execution time of a function (in microseconds).
+    """
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        func()
+    return (time.perf_counter() - start) / ITERATIONS * 1_000_000
+
+
+if __name__ == "__main__":
+    header = f"{'Payload (B)':>11} {'Format':>8} {'Envelope relay (us)':>20} {'Full relay (us)':>16}"
+    print(header)
+    print("-" * len(header))
+
+    for size in PAYLOAD_SIZES:
+        msg = PingCommand(
+            origin=UnitID("infra", "server", "default"),
+            sender=UnitID("infra", "server", "default"),
+            target=Channel.direct(UnitID("web", "frontend", "default")),
+            payload="x" * size,
+        )
+
+        for wire_format in WireFormat:
+            data = EncodedMessage(msg).encode(wire_format)
+            print(
+                f"{size:>11} {wire_format.value:>8} "
+                f"{measure(lambda: relay_envelope(PingCommand, data, wire_format)):>20.1f} "
+                f"{measure(lambda: relay_full(PingCommand, data, wire_format)):>16.1f}"
+            )
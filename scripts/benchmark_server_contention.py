@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# This script measures the throughput of the network server when many threads send messages concurrently. Emitting a message is
+# simulated to take some time (as writing to a real socket would), during which other threads can proceed. The server is compared
+# to a variant that holds a single lock during the whole send operation (as done previously).
+#
+# Run this script from the root directory of the repository (the Python requirements of the components need to be installed).
+
+import logging
+import random
+import sys
+import threading
+import time
+import typing
+
+sys.path.insert(0, "./src")
+
+# pylint: disable=wrong-import-position,protected-access
+from semantic_version import Version
+
+from common.py.component import BackendComponentData
+from common.py.component.roles import NodeRole
+from common.py.core.logging import set_level
+from common.py.core.messaging import Channel, MessageBus
+from common.py.core.messaging.networking import EncodedMessage
+from common.py.settings import get_default_settings
+from common.py.utils import UnitID
+from common.py.utils.config import Configuration
+
+# The API modules need to be imported last, as socket.io needs to be loaded before the custom logger class is installed
+from common.py.api.network import PingCommand
+
+CLIENT_COUNT = 100
+MESSAGES_PER_RUN = 4000
+SENDER_COUNTS = [1, 2, 4, 8, 16]
+EMIT_LATENCY = 0.0001  # Simulated time (in seconds) it takes to hand a message over to the transport
+
+
+def create_server() -> typing.Any:
+    """
+    Creates a network server (as part of a message bus of a node component) with simulated clients.
+    """
+    config = Configuration()
+    config.add_defaults(get_default_settings())
+
+    comp_data = BackendComponentData(
+        comp_id=UnitID("infra", "server", "default"),
+        role=NodeRole(),
+        config=config,
+        title="Benchmark",
+        name="benchmark",
+        version=Version("0.0.1"),
+    )
+    server = MessageBus(comp_data).network.server
+
+    for i in range(CLIENT_COUNT):
+        server._on_connect(
+            server.manager.connect(f"eio-{i}", "/"),
+            None,
+            {"component_id": str(UnitID("web", "frontend", f"client{i}"))},
+        )
+
+    # Simulate the transport taking some time (releasing the GIL, just like socket I/O does)
+    send_eio_packet = server._send_eio_packet
+
+    def send(*args, **kwargs) -> None:
+        time.sleep(EMIT_LATENCY)
+        send_eio_packet(*args, **kwargs)
+
+    server._send_eio_packet = send
+    return server
+
+
+def run_senders(send: typing.Callable[[EncodedMessage], None], senders: int) -> float:
+    """
+    Sends messages to random clients from multiple threads and returns the throughput (in messages per second).
+    """
+    origin = UnitID("infra", "server", "default")
+    messages = [
+        PingCommand(
+            origin=origin,
+            sender=origin,
+            target=Channel.direct(
+                UnitID("web", "frontend", f"client{random.randrange(CLIENT_COUNT)}")
+            ),
+        )
+        for _ in range(MESSAGES_PER_RUN)
+    ]
+
+    def sender(index: int) -> None:
+        for msg in messages[index::senders]:
+            send(EncodedMessage(msg))
+
+    threads = [
+        threading.Thread(target=sender, args=(index,)) for index in range(senders)
+    ]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return MESSAGES_PER_RUN / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    set_level(logging.ERROR)
+
+    server = create_server()
+    global_lock = threading.RLock()
+
+    def send_serialized(encoded_msg: EncodedMessage) -> None:
+        """
+        Sends a message while holding a single global lock.
+        """
+        with global_lock:
+            server.send_message(encoded_msg)
+
+    header = f"{'Senders':>7} {'Fine-grained (msg/s)':>21} {'Global lock (msg/s)':>20}"
+    print(header)
+    print("-" * len(header))
+
+    for count in SENDER_COUNTS:
+        print(
+            f"{count:>7} "
+            f"{run_senders(server.send_message, count):>21.0f} "
+            f"{run_senders(send_serialized, count):>20.0f}"
+        )
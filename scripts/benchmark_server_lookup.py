@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# This script measures the per-message cost of mapping an incoming message to its connected component in the network server,
+# depending on the number of connected clients (up to 10k simulated web clients). The indexed lookup used by the server is
+# compared to a linear scan over all connected components (as done previously).
+#
+# Run this script from the root directory of the repository (the Python requirements of the components need to be installed).
+
+import logging
+import sys
+import time
+import typing
+
+sys.path.insert(0, "./src")
+
+# pylint: disable=wrong-import-position,protected-access
+from semantic_version import Version
+
+from common.py.component import BackendComponentData
+from common.py.component.roles import NodeRole
+from common.py.core.logging import set_level
+from common.py.core.messaging import MessageBus
+from common.py.settings import get_default_settings
+from common.py.utils import UnitID
+from common.py.utils.config import Configuration
+
+ITERATIONS = 2000
+CONNECTION_COUNTS = [10, 100, 1000, 10000]
+
+
+def create_server() -> typing.Any:
+    """
+    Creates a network server (as part of a message bus of a node component).
+    """
+    config = Configuration()
+    config.add_defaults(get_default_settings())
+
+    comp_data = BackendComponentData(
+        comp_id=UnitID("infra", "server", "default"),
+        role=NodeRole(),
+        config=config,
+        title="Benchmark",
+        name="benchmark",
+        version=Version("0.0.1"),
+    )
+    return MessageBus(comp_data).network.server
+
+
+def linear_lookup(server: typing.Any, sid: str) -> UnitID | None:
+    """
+    Looks up the component of a client by scanning all connected components.
+    """
+    for comp_id, entry in server._connected_components.items():
+        if entry.sid == sid:
+            return comp_id
+    return None
+
+
+def measure(func: typing.Callable[[], typing.Any]) -> float:
+    """
+    Measures the average execution time of a function (in microseconds).
+    """
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        func()
+    return (time.perf_counter() - start) / ITERATIONS * 1_000_000
+
+
+if __name__ == "__main__":
+    set_level(logging.ERROR)
+
+    server = create_server()
+    sids: typing.List[str] = []
+
+    header = f"{'Connections':>11} {'Message (us)':>13} {'Indexed lookup (us)':>20} {'Linear scan (us)':>17}"
+    print(header)
+    print("-" * len(header))
+
+    for count in CONNECTION_COUNTS:
+        # Simulate connecting web clients; the last connected client is the worst case for a linear scan
+        while len(sids) < count:
+            sid = server.manager.connect(f"eio-{len(sids)}", "/")
+            server._on_connect(
+                sid,
+                None,
+                {"component_id": str(UnitID("web", "frontend", f"client{len(sids)}"))},
+            )
+            sids.append(sid)
+
+        sid = sids[-1]
+        print(
+            f"{count:>11} "
+            f"{measure(lambda: server._on_message('benchmark', sid, '{}')):>13.2f} "
+            f"{measure(lambda: server._lookup_client(sid)):>20.2f} "
+            f"{measure(lambda: linear_lookup(server, sid)):>17.2f}"
+        )
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# This script measures the cost of a single processing tick of the network server (which purges timed out clients) and of
+# timestamping incoming messages, depending on the number of connected clients (up to 10k simulated web clients). The deadline heap
+# used by the server is compared to checking every connected component on each tick (as done previously).
+#
+# Run this script from the root directory of the repository (the Python requirements of the components need to be installed).
+
+import logging
+import sys
+import time
+import typing
+
+sys.path.insert(0, "./src")
+
+# pylint: disable=wrong-import-position,protected-access
+from semantic_version import Version
+
+from common.py.component import BackendComponentData
+from common.py.component.roles import NodeRole
+from common.py.core.logging import set_level
+from common.py.core.messaging import MessageBus
+from common.py.settings import get_default_settings
+from common.py.utils import UnitID
+from common.py.utils.config import Configuration
+
+ITERATIONS = 2000
+CONNECTION_COUNTS = [10, 100, 1000, 10000]
+
+
+def create_server() -> typing.Any:
+    """
+    Creates a network server (as part of a message bus of a node component).
+    """
+    config = Configuration()
+    config.add_defaults(get_default_settings())
+
+    comp_data = BackendComponentData(
+        comp_id=UnitID("infra", "server", "default"),
+        role=NodeRole(),
+        config=config,
+        title="Benchmark",
+        name="benchmark",
+        version=Version("0.0.1"),
+    )
+    return MessageBus(comp_data).network.server
+
+
+def full_scan(server: typing.Any) -> typing.List[UnitID]:
+    """
+    Finds timed out components by checking every connected component.
+    """
+    return [
+        comp_id
+        for comp_id, entry in server._connected_components.items()
+        if entry.has_timed_out()
+    ]
+
+
+def measure(func: typing.Callable[[], typing.Any]) -> float:
+    """
+    Measures the average execution time of a function (in microseconds).
+    """
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        func()
+    return (time.perf_counter() - start) / ITERATIONS * 1_000_000
+
+
+if __name__ == "__main__":
+    set_level(logging.ERROR)
+
+    server = create_server()
+    comp_ids: typing.List[UnitID] = []
+
+    header = f"{'Connections':>11} {'Timestamp (us)':>15} {'Deadline heap (us)':>19} {'Full scan (us)':>15}"
+    print(header)
+    print("-" * len(header))
+
+    for count in CONNECTION_COUNTS:
+        # Simulate connecting web clients, all of which are subject to the idle timeout
+        while len(comp_ids) < count:
+            comp_id = UnitID("web", "frontend", f"client{len(comp_ids)}")
+            server._on_connect(
+                server.manager.connect(f"eio-{len(comp_ids)}", "/"),
+                None,
+                {"component_id": str(comp_id)},
+            )
+            comp_ids.append(comp_id)
+
+        comp_id = comp_ids[-1]
+        print(
+            f"{count:>11} "
+            f"{measure(lambda: server._timestamp_component(comp_id)):>15.2f} "
+            f"{measure(server._find_timed_out_components):>19.2f} "
+            f"{measure(lambda: full_scan(server)):>15.2f}"
+        )
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# This script compares the wire formats (JSON and MessagePack) used to send messages across the network.
+# For every registered message type, a sample message is created and encoded/decoded repeatedly; the encoded size
+# and the average encoding/decoding times are printed for both formats.
+#
+# Run this script from the root directory of the repository (the Python requirements of the components need to be installed).
+
+import dataclasses
+import enum
+import sys
+import time
+import types
+import typing
+import uuid
+
+sys.path.insert(0, "./src")
+
+# pylint: disable=wrong-import-position
+from common.py.core.messaging import Channel, Message, MessageCodec, MessageTypesCatalog
+from common.py.utils import UnitID
+
+import common.py.api.component  # pylint: disable=unused-import
+import common.py.api.connector  # pylint: disable=unused-import
+import common.py.api.network  # pylint: disable=unused-import
+import common.py.api.project  # pylint: disable=unused-import
+import common.py.api.user  # pylint: disable=unused-import
+
+ITERATIONS = 500
+LIST_LENGTH = 10
+
+
+def create_value(value_type: typing.Any) -> typing.Any:
+    """
+    Creates a sample value for the given type.
+    """
+    origin = typing.get_origin(value_type)
+    args = typing.get_args(value_type)
+
+    if origin in (typing.Union, types.UnionType):
+        return create_value(next(arg for arg in args if arg is not type(None)))
+    if origin is list:
+        return [create_value(args[0]) for _ in range(LIST_LENGTH)]
+    if origin is dict or value_type is typing.Any:
+        return {"key": "value", "number": 42}
+    if dataclasses.is_dataclass(value_type):
+        return create_object(value_type)
+    if isinstance(value_type, type) and issubclass(value_type, enum.Enum):
+        return list(value_type)[-1]
+    if value_type is uuid.UUID:
+        return uuid.uuid4()
+
+    return {
+        str: "Lorem ipsum dolor sit amet",
+        int: 123456,
+        float: 1700000000.25,
+        bool: True,
+    }[value_type]
+
+
+def create_object(obj_type: type) -> typing.Any:
+    """
+    Creates a sample object of a data class type, filling all fields.
+    """
+    type_hints = typing.get_type_hints(obj_type)
+    kwargs: typing.Dict[str, typing.Any] = {}
+
+    for field in dataclasses.fields(obj_type):
+        if issubclass(obj_type, Message) and field.name == "name":
+            continue
+
+        if field.name == "target" and issubclass(obj_type, Message):
+            kwargs[field.name] = Channel.direct(UnitID("infra", "gate", "default"))
+        elif field.name == "hops":
+            kwargs[field.name] = [
+                UnitID("infra", "gate", "default"),
+                UnitID("infra", "server", "default"),
+            ]
+        else:
+            kwargs[field.name] = create_value(type_hints[field.name])
+
+    return obj_type(**kwargs)
+
+
+def measure(func: typing.Callable[[], typing.Any]) -> float:
+    """
+    Measures the average execution time of a function (in microseconds).
+    """
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        func()
+    return (time.perf_counter() - start) / ITERATIONS * 1_000_000
+
+
+if __name__ == "__main__":
+    header = f"{'Message':<45} {'JSON (B)':>9} {'MsgPack (B)':>11} {'Ratio':>6} {'JSON enc/dec (us)':>19} {'MsgPack enc/dec (us)':>21}"
+    print(header)
+    print("-" * len(header))
+
+    totals = [0, 0, 0.0, 0.0, 0.0, 0.0]
+    for name, msg_type in sorted(MessageTypesCatalog.items()):
+        codec = MessageCodec.for_type(msg_type)
+        msg = create_object(msg_type)
+
+        json_data = codec.encode(msg)
+        binary_data = codec.encode_binary(msg)
+        if codec.decode(json_data) != msg or codec.decode_binary(binary_data) != msg:
+            print(
+                f"{name}: Decoded message differs from the original one",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+
+        results = [
+            len(json_data.encode("utf-8")),
+            len(binary_data),
+            measure(lambda: codec.encode(msg)),
+            measure(lambda: codec.decode(json_data)),
+            measure(lambda: codec.encode_binary(msg)),
+            measure(lambda: codec.decode_binary(binary_data)),
+        ]
+        totals = [total + result for total, result in zip(totals, results)]
+
+        print(
+            f"{name:<45} {results[0]:>9} {results[1]:>11} {results[1] / results[0]:>6.2f} "
+            f"{results[2]:>9.1f}/{results[3]:<9.1f} {results[4]:>10.1f}/{results[5]:<10.1f}"
+        )
+
+    print("-" * len(header))
+    print(
+        f"{'Total':<45} {totals[0]:>9} {totals[1]:>11} {totals[1] / totals[0]:>6.2f} "
+        f"{totals[2]:>9.1f}/{totals[3]:<9.1f} {totals[4]:>10.1f}/{totals[5]:<10.1f}"
+    )
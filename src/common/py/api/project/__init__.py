@@ -8,7 +8,12 @@ from .project_commands import (
     DeleteProjectCommand,
     DeleteProjectReply,
 )
-from .project_events import ProjectsListEvent
+from .project_events import (
+    ProjectsListEvent,
+    ProjectAddedEvent,
+    ProjectUpdatedEvent,
+    ProjectRemovedEvent,
+)
 from .project_features_commands import (
     UpdateProjectFeaturesCommand,
     UpdateProjectFeaturesReply,
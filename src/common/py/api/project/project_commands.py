@@ -16,25 +16,42 @@ from ...data.entities.project import (
     ProjectID,
     ProjectOptions,
 )
+from ...data.storage import ProjectStorage
 
 
 @Message.define("command/project/list")
 class ListProjectsCommand(Command):
     """
-    Command to fetch all projects of the current user.
+    Command to fetch the projects of the current user, either all at once or page by page.
+
+    Args:
+        cursor: The cursor of the page to fetch (as returned by the previous page); empty for the first page.
+        limit: The maximum number of projects to fetch; if 0, all projects are fetched.
+        sort: The project field to sort the projects by.
 
     Notes:
         Requires a ``ListProjectsReply`` reply.
     """
 
+    cursor: str = ""
+    limit: int = 0
+    sort: ProjectStorage.SortKey = ProjectStorage.SortKey.PROJECT_ID
+
     @staticmethod
     def build(
-        message_builder: MessageBuilder, *, chain: Message | None = None
+        message_builder: MessageBuilder,
+        *,
+        cursor: str = "",
+        limit: int = 0,
+        sort: ProjectStorage.SortKey = ProjectStorage.SortKey.PROJECT_ID,
+        chain: Message | None = None,
     ) -> CommandComposer:
         """
         Helper function to easily build this message.
         """
-        return message_builder.build_command(ListProjectsCommand, chain)
+        return message_builder.build_command(
+            ListProjectsCommand, chain, cursor=cursor, limit=limit, sort=sort
+        )
 
 
 @Message.define("command/project/list/reply")
@@ -43,10 +60,17 @@ class ListProjectsReply(CommandReply):
     Reply to ``ListProjectsCommand``.
 
     Args:
-        projects: List of all projects.
+        projects: List of all projects (of the requested page).
+        version: The projects storage version the list reflects; subsequent project change events continue from this version.
+        cursor: The cursor of the returned page (empty for the first page).
+        next_cursor: The cursor of the next page; empty if there are no more projects.
     """
 
     projects: typing.List[Project] = dataclasses.field(default_factory=list)
+    version: int = 0
+
+    cursor: str = ""
+    next_cursor: str = ""
 
     @staticmethod
     def build(
@@ -54,6 +78,8 @@ class ListProjectsReply(CommandReply):
         cmd: ListProjectsCommand,
         *,
         projects: typing.List[Project],
+        version: int = 0,
+        next_cursor: str = "",
         success: bool = True,
         message: str = "",
     ) -> CommandReplyComposer:
@@ -61,7 +87,14 @@ class ListProjectsReply(CommandReply):
         Helper function to easily build this message.
         """
         return message_builder.build_command_reply(
-            ListProjectsReply, cmd, success, message, projects=projects
+            ListProjectsReply,
+            cmd,
+            success,
+            message,
+            projects=projects,
+            version=version,
+            cursor=cmd.cursor,
+            next_cursor=next_cursor,
         )
 
 
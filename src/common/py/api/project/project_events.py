@@ -9,28 +9,124 @@ from ...core.messaging.composers import (
     MessageBuilder,
     EventComposer,
 )
-from ...data.entities.project import Project
+from ...data.entities.project import Project, ProjectID
 
 
 @Message.define("event/project/list")
 class ProjectsListEvent(Event):
     """
-    Emitted whenever the user's projects list has been updated.
+    Emitted to send a full snapshot of the user's projects list.
 
     Args:
         projects: List of all projects.
+        version: The projects storage version the snapshot reflects.
     """
 
     projects: typing.List[Project] = dataclasses.field(default_factory=list)
+    version: int = 0
 
     @staticmethod
     def build(
         message_builder: MessageBuilder,
         *,
         projects: typing.List[Project],
+        version: int,
         chain: Message | None = None
     ) -> EventComposer:
         """
         Helper function to easily build this message.
         """
-        return message_builder.build_event(ProjectsListEvent, chain, projects=projects)
+        return message_builder.build_event(
+            ProjectsListEvent, chain, projects=projects, version=version
+        )
+
+
+@Message.define("event/project/added")
+class ProjectAddedEvent(Event):
+    """
+    Emitted whenever a project has been added.
+
+    Args:
+        project: The new project.
+        version: The projects storage version after the change.
+
+    Notes:
+        Project change events are only meaningful if applied in the order of their versions; if a version is skipped, the full
+        projects list needs to be fetched again.
+    """
+
+    project: Project
+    version: int
+
+    @staticmethod
+    def build(
+        message_builder: MessageBuilder,
+        *,
+        project: Project,
+        version: int,
+        chain: Message | None = None
+    ) -> EventComposer:
+        """
+        Helper function to easily build this message.
+        """
+        return message_builder.build_event(
+            ProjectAddedEvent, chain, project=project, version=version
+        )
+
+
+@Message.define("event/project/updated")
+class ProjectUpdatedEvent(Event):
+    """
+    Emitted whenever a project (including its features) has been updated.
+
+    Args:
+        project: The updated project.
+        version: The projects storage version after the change.
+    """
+
+    project: Project
+    version: int
+
+    @staticmethod
+    def build(
+        message_builder: MessageBuilder,
+        *,
+        project: Project,
+        version: int,
+        chain: Message | None = None
+    ) -> EventComposer:
+        """
+        Helper function to easily build this message.
+        """
+        return message_builder.build_event(
+            ProjectUpdatedEvent, chain, project=project, version=version
+        )
+
+
+@Message.define("event/project/removed")
+class ProjectRemovedEvent(Event):
+    """
+    Emitted whenever a project has been removed.
+
+    Args:
+        project_id: The ID of the removed project.
+        version: The projects storage version after the change.
+    """
+
+    project_id: ProjectID
+    version: int
+
+    @staticmethod
+    def build(
+        message_builder: MessageBuilder,
+        *,
+        project_id: ProjectID,
+        version: int,
+        chain: Message | None = None
+    ) -> EventComposer:
+        """
+        Helper function to easily build this message.
+        """
+        return message_builder.build_event(
+            ProjectRemovedEvent, chain, project_id=project_id, version=version
+        )
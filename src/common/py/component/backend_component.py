@@ -8,6 +8,7 @@ from ..utils.config import Configuration
 
 if typing.TYPE_CHECKING:
     from ..core import Core
+    from ..core.execution import BoundedExecutor
     from ..services import ServiceContextType, Service
 
 
@@ -103,14 +104,24 @@ class BackendComponent:
         name: str,
         *,
         context_type: type["ServiceContextType"] | None = None,
+        max_workers: int | None = None,
+        max_queue_size: int | None = None,
+        overflow_policy: "BoundedExecutor.OverflowPolicy | None" = None,
+        sharded: bool | None = None,
     ) -> "Service":
         """
         Creates and registers a new service.
 
+        Each service gets its own executor for asynchronous message handlers and callbacks; its defaults are taken from the configuration.
+
         Args:
             name: The name of the service.
             context_type: Can be used to override the default ``ServiceContext`` type. All message handlers
                 associated with the new service will then receive instances of this type for their service context.
+            max_workers: The number of worker threads of the service's executor.
+            max_queue_size: The maximum number of messages waiting for a worker (0 for no limit).
+            overflow_policy: What to do with new messages if the queue is full.
+            sharded: Whether to execute messages of the same trace in order (see ``ShardedExecutor``).
 
         Returns:
             The newly created service.
@@ -125,10 +136,57 @@ class BackendComponent:
             name,
             message_bus=self._core.message_bus,
             context_type=context_type,
+            executor=self._create_service_executor(
+                name,
+                max_workers=max_workers,
+                max_queue_size=max_queue_size,
+                overflow_policy=overflow_policy,
+                sharded=sharded,
+            ),
         )
         self._core.register_service(svc)
         return svc
 
+    def _create_service_executor(
+        self,
+        name: str,
+        *,
+        max_workers: int | None,
+        max_queue_size: int | None,
+        overflow_policy: "BoundedExecutor.OverflowPolicy | None",
+        sharded: bool | None,
+    ) -> "BoundedExecutor":
+        from ..core.execution import BoundedExecutor, ShardedExecutor
+        from ..settings import ServiceSettingIDs
+
+        config = self._data.config
+
+        if max_workers is None:
+            max_workers = config.value(ServiceSettingIDs.WORKERS)
+        if max_queue_size is None:
+            max_queue_size = config.value(ServiceSettingIDs.QUEUE_SIZE)
+        if overflow_policy is None:
+            overflow_policy = BoundedExecutor.OverflowPolicy(
+                config.value(ServiceSettingIDs.OVERFLOW_POLICY)
+            )
+        if sharded is None:
+            sharded = config.value(ServiceSettingIDs.SHARDED)
+
+        if sharded:
+            return ShardedExecutor(
+                f"Service[{name}]",
+                lanes=max_workers,
+                max_queue_size=max_queue_size,
+                overflow_policy=overflow_policy,
+            )
+
+        return BoundedExecutor(
+            f"Service[{name}]",
+            max_workers=max_workers,
+            max_queue_size=max_queue_size,
+            overflow_policy=overflow_policy,
+        )
+
     def _create_config(self, config_file: str) -> Configuration:
         from ..settings import get_default_settings
 
@@ -178,6 +236,19 @@ class BackendComponent:
             ),
         )
 
+        # Metrics are exposed in the Prometheus text exposition format
+        from ..core.metrics import MetricsRegistry, default_registry
+
+        self._core.flask.add_url_rule(
+            "/metrics",
+            endpoint="metrics",
+            view_func=lambda: (
+                default_registry().render(),
+                200,
+                {"Content-Type": MetricsRegistry.CONTENT_TYPE},
+            ),
+        )
+
     @staticmethod
     def instance() -> "BackendComponent":
         """
@@ -1,4 +1,5 @@
 import dataclasses
+import typing
 
 from semantic_version import Version
 
@@ -32,3 +33,13 @@ class BackendComponentData:
     title: str
     name: str
     version: Version
+
+    @property
+    def groups(self) -> typing.List[str]:
+        """
+        The named message groups the component belongs to.
+        """
+        from ..settings import ComponentSettingIDs
+
+        groups: str = self.config.value(ComponentSettingIDs.GROUPS)
+        return [group.strip() for group in groups.split(",") if group.strip() != ""]
@@ -0,0 +1,3 @@
+from .bounded_executor import BoundedExecutor
+from .coroutine_runner import CoroutineRunner
+from .sharded_executor import ShardedExecutor
@@ -0,0 +1,288 @@
+import sys
+import threading
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from enum import StrEnum
+
+
+class BoundedExecutor:
+    """
+    A thread pool with a bounded queue and an overflow policy.
+
+    Each service owns its own executor, so a single slow service cannot starve all others. The number of tasks that may be waiting for a
+    free worker is limited; if this limit is reached, the overflow policy decides what happens to new tasks.
+
+    The executor also keeps track of its queue depth and the time tasks had to wait before being executed.
+
+    With the *BLOCK* overflow policy, a task submitted by one of the executor's own workers while the queue is full is executed right away
+    in that worker instead; the worker would otherwise wait for a slot that might only become free once it has finished itself, which
+    could deadlock the executor. Tasks submitted from a *gevent* greenlet (like the handlers of the network server) are rejected instead
+    of waiting: Without monkey patching, blocking a greenlet blocks the *gevent* hub and thus all connections, not just the overloaded
+    executor.
+
+    Notes:
+        The executor is thread-safe.
+    """
+
+    class OverflowPolicy(StrEnum):
+        """
+        What to do with new tasks if the queue is full.
+        """
+
+        BLOCK = "block"
+        REJECT = "reject"
+        DROP = "drop"
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_workers: int,
+        max_queue_size: int,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+    ):
+        """
+        Args:
+            name: The name of the executor (used as the prefix of its thread names).
+            max_workers: The number of worker threads.
+            max_queue_size: The maximum number of tasks waiting for a worker; 0 for an unbounded queue.
+            overflow_policy: The policy to apply when the queue is full.
+
+        Raises:
+            ValueError: If the number of workers is not positive.
+        """
+        if max_workers <= 0:
+            raise ValueError("An executor requires at least one worker")
+
+        self._name = name
+
+        self._max_workers = max_workers
+        self._max_queue_size = max_queue_size
+        self._overflow_policy = overflow_policy
+
+        self._pools = self._create_pools()
+        self._slots = (
+            threading.BoundedSemaphore(max_workers + max_queue_size)
+            if max_queue_size > 0
+            else None
+        )
+
+        self._queue_depth = 0
+        self._active_count = 0
+        self._overflow_count = 0
+        self._completed_count = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+        self._inline_count = 0
+
+        self._worker = threading.local()
+
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        func: typing.Callable[..., None],
+        /,
+        *args,
+        shard_key: typing.Hashable | None = None,
+        **kwargs,
+    ) -> bool:
+        """
+        Submits a new task.
+
+        Args:
+            func: The function to execute.
+            *args: The positional arguments passed to the function.
+            shard_key: A key identifying tasks that need to be executed in order; only used by executors that support ordering (see ``ShardedExecutor``).
+            **kwargs: The keyword arguments passed to the function.
+
+        Returns:
+            Whether the task was accepted; if the queue is full and the overflow policy is not *BLOCK* (or the task is submitted from a
+            greenlet), the task is discarded.
+        """
+        if self._slots is not None and not self._slots.acquire(blocking=False):
+            if self._overflow_policy != BoundedExecutor.OverflowPolicy.BLOCK:
+                with self._lock:
+                    self._overflow_count += 1
+                return False
+
+            if getattr(self._worker, "active", False):
+                self._execute_inline(func, *args, **kwargs)
+                return True
+
+            if BoundedExecutor._is_greenlet():
+                with self._lock:
+                    self._overflow_count += 1
+                return False
+
+            self._slots.acquire()
+
+        with self._lock:
+            self._queue_depth += 1
+
+        try:
+            self._select_pool(shard_key).submit(
+                self._execute, time.monotonic(), func, *args, **kwargs
+            )
+        except RuntimeError:  # The pool has already been shut down
+            self._finish_task()
+            with self._lock:
+                self._queue_depth -= 1
+            return False
+
+        return True
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts the executor down; pending tasks are cancelled.
+
+        Args:
+            wait: Whether to wait for all running tasks to finish.
+        """
+        for pool in self._pools:
+            pool.shutdown(wait, cancel_futures=True)
+
+    def _create_pools(self) -> typing.List[ThreadPoolExecutor]:
+        return [ThreadPoolExecutor(self._max_workers, thread_name_prefix=self._name)]
+
+    def _select_pool(
+        self, shard_key: typing.Hashable | None  # pylint: disable=unused-argument
+    ) -> ThreadPoolExecutor:
+        return self._pools[0]
+
+    def _execute(
+        self, enqueued: float, func: typing.Callable[..., None], *args, **kwargs
+    ) -> None:
+        self._worker.active = True
+        wait_time = time.monotonic() - enqueued
+
+        with self._lock:
+            self._queue_depth -= 1
+            self._active_count += 1
+            self._total_wait_time += wait_time
+            self._max_wait_time = max(self._max_wait_time, wait_time)
+
+        try:
+            func(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._active_count -= 1
+                self._completed_count += 1
+
+            self._finish_task()
+
+    @staticmethod
+    def _is_greenlet() -> bool:
+        # gevent is only used by the network server, so it is only checked if it has been imported already
+        if (gevent := sys.modules.get("gevent")) is None:
+            return False
+
+        from gevent.hub import Hub
+
+        return isinstance(gevent.getcurrent(), (gevent.Greenlet, Hub))
+
+    def _execute_inline(
+        self, func: typing.Callable[..., None], *args, **kwargs
+    ) -> None:
+        with self._lock:
+            self._active_count += 1
+            self._inline_count += 1
+
+        try:
+            func(*args, **kwargs)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            from ..logging import error
+
+            error(
+                f"A task executed inline raised an exception: {str(exc)}",
+                scope="executor",
+                executor=self._name,
+            )
+        finally:
+            with self._lock:
+                self._active_count -= 1
+                self._completed_count += 1
+
+    def _finish_task(self) -> None:
+        if self._slots is not None:
+            self._slots.release()
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the executor.
+        """
+        return self._name
+
+    @property
+    def max_workers(self) -> int:
+        """
+        The number of worker threads.
+        """
+        return self._max_workers
+
+    @property
+    def max_queue_size(self) -> int:
+        """
+        The maximum number of waiting tasks (0 if unbounded).
+        """
+        return self._max_queue_size
+
+    @property
+    def overflow_policy(self) -> OverflowPolicy:
+        """
+        The policy applied when the queue is full.
+        """
+        return self._overflow_policy
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        The number of tasks currently waiting for a worker.
+        """
+        return self._queue_depth
+
+    @property
+    def active_count(self) -> int:
+        """
+        The number of tasks currently being executed.
+        """
+        return self._active_count
+
+    @property
+    def overflow_count(self) -> int:
+        """
+        The total number of tasks that were rejected or dropped due to a full queue.
+        """
+        return self._overflow_count
+
+    @property
+    def inline_count(self) -> int:
+        """
+        The total number of tasks that were executed inline by a worker, as the queue was full (see the class documentation).
+        """
+        return self._inline_count
+
+    @property
+    def completed_count(self) -> int:
+        """
+        The total number of executed tasks.
+        """
+        return self._completed_count
+
+    @property
+    def average_wait_time(self) -> float:
+        """
+        The average time (in seconds) tasks had to wait before being executed.
+        """
+        with self._lock:
+            started = self._completed_count + self._active_count
+            return self._total_wait_time / started if started > 0 else 0.0
+
+    @property
+    def max_wait_time(self) -> float:
+        """
+        The longest time (in seconds) a task had to wait before being executed.
+        """
+        return self._max_wait_time
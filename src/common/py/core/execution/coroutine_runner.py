@@ -0,0 +1,97 @@
+import asyncio
+import threading
+import typing
+
+
+class CoroutineRunner:
+    """
+    Runs coroutines on a single event loop in its own long-lived thread.
+
+    This allows I/O-bound work written as ``async def`` functions to run concurrently without occupying a thread per task. The loop
+    thread is started lazily when the first coroutine is submitted.
+
+    Notes:
+        The runner is thread-safe.
+    """
+
+    def __init__(self, name: str = "CoroutineRunner"):
+        """
+        Args:
+            name: The name of the event loop thread.
+        """
+        self._name = name
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+        self._pending_count = 0
+
+        self._lock = threading.Lock()
+
+    def submit(self, coro: typing.Coroutine[typing.Any, typing.Any, None]) -> bool:
+        """
+        Schedules a coroutine to be run on the event loop.
+
+        Args:
+            coro: The coroutine to run.
+
+        Returns:
+            Whether the coroutine was scheduled; this fails if the runner has been shut down.
+        """
+        with self._lock:
+            if self._loop is None:
+                self._start()
+            elif self._loop.is_closed():
+                coro.close()
+                return False
+
+            self._pending_count += 1
+
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        future.add_done_callback(self._coroutine_done)
+        return True
+
+    def shutdown(self) -> None:
+        """
+        Stops the event loop; pending coroutines are cancelled.
+        """
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                return
+
+            loop = self._loop
+            loop.call_soon_threadsafe(loop.stop)
+
+        if self._thread is not None:
+            self._thread.join()
+
+    def _start(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+
+        try:
+            self._loop.run_forever()
+        finally:
+            tasks = asyncio.all_tasks(self._loop)
+            for task in tasks:
+                task.cancel()
+
+            self._loop.run_until_complete(
+                asyncio.gather(*tasks, return_exceptions=True)
+            )
+            self._loop.close()
+
+    def _coroutine_done(self, _) -> None:
+        with self._lock:
+            self._pending_count -= 1
+
+    @property
+    def pending_count(self) -> int:
+        """
+        The number of coroutines that have not finished yet.
+        """
+        return self._pending_count
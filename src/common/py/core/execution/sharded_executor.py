@@ -0,0 +1,65 @@
+import itertools
+import typing
+from concurrent.futures import ThreadPoolExecutor
+
+from .bounded_executor import BoundedExecutor
+
+
+class ShardedExecutor(BoundedExecutor):
+    """
+    A bounded executor that preserves the order of related tasks.
+
+    Instead of a single pool of workers, the executor consists of several *lanes*, each being served by exactly one worker thread. Tasks
+    are assigned to a lane by hashing their shard key (e.g., the trace of a message), so all tasks sharing the same key are executed one
+    after another in the order they were submitted, while tasks with different keys run in parallel on the other lanes. Tasks without a
+    shard key are distributed across the lanes in a round-robin fashion.
+
+    Queue limits, the overflow policy and all metrics apply to the executor as a whole.
+
+    Notes:
+        The executor is thread-safe.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        lanes: int,
+        max_queue_size: int,
+        overflow_policy: BoundedExecutor.OverflowPolicy = BoundedExecutor.OverflowPolicy.BLOCK,
+    ):
+        """
+        Args:
+            name: The name of the executor (used as the prefix of its thread names).
+            lanes: The number of lanes (and thus worker threads).
+            max_queue_size: The maximum number of tasks waiting for a worker; 0 for an unbounded queue.
+            overflow_policy: The policy to apply when the queue is full.
+
+        Raises:
+            ValueError: If the number of lanes is not positive.
+        """
+        self._round_robin = itertools.count()
+
+        super().__init__(
+            name,
+            max_workers=lanes,
+            max_queue_size=max_queue_size,
+            overflow_policy=overflow_policy,
+        )
+
+    def _create_pools(self) -> typing.List[ThreadPoolExecutor]:
+        return [
+            ThreadPoolExecutor(1, thread_name_prefix=f"{self._name}-{lane}")
+            for lane in range(self._max_workers)
+        ]
+
+    def _select_pool(self, shard_key: typing.Hashable | None) -> ThreadPoolExecutor:
+        lane = hash(shard_key) if shard_key is not None else next(self._round_robin)
+        return self._pools[lane % len(self._pools)]
+
+    @property
+    def lanes(self) -> int:
+        """
+        The number of lanes.
+        """
+        return len(self._pools)
@@ -1,5 +1,6 @@
 from .channel import Channel
 from .message import MessageName, Trace, Message, MessageType
+from .message_codec import MessageCodec
 from .command import Command, CommandType
 from .command_reply import CommandReply, CommandReplyType, CommandDoneCallback, CommandFailCallback
 from .event import Event, EventType
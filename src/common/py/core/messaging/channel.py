@@ -1,3 +1,4 @@
+import typing
 from dataclasses import dataclass
 from enum import StrEnum
 
@@ -13,11 +14,15 @@ class Channel:
     The target of a message.
 
     Message targets are represented by so-called *channels*. These can be *local* for messages that will only
-    be dispatched locally and not across the network or *direct* for specific (remote) targets.
+    be dispatched locally and not across the network, *direct* for specific (remote) targets, *group* for all
+    components belonging to a group, or *broadcast* for all components.
+
+    Each component implicitly belongs to the group of its component type (see ``component_type``); it can join
+    further named groups through its configuration (see ``ComponentSettingIDs.GROUPS``).
 
     Attributes:
         type: The channel type.
-        target: The actual target in case of a direct channel.
+        target: The actual target in case of a direct channel, or the group name in case of a group channel.
     """
 
     class Type(StrEnum):
@@ -27,6 +32,10 @@ class Channel:
 
         LOCAL = "local"
         DIRECT = "direct"
+        GROUP = "group"
+        BROADCAST = "broadcast"
+
+    TYPE_GROUP_PREFIX: typing.ClassVar[str] = "type:"
 
     type: Type
     target: str | None = None
@@ -58,6 +67,41 @@ class Channel:
         """
         return self.type == Channel.Type.DIRECT
 
+    @property
+    def is_group(self) -> bool:
+        """
+        Whether this is a group channel.
+        """
+        return self.type == Channel.Type.GROUP
+
+    @property
+    def is_broadcast(self) -> bool:
+        """
+        Whether this is a broadcast channel.
+        """
+        return self.type == Channel.Type.BROADCAST
+
+    def addresses(self, comp_id: UnitID, groups: typing.Collection[str] = ()) -> bool:
+        """
+        Checks whether a component is targeted by this channel.
+
+        Args:
+            comp_id: The component ID.
+            groups: The named groups the component belongs to.
+
+        Returns:
+            Whether the component is targeted; local channels never target a specific component.
+        """
+        if self.is_direct:
+            target_id = self.target_id
+            return target_id is not None and target_id.equals(comp_id)
+        if self.is_group:
+            return self.target in groups or self.target == Channel.type_group(
+                comp_id.type
+            )
+
+        return self.is_broadcast
+
     def __str__(self) -> str:
         return (
             f"@{self.type}:{self.target}"
@@ -78,3 +122,31 @@ class Channel:
         Creates a new direct channel.
         """
         return Channel(Channel.Type.DIRECT, str(target))
+
+    @staticmethod
+    def group(name: str) -> "Channel":
+        """
+        Creates a new group channel targeting all components of a named group.
+        """
+        return Channel(Channel.Type.GROUP, name)
+
+    @staticmethod
+    def component_type(comp_type: str) -> "Channel":
+        """
+        Creates a new group channel targeting all components of the given type.
+        """
+        return Channel.group(Channel.type_group(comp_type))
+
+    @staticmethod
+    def broadcast() -> "Channel":
+        """
+        Creates a new broadcast channel targeting all components.
+        """
+        return Channel(Channel.Type.BROADCAST)
+
+    @staticmethod
+    def type_group(comp_type: str) -> str:
+        """
+        Gets the name of the group all components of the given type belong to.
+        """
+        return f"{Channel.TYPE_GROUP_PREFIX}{comp_type}"
@@ -9,6 +9,7 @@ from .. import (
     CommandFailCallback,
 )
 from ..meta import MessageMetaInformation
+from ...execution import BoundedExecutor
 from ....utils import UnitID
 
 
@@ -23,6 +24,8 @@ class CommandComposer(MessageComposer):
         message_bus: MessageBusProtocol,
         msg_type: type[MessageType],
         chain: Message | None = None,
+        *,
+        callbacks_executor: BoundedExecutor | None = None,
         **kwargs,
     ):
         """
@@ -31,10 +34,13 @@ class CommandComposer(MessageComposer):
             message_bus: The global message bus to use.
             msg_type: The message type.
             chain: A message that acts as the *predecessor* of the new message. Used to keep the same trace for multiple messages.
+            callbacks_executor: The executor to run asynchronous callbacks in.
             **kwargs: Additional message parameters.
         """
         super().__init__(origin_id, message_bus, msg_type, chain, **kwargs)
 
+        self._callbacks_executor = callbacks_executor
+
         self._done_callbacks: typing.List[CommandDoneCallback] = []
         self._fail_callbacks: typing.List[CommandFailCallback] = []
         self._async_callbacks = False
@@ -109,5 +115,6 @@ class CommandComposer(MessageComposer):
             done_callbacks=self._done_callbacks,
             fail_callbacks=self._fail_callbacks,
             async_callbacks=self._async_callbacks,
+            callbacks_executor=self._callbacks_executor,
             timeout=self._timeout,
         )
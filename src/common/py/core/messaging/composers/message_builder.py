@@ -14,6 +14,7 @@ from .. import (
     Event,
     EventType,
 )
+from ...execution import BoundedExecutor
 from ....utils import UnitID
 
 
@@ -24,14 +25,22 @@ class MessageBuilder:
     This class stores a reference to the global message bus and offers methods to easily create new messages and send them through the bus.
     """
 
-    def __init__(self, origin_id: UnitID, message_bus: MessageBusProtocol):
+    def __init__(
+        self,
+        origin_id: UnitID,
+        message_bus: MessageBusProtocol,
+        *,
+        executor: BoundedExecutor | None = None,
+    ):
         """
         Args:
             origin_id: The component identifier of the origin of newly created messages.
             message_bus: The global message bus to use.
+            executor: The executor to run asynchronous command reply callbacks in.
         """
         self._origin_id = origin_id
         self._message_bus = message_bus
+        self._executor = executor
 
         self._counters: typing.Dict[MessageType, int] = {
             CommandType: 0,
@@ -62,7 +71,12 @@ class MessageBuilder:
         self._counters[CommandType] += 1
 
         return CommandComposer(
-            self._origin_id, self._message_bus, cmd_type, chain, **kwargs
+            self._origin_id,
+            self._message_bus,
+            cmd_type,
+            chain,
+            callbacks_executor=self._executor,
+            **kwargs,
         )
 
     def build_command_reply(
@@ -1,10 +1,12 @@
+import dataclasses
 import typing
 
 from .message_dispatcher import MessageDispatcher
 from .. import Trace, CommandReply
 from ..command import Command
 from ..handlers import MessageContextType
-from ..meta import CommandMetaInformation
+from ..meta import CommandMetaInformation, MessageMetaInformation
+from ...execution import BoundedExecutor
 
 
 class CommandDispatcher(MessageDispatcher[Command]):
@@ -43,8 +45,91 @@ class CommandDispatcher(MessageDispatcher[Command]):
         debug(f"Dispatching command: {msg}", scope="bus")
         super().pre_dispatch(msg, msg_meta)
 
-        MessageDispatcher._meta_information_list.add(
+        # The trace is kept so that all callbacks of the command run on the same shard as its reply
+        msg_meta = dataclasses.replace(msg_meta, trace=msg.trace)
+
+        # If too many commands are pending, the oldest ones are evicted and treated as failed
+        for unique, meta_information in MessageDispatcher._meta_information_list.add(
             msg.unique, msg_meta, msg_meta.timeout
+        ):
+            from ...logging import warning
+
+            warning(
+                "Too many pending commands, evicting the oldest one",
+                scope="bus",
+                unique=str(unique),
+            )
+
+            CommandDispatcher._invoke_meta_information_callbacks(
+                meta_information,
+                fail_type=CommandReply.FailType.UNKNOWN,
+                fail_msg="The command was evicted from the list of pending commands",
+            )
+
+    def _executor_overflow(
+        self,
+        msg: Command,
+        msg_meta: CommandMetaInformation,
+        ctx: MessageContextType,
+        executor: BoundedExecutor,
+    ) -> None:
+        # Blocking executors also reject commands if they can't wait for a free slot
+        if executor.overflow_policy == BoundedExecutor.OverflowPolicy.DROP:
+            super()._executor_overflow(msg, msg_meta, ctx, executor)
+            return
+
+        from ...logging import warning
+
+        warning(
+            "The executor is full, rejecting command",
+            scope="bus",
+            executor=executor.name,
+            message=str(msg),
+        )
+
+        # By convention, the reply to a command is named like the command with a trailing '/reply'
+        from .. import MessageTypesCatalog
+
+        fail_msg = "The command was rejected due to overload"
+        reply_type = MessageTypesCatalog.find_item(f"{msg.name}/reply")
+
+        # Replies requiring additional data can't be built here, so the fail callbacks are invoked directly instead
+        if (
+            reply_type is not None
+            and issubclass(reply_type, CommandReply)
+            and not CommandDispatcher._has_required_fields(reply_type)
+        ):
+            try:
+                ctx.message_builder.build_command_reply(
+                    reply_type, msg, success=False, message=fail_msg
+                ).emit()
+                return
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                from ...logging import error
+
+                error(
+                    f"Unable to emit the overload reply: {str(exc)}",
+                    scope="bus",
+                    message=str(msg),
+                )
+
+        CommandDispatcher.invoke_reply_callbacks(
+            msg.unique, fail_type=CommandReply.FailType.EXCEPTION, fail_msg=fail_msg
+        )
+        MessageDispatcher._meta_information_list.remove(msg.unique)
+
+    @staticmethod
+    def _has_required_fields(reply_type: type[CommandReply]) -> bool:
+        # The fields of the message envelope are always filled in by the composer
+        from .. import Message
+
+        envelope_fields = {field.name for field in dataclasses.fields(Message)}
+        return any(
+            field.init
+            and field.default is dataclasses.MISSING
+            and field.default_factory is dataclasses.MISSING
+            and field.name not in envelope_fields
+            for field in dataclasses.fields(reply_type)
         )
 
     def _context_exception(
@@ -79,7 +164,21 @@ class CommandDispatcher(MessageDispatcher[Command]):
             fail_type: The type of the command failure (in case of a timeout or exception).
             fail_msg: The failure message.
         """
+        CommandDispatcher._invoke_meta_information_callbacks(
+            MessageDispatcher._meta_information_list.find(unique),
+            reply=reply,
+            fail_type=fail_type,
+            fail_msg=fail_msg,
+        )
 
+    @staticmethod
+    def _invoke_meta_information_callbacks(
+        meta_information: MessageMetaInformation | None,
+        *,
+        reply: CommandReply | None = None,
+        fail_type: CommandReply.FailType = CommandReply.FailType.NONE,
+        fail_msg: str = "",
+    ) -> None:
         # Callback wrapper for proper exception handling, even when used asynchronously
         def _invoke_reply_callbacks(callbacks, *args) -> None:
             for callback in callbacks:
@@ -96,25 +195,29 @@ class CommandDispatcher(MessageDispatcher[Command]):
                     )
                     debug(f"Traceback:\n{''.join(traceback.format_exc())}", scope="bus")
 
-        meta_information = MessageDispatcher._meta_information_list.find(unique)
         if meta_information is not None and isinstance(
             meta_information, CommandMetaInformation
         ):
             command_meta = typing.cast(CommandMetaInformation, meta_information)
 
-            def _invoke(callbacks, is_async, *args):
+            def _invoke(callbacks, is_async, shard_key, *args):
                 if len(callbacks) > 0:
-                    if is_async:
-                        MessageDispatcher._thread_pool.submit(
-                            _invoke_reply_callbacks, callbacks, *args
-                        )
-                    else:
+                    executor = (
+                        command_meta.callbacks_executor
+                        or MessageDispatcher._thread_pool
+                    )
+
+                    # Reply callbacks must never get lost, so they are invoked directly if the executor is full
+                    if not is_async or not executor.submit(
+                        _invoke_reply_callbacks, callbacks, *args, shard_key=shard_key
+                    ):
                         _invoke_reply_callbacks(callbacks, *args)
 
             if reply is not None:
                 _invoke(
                     command_meta.done_callbacks,
                     command_meta.async_callbacks,
+                    command_meta.trace,
                     reply,
                     reply.success,
                     reply.message,
@@ -123,6 +226,7 @@ class CommandDispatcher(MessageDispatcher[Command]):
                 _invoke(
                     command_meta.fail_callbacks,
                     command_meta.async_callbacks,
+                    command_meta.trace,
                     fail_type,
                     fail_msg,
                 )
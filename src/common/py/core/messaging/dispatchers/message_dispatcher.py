@@ -1,11 +1,14 @@
 import abc
 import atexit
+import os
+import time
 import typing
-from concurrent.futures import ThreadPoolExecutor
 
 from ..handlers import MessageHandlerMapping, MessageContextType
 from ..message import MessageType
 from ..meta import MessageMetaInformationType, MessageMetaInformationList
+from ...execution import BoundedExecutor, CoroutineRunner
+from ...metrics import default_registry
 
 
 class MessageDispatcher(abc.ABC, typing.Generic[MessageType]):
@@ -14,10 +17,27 @@ class MessageDispatcher(abc.ABC, typing.Generic[MessageType]):
 
     Dispatching a message (locally) is done by passing the message to one or more registered message handlers within a ``Service``.
     The message dispatcher also performs pre- and post-dispatching tasks and takes care of catching errors raised in a handler.
+
+    Asynchronous handlers are executed by the executor of their service; if none is given, a global (unbounded) executor is used. The
+    trace of the message is passed as the shard key, so a ``ShardedExecutor`` executes messages of the same trace in order.
+    Handlers that are coroutine functions (``async def``) are run on a global event loop instead, so that many I/O-bound handlers
+    can run concurrently without occupying a thread each.
+
+    The execution time of every handler is recorded in a histogram (by message name) of the global metrics registry.
     """
 
-    _thread_pool = ThreadPoolExecutor()
+    _thread_pool = BoundedExecutor(
+        "MessageDispatcher",
+        max_workers=min(32, (os.cpu_count() or 1) + 4),
+        max_queue_size=0,
+    )
+    _coroutine_runner = CoroutineRunner("MessageDispatcherLoop")
     _meta_information_list = MessageMetaInformationList()
+    _handler_durations = default_registry().histogram(
+        "rds_handler_duration_seconds",
+        "Execution time of message handlers.",
+        ("message",),
+    )
 
     def __init__(self, meta_information_type: type[MessageMetaInformationType]):
         """
@@ -57,11 +77,13 @@ class MessageDispatcher(abc.ABC, typing.Generic[MessageType]):
         msg_meta: MessageMetaInformationType,
         handler: MessageHandlerMapping,
         ctx: MessageContextType,
+        executor: BoundedExecutor | None = None,
     ) -> None:
         """
         Dispatches a message to locally registered message handlers.
 
-        Handlers can be either called synchronously or asynchronously, depending on how the handler was registered.
+        Handlers can be either called synchronously or asynchronously, depending on how the handler was registered. If the
+        executor of an asynchronous handler is full, its overflow policy is applied to the message.
 
         Notes:
             Exceptions arising within a message handler will not interrupt the running program; instead, such errors will only be logged.
@@ -71,6 +93,7 @@ class MessageDispatcher(abc.ABC, typing.Generic[MessageType]):
             msg_meta: The message meta information.
             handler: The handler to be invoked.
             ctx: The message context.
+            executor: The executor to run asynchronous handlers in.
 
         Raises:
             RuntimeError: If the handler requires a different message type.
@@ -83,6 +106,7 @@ class MessageDispatcher(abc.ABC, typing.Generic[MessageType]):
             handler: MessageHandlerMapping,
             ctx: MessageContextType,
         ) -> None:
+            start = time.perf_counter()
             try:
                 with ctx(requires_reply=msg_meta.requires_reply):
                     # The service context will not suppress exceptions so that the dispatcher can react to them
@@ -90,12 +114,43 @@ class MessageDispatcher(abc.ABC, typing.Generic[MessageType]):
                     handler.handler(act_msg, ctx)
             except Exception as exc:  # pylint: disable=broad-exception-caught
                 self._context_exception(exc, msg, msg_meta, ctx)
+            finally:
+                MessageDispatcher._handler_durations.observe(
+                    time.perf_counter() - start, msg.name
+                )
 
-        if isinstance(msg, handler.message_type):
-            if handler.is_async:
-                MessageDispatcher._thread_pool.submit(
-                    _dispatch, msg, msg_meta, handler, ctx
+        async def _dispatch_coroutine(
+            msg: MessageType,
+            msg_meta: MessageMetaInformationType,
+            handler: MessageHandlerMapping,
+            ctx: MessageContextType,
+        ) -> None:
+            start = time.perf_counter()
+            try:
+                with ctx(requires_reply=msg_meta.requires_reply):
+                    act_msg = typing.cast(handler.message_type, msg)
+                    await handler.handler(act_msg, ctx)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                self._context_exception(exc, msg, msg_meta, ctx)
+            finally:
+                MessageDispatcher._handler_durations.observe(
+                    time.perf_counter() - start, msg.name
                 )
+
+        if isinstance(msg, handler.message_type):
+            if handler.is_coroutine:
+                if not MessageDispatcher._coroutine_runner.submit(
+                    _dispatch_coroutine(msg, msg_meta, handler, ctx)
+                ):
+                    raise RuntimeError(
+                        "The coroutine runner has already been shut down"
+                    )
+            elif handler.is_async:
+                executor = executor or MessageDispatcher._thread_pool
+                if not executor.submit(
+                    _dispatch, msg, msg_meta, handler, ctx, shard_key=msg.trace
+                ):
+                    self._executor_overflow(msg, msg_meta, ctx, executor)
             else:
                 _dispatch(msg, msg_meta, handler, ctx)
         else:
@@ -125,7 +180,38 @@ class MessageDispatcher(abc.ABC, typing.Generic[MessageType]):
     ) -> None:
         pass
 
+    def _executor_overflow(
+        self,
+        msg: MessageType,
+        msg_meta: MessageMetaInformationType,
+        ctx: MessageContextType,
+        executor: BoundedExecutor,
+    ) -> None:
+        from ...logging import warning
+
+        warning(
+            "The executor is full, dropping message",
+            scope="bus",
+            executor=executor.name,
+            message=str(msg),
+        )
+
+    @staticmethod
+    def default_executor() -> BoundedExecutor:
+        """
+        The global executor used for services that do not have their own one.
+        """
+        return MessageDispatcher._thread_pool
+
+    @staticmethod
+    def meta_information_list() -> MessageMetaInformationList:
+        """
+        The global list of meta information of pending messages.
+        """
+        return MessageDispatcher._meta_information_list
+
     @staticmethod
     @atexit.register
     def _terminate() -> None:
-        MessageDispatcher._thread_pool.shutdown(True, cancel_futures=True)
+        MessageDispatcher._coroutine_runner.shutdown()
+        MessageDispatcher._thread_pool.shutdown(True)
@@ -3,6 +3,11 @@ from .message_handler import (
     MessageHandlerMapping,
     MessageHandlerMappings,
 )
-from .message_handlers import MessageHandlers
-from .message_context import MessageContext, MessageContextType
+from .message_handlers import MessageHandlers, MessageHandlersChangedCallback
+from .message_context import (
+    MessageContext,
+    MessageContextType,
+    MessageBuilderFactory,
+    LoggerFactory,
+)
 from .message_service import MessageService
@@ -5,6 +5,9 @@ from ..composers import MessageBuilder
 from ..meta import MessageMetaInformation
 from ...logging import LoggerProtocol
 
+MessageBuilderFactory = typing.Callable[[], MessageBuilder]
+LoggerFactory = typing.Callable[[], LoggerProtocol]
+
 
 class MessageContext:
     """
@@ -19,27 +22,43 @@ class MessageContext:
 
     It is also possible to have message handlers receive custom subtypes of this class. See ``Component`` and its ``create_service`` method for
     details.
+
+    Since many handlers neither log nor emit messages, the message builder and logger can also be passed as factories; these are then only
+    invoked when the builder or logger is accessed for the first time.
     """
 
     def __init__(
         self,
         msg_meta: MessageMetaInformation,
-        msg_builder: MessageBuilder,
+        msg_builder: MessageBuilder | MessageBuilderFactory,
         *,
-        logger: LoggerProtocol,
+        logger: LoggerProtocol | LoggerFactory,
         config: Configuration,
     ):
         """
         Args:
-            msg_builder: A ``MessageBuilder`` to be assigned to this context.
             msg_meta: The meta information of the message.
-            logger: A logger that is configured to automatically print the trace belonging to the message that caused the handler to be executed.
+            msg_builder: A ``MessageBuilder`` to be assigned to this context (or a factory creating it on first access).
+            logger: A logger that is configured to automatically print the trace belonging to the message that caused the handler to be executed
+                (or a factory creating it on first access).
             config: The global component configuration.
         """
         self._msg_meta = msg_meta
-        self._msg_builder = msg_builder
 
-        self._logger = logger
+        self._msg_builder: MessageBuilder | None = None
+        self._msg_builder_factory: MessageBuilderFactory | None = None
+        if isinstance(msg_builder, MessageBuilder):
+            self._msg_builder = msg_builder
+        else:
+            self._msg_builder_factory = msg_builder
+
+        self._logger: LoggerProtocol | None = None
+        self._logger_factory: LoggerFactory | None = None
+        if callable(logger):
+            self._logger_factory = typing.cast(LoggerFactory, logger)
+        else:
+            self._logger = logger
+
         self._config = config
 
         self._requires_reply = False
@@ -51,12 +70,12 @@ class MessageContext:
         if exc_type is not None:
             import traceback
 
-            self._logger.error(
+            self.logger.error(
                 f"An exception occurred within a message context: {exc_val}",
                 scope="bus",
                 exception=str(exc_type),
             )
-            self._logger.debug(
+            self.logger.debug(
                 f"Traceback:\n{''.join(traceback.format_tb(exc_tb))}", scope="bus"
             )
             return False
@@ -71,11 +90,17 @@ class MessageContext:
     def _check_command_reply(self) -> None:
         from ...messaging import CommandReplyType
 
-        if (
-            self._requires_reply
-            and self._msg_builder.get_message_count(CommandReplyType) != 1
-        ):
-            self._logger.warning(
+        if not self._requires_reply:
+            return
+
+        # If no message builder was ever created, no reply can have been sent either
+        reply_count = (
+            self._msg_builder.get_message_count(CommandReplyType)
+            if self._msg_builder is not None
+            else 0
+        )
+        if reply_count != 1:
+            self.logger.warning(
                 "A message context required exactly one command reply, but either none or more than one was sent",
                 scope="bus",
             )
@@ -106,6 +131,8 @@ class MessageContext:
         """
         The message builder to be used within this context.
         """
+        if self._msg_builder is None:
+            self._msg_builder = self._msg_builder_factory()
         return self._msg_builder
 
     @property
@@ -113,6 +140,8 @@ class MessageContext:
         """
         The logger to be used within this context.
         """
+        if self._logger is None:
+            self._logger = self._logger_factory()
         return self._logger
 
     @property
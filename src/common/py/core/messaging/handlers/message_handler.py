@@ -4,7 +4,9 @@ from dataclasses import dataclass
 from ..message import MessageType
 from .message_context import MessageContextType
 
-MessageHandler = typing.Callable[[MessageType, MessageContextType], None]
+MessageHandler = typing.Callable[
+    [MessageType, MessageContextType], None | typing.Awaitable[None]
+]
 
 
 @dataclass(frozen=True)
@@ -17,11 +19,13 @@ class MessageHandlerMapping:
         handler: The message handler.
         message_type: The message type the handler expects.
         is_async: Whether the handler should be invoked asynchronously in its own thread.
+        is_coroutine: Whether the handler is a coroutine function (``async def``) that is run on an event loop.
     """
     filter: str
     handler: MessageHandler
     message_type: type[MessageType]
     is_async: bool = False
+    is_coroutine: bool = False
     
     def __str__(self) -> str:
         return f"{self.filter} -> {str(self.handler)} [{str(self.message_type)}]"
@@ -1,17 +1,28 @@
+import inspect
 import threading
-from pathlib import PurePosixPath
+import typing
 
 from ..message import MessageName, Message, MessageType
 from .message_handler import MessageHandler, MessageHandlerMapping, MessageHandlerMappings
+from .message_handlers_index import MessageHandlersIndex
+
+MessageHandlersChangedCallback = typing.Callable[[], None]
 
 
 class MessageHandlers:
     """
     Holds mappings for message handlers.
+
+    All mappings are compiled into a ``MessageHandlersIndex`` when being added; the results of lookups are furthermore cached per message name,
+    so that finding the handlers of an already seen message name is a single hash table lookup.
     """
     def __init__(self):
         self._handlers: MessageHandlerMappings = []
-        
+        self._index = MessageHandlersIndex()
+        self._lookup_cache: typing.Dict[MessageName, MessageHandlerMappings] = {}
+
+        self._changed_callbacks: typing.List[MessageHandlersChangedCallback] = []
+
         self._lock = threading.Lock()
         
     def add_handler(self, fltr: str, handler: MessageHandler, message_type: type[MessageType] = Message, is_async: bool = False) -> None:
@@ -22,11 +33,51 @@ class MessageHandlers:
             fltr: The message name filter.
             handler: The message handler.
             message_type: The message type the handler expects.
-            is_async: Whether the handler should be invoked asynchronously in its own thread.
+            is_async: Whether the handler should be invoked asynchronously in its own thread (ignored for coroutine functions).
+
+        Raises:
+            ValueError: If the message name filter is empty.
+        """
+        with self._lock:
+            mapping = MessageHandlerMapping(
+                fltr,
+                handler,
+                message_type,
+                is_async,
+                is_coroutine=inspect.iscoroutinefunction(handler),
+            )
+            self._index.add(mapping)
+            self._handlers.append(mapping)
+
+            # Replace the cache instead of clearing it so that concurrent lookups never see a partially updated one
+            self._lookup_cache = {}
+            callbacks = self._changed_callbacks[:]
+
+        for callback in callbacks:
+            callback()
+
+    def add_changed_callback(self, callback: MessageHandlersChangedCallback) -> None:
+        """
+        Adds a callback that is invoked whenever a new handler mapping has been added.
+
+        Args:
+            callback: The callback to add.
         """
         with self._lock:
-            self._handlers.append(MessageHandlerMapping(fltr, handler, message_type, is_async))
-            
+            if callback not in self._changed_callbacks:
+                self._changed_callbacks.append(callback)
+
+    def remove_changed_callback(self, callback: MessageHandlersChangedCallback) -> None:
+        """
+        Removes a previously added callback.
+
+        Args:
+            callback: The callback to remove.
+        """
+        with self._lock:
+            if callback in self._changed_callbacks:
+                self._changed_callbacks.remove(callback)
+
     def find_handlers(self, msg_name: MessageName) -> MessageHandlerMappings:
         """
         Finds all handlers that fit the given ``msg_name``.
@@ -39,12 +90,11 @@ class MessageHandlers:
         Returns:
             A list of all found message handlers.
         """
-        handlers: MessageHandlerMappings = []
-        with self._lock:
-            for mapping in self._handlers:
-                if PurePosixPath(msg_name).match(mapping.filter):
-                    handlers.append(mapping)
-        return handlers
+        if (handlers := self._lookup_cache.get(msg_name)) is None:
+            with self._lock:
+                handlers = self._index.find(msg_name)
+                self._lookup_cache[msg_name] = handlers
+        return handlers[:]
 
     def __str__(self) -> str:
         return "; ".join(map(str, self._handlers))
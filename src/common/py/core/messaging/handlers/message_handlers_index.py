@@ -0,0 +1,113 @@
+import fnmatch
+import typing
+from pathlib import PurePosixPath
+
+from ..message import MessageName
+from .message_handler import MessageHandlerMapping, MessageHandlerMappings
+
+
+class MessageHandlersIndex:
+    """
+    A routing index to quickly find all message handler mappings matching a message name.
+
+    Message name filters follow the semantics of ``PurePosixPath.match``: A relative filter is matched against the trailing segments of a
+    message name, while an absolute filter (starting with a slash) needs to match the entire (absolute) name. Each segment may contain wildcards (*, ?, [...]).
+
+    All filters are compiled into a trie of *reversed* segments when added. Literal segments are stored in a hash table, so that looking up a
+    message name only walks the branches that actually match it; wildcard segments are only tested if they exist on the current branch.
+
+    Notes:
+        The index itself is not thread-safe.
+    """
+
+    class _Node:
+        def __init__(self):
+            self.literals: typing.Dict[str, MessageHandlersIndex._Node] = {}
+            self.wildcards: typing.Dict[str, MessageHandlersIndex._Node] = {}
+
+            self.mappings: typing.List[typing.Tuple[int, MessageHandlerMapping]] = []
+            self.anchored_mappings: typing.List[
+                typing.Tuple[int, MessageHandlerMapping]
+            ] = []
+
+    def __init__(self):
+        self._root = MessageHandlersIndex._Node()
+        self._count = 0
+
+    def add(self, mapping: MessageHandlerMapping) -> None:
+        """
+        Compiles the filter of a mapping and adds the mapping to the index.
+
+        Args:
+            mapping: The message handler mapping.
+
+        Raises:
+            ValueError: If the filter is empty.
+        """
+        path = PurePosixPath(mapping.filter)
+        parts = path.parts[1:] if path.root else path.parts
+        if len(parts) == 0:
+            raise ValueError(f"Empty message name filter given for {mapping}")
+
+        node = self._root
+        for part in reversed(parts):
+            children = node.wildcards if self._is_wildcard(part) else node.literals
+            node = children.setdefault(part, MessageHandlersIndex._Node())
+
+        entry = (self._count, mapping)
+        if path.root:
+            node.anchored_mappings.append(entry)
+        else:
+            node.mappings.append(entry)
+
+        self._count += 1
+
+    def find(self, msg_name: MessageName) -> MessageHandlerMappings:
+        """
+        Finds all mappings matching the given message name.
+
+        Args:
+            msg_name: The message name.
+
+        Returns:
+            All matching mappings, in the order they were added.
+        """
+        # Just like with PurePosixPath.match, the root of an absolute name counts as a segment for relative filters
+        path = PurePosixPath(msg_name)
+        parts = tuple(reversed(path.parts))
+
+        matches: typing.List[typing.Tuple[int, MessageHandlerMapping]] = []
+        self._collect(self._root, parts, 0, matches, rooted=bool(path.root))
+        matches.sort(key=lambda entry: entry[0])
+        return [mapping for _, mapping in matches]
+
+    def _collect(
+        self,
+        node: _Node,
+        parts: typing.Tuple[str, ...],
+        depth: int,
+        matches: typing.List[typing.Tuple[int, MessageHandlerMapping]],
+        *,
+        rooted: bool,
+    ) -> None:
+        matches.extend(node.mappings)
+
+        if rooted and depth == len(parts) - 1:
+            matches.extend(node.anchored_mappings)
+        if depth == len(parts):
+            return
+
+        part = parts[depth]
+        if (child := node.literals.get(part)) is not None:
+            self._collect(child, parts, depth + 1, matches, rooted=rooted)
+
+        for pattern, child in node.wildcards.items():
+            if fnmatch.fnmatchcase(part, pattern):
+                self._collect(child, parts, depth + 1, matches, rooted=rooted)
+
+    @staticmethod
+    def _is_wildcard(part: str) -> bool:
+        return any(c in part for c in "*?[")
+
+    def __len__(self) -> int:
+        return self._count
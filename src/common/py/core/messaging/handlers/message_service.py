@@ -1,8 +1,9 @@
-from .message_context import MessageContext, MessageContextType
+from .message_context import MessageContext, MessageContextType, LoggerFactory
 from .message_handlers import MessageHandlers
 from .. import MessageBusProtocol
 from ..composers import MessageBuilder
 from ..meta import MessageMetaInformation
+from ...execution import BoundedExecutor
 from ...logging import LoggerProtocol
 from ....utils import UnitID
 from ....utils.config import Configuration
@@ -22,32 +23,37 @@ class MessageService:
         *,
         message_bus: MessageBusProtocol,
         context_type: type[MessageContextType] = MessageContext,
+        executor: BoundedExecutor | None = None,
     ):
         """
         Args:
             comp_id: The global component identifier.
             message_bus: The global message bus.
             context_type: The type to use when creating a message context.
+            executor: The executor to run asynchronous handlers and callbacks in; if not set, a global executor is used.
         """
         self._component_id = comp_id
 
         self._message_bus = message_bus
         self._message_handlers = MessageHandlers()
         self._context_type = context_type
+        self._executor = executor
 
     def create_context(
         self,
         msg_meta: MessageMetaInformation,
         *,
-        logger: LoggerProtocol,
+        logger: LoggerProtocol | LoggerFactory,
         config: Configuration,
     ) -> MessageContext:
         """
         Creates a new service context.
 
+        The message builder of the context is only created once it is actually used.
+
         Args:
             msg_meta: The meta information of the message.
-            logger: The logger to be used within the new context.
+            logger: The logger (or a factory creating it lazily) to be used within the new context.
             config: The global component configuration.
 
         Returns:
@@ -55,7 +61,7 @@ class MessageService:
         """
         return self._context_type(
             msg_meta,
-            self.create_message_builder(),
+            self.create_message_builder,
             logger=logger,
             config=config,
         )
@@ -67,7 +73,16 @@ class MessageService:
         Returns:
             The newly created message builder.
         """
-        return MessageBuilder(self._component_id, self._message_bus)
+        return MessageBuilder(
+            self._component_id, self._message_bus, executor=self._executor
+        )
+
+    @property
+    def executor(self) -> BoundedExecutor | None:
+        """
+        The executor used for asynchronous handlers and callbacks, if any.
+        """
+        return self._executor
 
     @property
     def message_handlers(self) -> MessageHandlers:
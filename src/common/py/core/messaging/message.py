@@ -59,7 +59,8 @@ class Message(abc.ABC):
         Defines a new message.
 
         The decorator takes care of wrapping the new class as a dataclass, passing the correct message
-        name to its constructor. It also registers the new message type in the global ``MessageTypesCatalog``.
+        name to its constructor. It also registers the new message type in the global ``MessageTypesCatalog``
+        and compiles its ``MessageCodec``.
 
         Examples::
 
@@ -90,6 +91,10 @@ class Message(abc.ABC):
 
             MessageTypesCatalog.register_item(name, cls)
 
+            from .message_codec import MessageCodec
+
+            MessageCodec.for_type(cls)
+
             return cls
 
         return decorator
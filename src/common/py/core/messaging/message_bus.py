@@ -1,13 +1,20 @@
+import collections
+import dataclasses
+import functools
 import threading
+import time
 import typing
 
 from .dispatchers import MessageDispatcher
-from .handlers import MessageService, MessageContextType
-from .message import Message, MessageType
+from .handlers import MessageService, MessageContextType, MessageHandlerMapping
+from .message import Message, MessageName, MessageType, Trace
 from .message_router import MessageRouter
 from .meta import MessageMetaInformationType, MessageMetaInformation
 from .networking import NetworkEngine
 from ..logging import LoggerProxy, default_logger, error, debug, warning
+from ..metrics import default_registry
+from ..execution import BoundedExecutor
+from ..scheduling import Scheduler, ScheduledTask
 from ...component import BackendComponentData
 
 
@@ -19,16 +26,48 @@ class MessageBus:
     callback functions), it also sends messages across the network to other components if necessary. The message bus on the remote side will then
     decide what to do with the incoming message: Dispatch it locally there, send it to yet another component, or just ignore it.
 
+    Periodic tasks of the bus (and of services) are executed by a single ``Scheduler`` owned by the bus. The bus itself only wakes up when
+    one of its deadlines (command timeouts, idle timeouts of connected clients) is due; such deadlines are coalesced so that the bus
+    processes them at most once per tick (see ``MessageBusSettingIDs.TICK``).
+
     Message handlers are always registered through a ``MessageService``. When a message gets dispatched locally by the bus, it will call any handlers
     associated with the message (via its name). If a message needs to be sent to another component, the bus will invoke the ``NetworkEngine`` to do
     so.
 
     To be error tolerant, any exceptions that arise during message handling will be logged but won't result in program termination.
 
+    Which dispatcher and which handlers are responsible for a message only depends on its type and name. The bus thus resolves this
+    once and caches the result as a *dispatch plan*; the plans are discarded whenever services or handlers are added or removed.
+
+    The bus records various metrics (message throughput, pending commands, executor queue depths) in the global metrics registry.
+
+    By default, a message emitted by a handler is dispatched immediately, i.e., the bus is re-entered recursively on the handler's stack. If
+    *queued dispatch* is enabled (see ``MessageBusSettingIDs.QUEUED_DISPATCH``), such messages are instead put into a run queue of the
+    current thread, which is drained iteratively once the outermost dispatch has finished. This keeps the stack depth constant regardless
+    of how long a message cascade is. The following ordering guarantees apply in this mode:
+
+    - A message emitted from within a handler is dispatched only after the message currently being dispatched has been passed to *all* of
+      its handlers (and its dispatchers' post-dispatch steps have run).
+    - Messages emitted on the same thread are dispatched in the order they were emitted (FIFO), including messages emitted while draining
+      the queue.
+    - Handlers running in another thread (asynchronous handlers, coroutines) dispatch their messages on that thread; there is no ordering
+      between messages emitted on different threads.
+
     Notes:
         The message bus is thread-safe.
     """
 
+    @dataclasses.dataclass(frozen=True)
+    class _DispatchPlan:
+        dispatchers: typing.Tuple[typing.Tuple[type[Message], MessageDispatcher], ...]
+        handlers: typing.Tuple[typing.Tuple[MessageService, MessageHandlerMapping], ...]
+
+    _messages_total = default_registry().counter(
+        "rds_messages_total",
+        "Number of messages by name and direction (local, in, out).",
+        ("message", "direction"),
+    )
+
     def __init__(self, comp_data: BackendComponentData):
         """
         Args:
@@ -45,22 +84,92 @@ class MessageBus:
 
         self._comp_data = comp_data
 
+        self._scheduler = Scheduler("MessageBusScheduler")
+
         debug("Creating network engine", scope="bus")
         self._network_engine = self._create_network_engine()
 
-        self._services: typing.List[MessageService] = []
+        # The services are stored copy-on-write, so dispatching never iterates over a changing list
+        self._services: typing.Tuple[MessageService, ...] = ()
         self._dispatchers: typing.Dict[type[MessageType], MessageDispatcher] = {
             Command: CommandDispatcher(),
             CommandReply: CommandReplyDispatcher(),
             Event: EventDispatcher(),
         }
-        self._router = MessageRouter(comp_data.comp_id)
+        self._router = MessageRouter(comp_data.comp_id, groups=comp_data.groups)
+
+        from ...settings import MessageBusSettingIDs
+
+        MessageDispatcher.meta_information_list().max_entries = comp_data.config.value(
+            MessageBusSettingIDs.MAX_PENDING_COMMANDS
+        )
+
+        self._dispatch_plans: typing.Dict[
+            typing.Tuple[type[Message], MessageName], MessageBus._DispatchPlan
+        ] = {}
+        self._dispatch_plans_generation = 0
+
+        self._queued_dispatch = comp_data.config.value(
+            MessageBusSettingIDs.QUEUED_DISPATCH
+        )
+        self._dispatch_queues = threading.local()
+
+        self._register_metrics()
+
+        self._tick: float = comp_data.config.value(MessageBusSettingIDs.TICK)
+        self._process_task: ScheduledTask | None = None
+        self._process_deadline = 0.0
+        self._last_process = 0.0
+        self._process_lock = threading.Lock()
 
         self._lock = threading.Lock()
 
     def _create_network_engine(self) -> NetworkEngine:
         return NetworkEngine(self._comp_data, self)
 
+    def _register_metrics(self) -> None:
+        registry = default_registry()
+        meta_information_list = MessageDispatcher.meta_information_list()
+
+        registry.gauge(
+            "rds_pending_commands", "Number of commands waiting for a reply."
+        ).set_collector(lambda: {(): len(meta_information_list)})
+        registry.counter(
+            "rds_command_timeouts_total", "Number of commands that timed out."
+        ).set_collector(lambda: {(): meta_information_list.timed_out_count})
+        registry.counter(
+            "rds_command_evictions_total",
+            "Number of pending commands evicted due to too many pending commands.",
+        ).set_collector(lambda: {(): meta_information_list.evicted_count})
+
+        def _collect_executors(
+            value: typing.Callable[[BoundedExecutor], float],
+        ) -> typing.Dict[typing.Tuple[str, ...], float]:
+            executors = {
+                svc.executor.name: svc.executor
+                for svc in self._services
+                if svc.executor is not None
+            }
+            default_executor = MessageDispatcher.default_executor()
+            executors[default_executor.name] = default_executor
+            return {(name,): value(executor) for name, executor in executors.items()}
+
+        registry.gauge(
+            "rds_executor_queue_depth",
+            "Number of tasks waiting for a worker.",
+            ("executor",),
+        ).set_collector(lambda: _collect_executors(lambda ex: ex.queue_depth))
+        registry.gauge(
+            "rds_executor_active_tasks",
+            "Number of tasks currently being executed.",
+            ("executor",),
+        ).set_collector(lambda: _collect_executors(lambda ex: ex.active_count))
+        registry.counter(
+            "rds_executor_overflows_total",
+            "Number of tasks rejected or dropped due to a full queue.",
+            ("executor",),
+        ).set_collector(lambda: _collect_executors(lambda ex: ex.overflow_count))
+
     def add_service(self, svc: MessageService) -> bool:
         """
         Adds a new message service to the bus.
@@ -71,11 +180,17 @@ class MessageBus:
         Returns:
             Whether the message service was added.
         """
+        # The check and the addition happen in one step, so concurrent calls can't add the same service twice; the handlers only
+        # invoke their callbacks outside of their own lock, so registering the callback while holding the bus lock is safe
         with self._lock:
             if svc in self._services:
                 return False
 
-            self._services.append(svc)
+            # Register the callback first so that no handler addition can be missed
+            svc.message_handlers.add_changed_callback(self._invalidate_dispatch_plans)
+
+            self._services = self._services + (svc,)
+            self._reset_dispatch_plans()
             return True
 
     def remove_service(self, svc: MessageService) -> bool:
@@ -92,15 +207,26 @@ class MessageBus:
             if svc not in self._services:
                 return False
 
-            self._services.remove(svc)
-            return True
+            self._services = tuple(s for s in self._services if s is not svc)
+            self._reset_dispatch_plans()
+
+        svc.message_handlers.remove_changed_callback(self._invalidate_dispatch_plans)
+        return True
 
     def run(self) -> None:
         """
         Initiates periodic tasks performed by the bus.
         """
         self._network_engine.run()
-        self._process()
+
+        # Register the callbacks first, so that no deadline arising in the meantime can be missed
+        MessageDispatcher.meta_information_list().set_deadline_callback(
+            self._schedule_process
+        )
+        self._network_engine.set_deadline_callback(self._schedule_process)
+
+        self._scheduler.start()
+        self._schedule_next_process()
 
     def dispatch(self, msg: Message, msg_meta: MessageMetaInformationType) -> None:
         """
@@ -109,10 +235,42 @@ class MessageBus:
         To do so, the message is first checked for validity (whether it actually *may* be dispatched). If it is valid,
         the ``MessageRouter`` will determine if it needs to be dispatched to another component or locally (or both).
 
+        If queued dispatch is enabled and this method is called from within a message handler, the message is only queued and
+        dispatched once the current dispatch has finished.
+
         Args:
             msg: The message to be dispatched.
             msg_meta: The message meta information.
         """
+        if not self._queued_dispatch:
+            self._dispatch(msg, msg_meta)
+            return
+
+        queue: (
+            collections.deque[typing.Tuple[Message, MessageMetaInformationType]] | None
+        ) = getattr(self._dispatch_queues, "queue", None)
+        if queue is not None:
+            # We are already dispatching on this thread, so the message will be picked up by the outermost dispatch
+            queue.append((msg, msg_meta))
+            return
+
+        queue = collections.deque([(msg, msg_meta)])
+        self._dispatch_queues.queue = queue
+        try:
+            while len(queue) > 0:
+                queued_msg, queued_msg_meta = queue.popleft()
+                try:
+                    self._dispatch(queued_msg, queued_msg_meta)
+                except Exception as exc:  # pylint: disable=broad-exception-caught
+                    error(
+                        f"An exception occurred while dispatching a queued message: {str(exc)}",
+                        scope="bus",
+                        message=str(queued_msg),
+                    )
+        finally:
+            self._dispatch_queues.queue = None
+
+    def _dispatch(self, msg: Message, msg_meta: MessageMetaInformationType) -> None:
         try:
             self._router.verify_message(msg, msg_meta)
         except MessageRouter.RoutingError as exc:
@@ -127,28 +285,62 @@ class MessageBus:
             self._local_dispatch(msg, msg_meta)
 
     def _process(self) -> None:
+        with self._process_lock:
+            self._process_task = None
+            self._last_process = time.monotonic()
+
         self._network_engine.process()
 
         for _, dispatcher in self._dispatchers.items():
             dispatcher.process()
 
-        threading.Timer(1.0, self._process).start()
+        self._schedule_next_process()
+
+    def _schedule_next_process(self) -> None:
+        deadlines = [
+            deadline
+            for deadline in (
+                MessageDispatcher.meta_information_list().next_deadline,
+                self._network_engine.next_deadline,
+            )
+            if deadline is not None
+        ]
+
+        if len(deadlines) > 0:
+            self._schedule_process(min(deadlines))
+
+    def _schedule_process(self, deadline: float) -> None:
+        with self._process_lock:
+            # Deadlines are never handled more often than once per tick
+            deadline = max(deadline, self._last_process + self._tick)
+
+            if self._process_task is not None:
+                if self._process_deadline <= deadline:
+                    return
+
+                self._process_task.cancel()
+
+            self._process_deadline = deadline
+            self._process_task = self._scheduler.schedule(
+                self._process, delay=max(0.0, deadline - time.monotonic())
+            )
 
     def _local_dispatch(
         self, msg: Message, msg_meta: MessageMetaInformationType
     ) -> None:
         local_routing = self._router.check_local_routing(msg, msg_meta)
-        for msg_type, dispatcher in self._dispatchers.items():
-            if not isinstance(msg, msg_type):
-                continue
+        if local_routing:
+            MessageBus._messages_total.inc(msg.name, "local")
 
+        plan = self._get_dispatch_plan(msg)
+        for msg_type, dispatcher in plan.dispatchers:
             dispatcher.pre_dispatch(msg, msg_meta)
 
             if local_routing:
                 msg_dispatched = False
-                for svc in self._services:
-                    msg_dispatched |= self._dispatch_to_service(
-                        dispatcher, msg, msg_type, msg_meta, svc
+                for svc, handler in plan.handlers:
+                    msg_dispatched |= self._dispatch_to_handler(
+                        dispatcher, msg, msg_type, msg_meta, svc, handler
                     )
 
                 if not msg_dispatched:
@@ -165,43 +357,96 @@ class MessageBus:
     ) -> None:
         self._network_engine.send_message(msg, msg_meta)
 
-    def _dispatch_to_service(
+    def _dispatch_to_handler(
         self,
         dispatcher: MessageDispatcher,
         msg: Message,
         msg_type: type[MessageType],
         msg_meta: MessageMetaInformationType,
         svc: MessageService,
+        handler: MessageHandlerMapping,
     ) -> bool:
-        msg_dispatched = False
-        for handler in svc.message_handlers.find_handlers(msg.name):
-            try:
-                act_msg = typing.cast(msg_type, msg)
-                ctx = self._create_context(msg, msg_meta, svc)
-                dispatcher.dispatch(act_msg, msg_meta, handler, ctx)
-                msg_dispatched = True
-            except Exception as exc:  # pylint: disable=broad-exception-caught
-                import traceback
-
-                error(
-                    f"An exception occurred while processing a message: {str(exc)}",
-                    scope="bus",
-                    message=str(msg),
-                    exception=type(exc),
-                )
-                debug(f"Traceback:\n{''.join(traceback.format_exc())}", scope="bus")
-
-        return msg_dispatched
+        try:
+            act_msg = typing.cast(msg_type, msg)
+            ctx = self._create_context(msg, msg_meta, svc)
+            dispatcher.dispatch(act_msg, msg_meta, handler, ctx, svc.executor)
+            return True
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            import traceback
+
+            error(
+                f"An exception occurred while processing a message: {str(exc)}",
+                scope="bus",
+                message=str(msg),
+                exception=type(exc),
+            )
+            debug(f"Traceback:\n{''.join(traceback.format_exc())}", scope="bus")
+
+        return False
+
+    def _get_dispatch_plan(self, msg: Message) -> _DispatchPlan:
+        key = (type(msg), msg.name)
+        if (plan := self._dispatch_plans.get(key)) is None:
+            with self._lock:
+                generation = self._dispatch_plans_generation
+                services = self._services
+
+            plan = self._create_dispatch_plan(msg, services)
+
+            # Only store the plan if no service or handler has changed in the meantime
+            with self._lock:
+                if generation == self._dispatch_plans_generation:
+                    self._dispatch_plans[key] = plan
+
+        return plan
+
+    def _create_dispatch_plan(
+        self, msg: Message, services: typing.Tuple[MessageService, ...]
+    ) -> _DispatchPlan:
+        return MessageBus._DispatchPlan(
+            dispatchers=tuple(
+                (msg_type, dispatcher)
+                for msg_type, dispatcher in self._dispatchers.items()
+                if isinstance(msg, msg_type)
+            ),
+            handlers=tuple(
+                (svc, handler)
+                for svc in services
+                for handler in svc.message_handlers.find_handlers(msg.name)
+            ),
+        )
+
+    def _invalidate_dispatch_plans(self) -> None:
+        with self._lock:
+            self._reset_dispatch_plans()
+
+    def _reset_dispatch_plans(self) -> None:
+        self._dispatch_plans = {}
+        self._dispatch_plans_generation += 1
 
     def _create_context(
         self, msg: Message, msg_meta: MessageMetaInformation, svc: MessageService
     ) -> MessageContextType:
-        logger_proxy = LoggerProxy(default_logger())
-        logger_proxy.add_param("trace", str(msg.trace))
+        # The logger is only created (and the trace stringified) if the handler actually logs something
         return svc.create_context(
-            msg_meta, logger=logger_proxy, config=self._comp_data.config
+            msg_meta,
+            logger=functools.partial(MessageBus._create_logger, msg.trace),
+            config=self._comp_data.config,
         )
 
+    @staticmethod
+    def _create_logger(trace: Trace) -> LoggerProxy:
+        logger_proxy = LoggerProxy(default_logger())
+        logger_proxy.add_param("trace", str(trace))
+        return logger_proxy
+
+    @property
+    def scheduler(self) -> Scheduler:
+        """
+        The scheduler used to execute periodic tasks.
+        """
+        return self._scheduler
+
     @property
     def network(self) -> NetworkEngine:
         """
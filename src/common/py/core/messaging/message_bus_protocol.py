@@ -2,6 +2,7 @@ from typing import Protocol
 
 from .message import Message
 from .meta import MessageMetaInformationType
+from ..scheduling import Scheduler
 
 
 class MessageBusProtocol(Protocol):
@@ -10,3 +11,6 @@ class MessageBusProtocol(Protocol):
     Defines the general interface for the ``MessageBus``.
     """
     def dispatch(self, msg: Message, msg_meta: MessageMetaInformationType) -> None: ...
+
+    @property
+    def scheduler(self) -> Scheduler: ...
@@ -0,0 +1,576 @@
+import copy
+import dataclasses
+import datetime
+import decimal
+import enum
+import json
+import threading
+import types
+import typing
+import uuid
+
+ValueDecoder = typing.Callable[[typing.Any], typing.Any]
+ValueFactory = typing.Callable[[], typing.Any]
+
+
+class MessageCodec:
+    """
+    A precompiled JSON encoder and decoder for a single data class type (usually a message type).
+
+    Encoding and decoding messages using *dataclasses_json* walks all fields reflectively and (for decoding) builds a new *marshmallow*
+    schema each time. A codec instead inspects its type only once and then reuses the compiled field information:
+
+    - Encoding converts data class objects into dictionaries (keeping the field order) and passes them to the *json* module directly, so
+      the output is byte-identical to ``to_json``.
+    - Decoding uses a decoder function per field that is generated from its type annotation. Values that already have the expected type
+      are taken as they are; all others are converted exactly like *marshmallow* would do.
+
+    Types using features of *dataclasses_json* that the codec doesn't replicate (like custom field encoders or letter cases) or having
+    field types the codec can't handle transparently fall back to *dataclasses_json* itself.
+
+    Besides *JSON*, codecs also support the binary *MessagePack* format, which uses the same structure but stores UUIDs as raw bytes.
+
+    Codecs can also decode objects *lazily*: Such objects are instances of a (generated) subclass of the type and only decode each field
+    when it is first accessed.
+
+    Codecs for message types are created when the type is defined; codecs for all other (nested) types are created on first use.
+
+    Notes:
+        Codecs are thread-safe.
+    """
+
+    _UUID_EXT_TYPE = 1
+
+    _codecs: typing.Dict[type, "MessageCodec"] = {}
+    _codecs_lock = threading.RLock()
+
+    _LAZY_STATE = "__codec_lazy_state__"
+
+    class _Field(typing.NamedTuple):
+        name: str
+        decoder: ValueDecoder
+        required: bool
+        default: ValueFactory | None
+
+    class _LazyState:
+        def __init__(self, data: typing.Mapping[str, typing.Any]):
+            self.data = data
+            self.lock = threading.Lock()
+
+    class _LazyField:
+        # A non-data descriptor: Once a field has been decoded, its value is stored in the instance and shadows the descriptor
+        def __init__(self, field: "MessageCodec._Field"):
+            self._field = field
+
+        def __get__(self, instance: typing.Any, owner: type) -> typing.Any:
+            if instance is None:
+                return self
+
+            state: MessageCodec._LazyState = instance.__dict__[MessageCodec._LAZY_STATE]
+            with state.lock:
+                if self._field.name in instance.__dict__:
+                    return instance.__dict__[self._field.name]
+
+                if self._field.name in state.data:
+                    value = self._field.decoder(state.data[self._field.name])
+                else:
+                    value = self._field.default()
+
+                instance.__dict__[self._field.name] = value
+                return value
+
+    def __init__(self, data_type: type):
+        """
+        Args:
+            data_type: The data class type.
+
+        Raises:
+            ValueError: If the type is not a data class.
+        """
+        if not dataclasses.is_dataclass(data_type):
+            raise ValueError(f"The type {data_type} is not a data class")
+
+        self._data_type = data_type
+
+        self._field_names = tuple(field.name for field in dataclasses.fields(data_type))
+        self._field_names_set = frozenset(self._field_names)
+        self._fields: typing.Tuple[MessageCodec._Field, ...] | None = None
+        self._lazy_type: type | None = None
+
+        self._uses_config = self._uses_dataclasses_json_config(data_type)
+        if not self._uses_config:
+            try:
+                self._fields = self._compile_fields(data_type)
+            except TypeError:
+                pass  # Decoding falls back to dataclasses_json
+
+    @staticmethod
+    def for_type(data_type: type) -> "MessageCodec":
+        """
+        Gets the codec of a data class type, compiling it if necessary.
+
+        Args:
+            data_type: The data class type.
+
+        Returns:
+            The codec.
+        """
+        if (codec := MessageCodec._codecs.get(data_type)) is None:
+            with MessageCodec._codecs_lock:
+                if (codec := MessageCodec._codecs.get(data_type)) is None:
+                    codec = MessageCodec(data_type)
+                    MessageCodec._codecs[data_type] = codec
+
+        return codec
+
+    def encode(self, obj: typing.Any) -> str:
+        """
+        Encodes an object as *JSON*.
+
+        Args:
+            obj: The object to encode.
+
+        Returns:
+            The *JSON* string.
+        """
+        return MessageCodec.encode_data(self.encode_object(obj))
+
+    def encode_binary(self, obj: typing.Any) -> bytes:
+        """
+        Encodes an object in the binary *MessagePack* format.
+
+        Args:
+            obj: The object to encode.
+
+        Returns:
+            The encoded data.
+        """
+        return MessageCodec.encode_binary_data(self.encode_object(obj))
+
+    def encode_object(self, obj: typing.Any) -> typing.Dict[str, typing.Any]:
+        """
+        Converts an object into a dictionary.
+
+        Nested values are left untouched; they are converted once the dictionary is passed to the *json* module
+        (using ``MessageCodec._encode_value`` as its default function).
+
+        Args:
+            obj: The object to convert.
+
+        Returns:
+            The object as a dictionary.
+        """
+        if self._uses_config:
+            return obj.to_dict(encode_json=False)
+
+        return {name: getattr(obj, name) for name in self._field_names}
+
+    def decode(self, data: str | bytes) -> typing.Any:
+        """
+        Decodes an object from *JSON*.
+
+        Args:
+            data: The *JSON* string.
+
+        Returns:
+            The decoded object.
+
+        Raises:
+            ValueError: If the data is invalid.
+        """
+        return self.decode_object(json.loads(data))
+
+    def decode_binary(self, data: bytes) -> typing.Any:
+        """
+        Decodes an object from the binary *MessagePack* format.
+
+        Args:
+            data: The encoded data.
+
+        Returns:
+            The decoded object.
+
+        Raises:
+            ValueError: If the data is invalid.
+        """
+        return self.decode_object(MessageCodec.decode_binary_data(data))
+
+    def decode_object(self, data: typing.Any) -> typing.Any:
+        """
+        Creates an object from a dictionary.
+
+        Args:
+            data: The dictionary.
+
+        Returns:
+            The created object.
+
+        Raises:
+            ValueError: If the data is invalid.
+        """
+        if self._fields is None:
+            return self._data_type.schema().load(data)
+
+        if not isinstance(data, dict):
+            raise ValueError(f"Invalid data for {self._data_type.__name__}: {data}")
+        if len(unknown := data.keys() - self._field_names_set) > 0:
+            raise ValueError(
+                f"Unknown fields for {self._data_type.__name__}: {', '.join(map(str, unknown))}"
+            )
+
+        kwargs: typing.Dict[str, typing.Any] = {}
+        for field in self._fields:
+            if field.name in data:
+                kwargs[field.name] = field.decoder(data[field.name])
+            elif field.required:
+                raise ValueError(
+                    f"Missing field for {self._data_type.__name__}: {field.name}"
+                )
+
+        return self._data_type(**kwargs)
+
+    @staticmethod
+    def encode_data(data: typing.Any) -> str:
+        """
+        Encodes plain data (like dictionaries or lists, which may contain data class objects) as *JSON*.
+
+        Args:
+            data: The data to encode.
+
+        Returns:
+            The *JSON* string.
+        """
+        return json.dumps(data, default=MessageCodec._encode_value)
+
+    @staticmethod
+    def encode_binary_data(data: typing.Any) -> bytes:
+        """
+        Encodes plain data (like dictionaries or lists, which may contain data class objects) in the binary *MessagePack* format.
+
+        Args:
+            data: The data to encode.
+
+        Returns:
+            The encoded data.
+        """
+        import msgpack
+
+        return msgpack.packb(data, default=MessageCodec._encode_binary_value)
+
+    @staticmethod
+    def decode_binary_data(data: bytes) -> typing.Any:
+        """
+        Decodes plain data from the binary *MessagePack* format.
+
+        Args:
+            data: The encoded data.
+
+        Returns:
+            The decoded data (UUIDs are restored, but no data class objects are created).
+
+        Raises:
+            ValueError: If the data is invalid.
+        """
+        import msgpack
+
+        return msgpack.unpackb(data, ext_hook=MessageCodec._decode_binary_ext)
+
+    def decode_lazy(
+        self,
+        data: typing.Mapping[str, typing.Any],
+        *,
+        values: typing.Dict[str, typing.Any] | None = None,
+    ) -> typing.Any:
+        """
+        Creates an object from a dictionary, decoding its fields only when they are first accessed.
+
+        The created object is an instance of a subclass of the data class type, so it can be used like any other object of that type.
+        Fields can also be passed as already decoded values, which are used as they are.
+
+        If the codec isn't compiled, the object is decoded immediately.
+
+        Args:
+            data: The dictionary of (undecoded) field values.
+            values: Field values that have already been decoded.
+
+        Returns:
+            The created object.
+
+        Raises:
+            ValueError: If the data contains unknown fields or lacks required ones; invalid field values only raise an error when
+                the field is accessed.
+        """
+        values = values or {}
+
+        if self._fields is None:
+            # Without compiled fields, the decoded values need to be converted back into plain data first
+            return self.decode_object(
+                {**data, **json.loads(MessageCodec.encode_data(values))}
+            )
+
+        if len(unknown := (data.keys() | values.keys()) - self._field_names_set) > 0:
+            raise ValueError(
+                f"Unknown fields for {self._data_type.__name__}: {', '.join(map(str, unknown))}"
+            )
+        for field in self._fields:
+            if field.required and field.name not in data and field.name not in values:
+                raise ValueError(
+                    f"Missing field for {self._data_type.__name__}: {field.name}"
+                )
+
+        obj = object.__new__(self._get_lazy_type())
+        obj.__dict__.update(values)
+        obj.__dict__[MessageCodec._LAZY_STATE] = MessageCodec._LazyState(data)
+        return obj
+
+    def _get_lazy_type(self) -> type:
+        if self._lazy_type is None:
+            with MessageCodec._codecs_lock:
+                if self._lazy_type is None:
+                    self._lazy_type = self._create_lazy_type()
+
+                    # Lazy objects are encoded and decoded just like objects of the original type
+                    MessageCodec._codecs[self._lazy_type] = self
+
+        return self._lazy_type
+
+    def _create_lazy_type(self) -> type:
+        data_type = self._data_type
+        field_names = self._field_names
+
+        def __repr__(obj: typing.Any) -> str:
+            # Undecoded fields are omitted so that logging a message doesn't decode it
+            if all(name in obj.__dict__ for name in field_names):
+                return data_type.__repr__(obj)
+
+            decoded_fields = ", ".join(
+                f"{name}={obj.__dict__[name]!r}"
+                for name in field_names
+                if name in obj.__dict__
+            )
+            return f"{data_type.__qualname__}({decoded_fields}, ...)"
+
+        def __eq__(obj: typing.Any, other: typing.Any) -> bool:
+            if not isinstance(other, data_type):
+                return NotImplemented
+
+            return type(other) in (data_type, type(obj)) and all(
+                getattr(obj, name) == getattr(other, name) for name in field_names
+            )
+
+        # Copies are plain objects of the original type, as the lazy state (holding a lock) can neither be copied nor pickled
+        def __reduce__(obj: typing.Any) -> typing.Tuple[typing.Any, ...]:
+            return MessageCodec._create_object, (
+                data_type,
+                {name: getattr(obj, name) for name in field_names},
+            )
+
+        def __deepcopy__(
+            obj: typing.Any, memo: typing.Dict[int, typing.Any]
+        ) -> typing.Any:
+            return MessageCodec._create_object(
+                data_type,
+                {name: copy.deepcopy(getattr(obj, name), memo) for name in field_names},
+            )
+
+        namespace: typing.Dict[str, typing.Any] = {
+            field.name: MessageCodec._LazyField(field) for field in self._fields or ()
+        }
+        namespace.update(
+            {
+                "__module__": data_type.__module__,
+                "__qualname__": data_type.__qualname__,
+                "__repr__": __repr__,
+                "__eq__": __eq__,
+                "__hash__": data_type.__hash__,
+                "__reduce__": __reduce__,
+                "__deepcopy__": __deepcopy__,
+            }
+        )
+        return type(data_type.__name__, (data_type,), namespace)
+
+    @staticmethod
+    def _create_object(
+        data_type: type, values: typing.Dict[str, typing.Any]
+    ) -> typing.Any:
+        return data_type(**values)
+
+    def _compile_fields(self, data_type: type) -> typing.Tuple[_Field, ...]:
+        type_hints = typing.get_type_hints(data_type)
+
+        compiled_fields: typing.List[MessageCodec._Field] = []
+        for field in dataclasses.fields(data_type):
+            if not field.init:
+                raise TypeError(f"Field {field.name} is not part of the constructor")
+
+            default: ValueFactory | None = None
+            if field.default is not dataclasses.MISSING:
+                default = lambda value=field.default: value
+            elif field.default_factory is not dataclasses.MISSING:
+                default = field.default_factory
+
+            compiled_fields.append(
+                MessageCodec._Field(
+                    field.name,
+                    self._compile_decoder(type_hints[field.name]),
+                    default is None,
+                    default,
+                )
+            )
+
+        return tuple(compiled_fields)
+
+    def _compile_decoder(self, value_type: typing.Any) -> ValueDecoder:
+        # pylint: disable=too-many-return-statements
+        origin = typing.get_origin(value_type)
+        args = typing.get_args(value_type)
+
+        if value_type is typing.Any:
+            return lambda value: value
+
+        if origin in (typing.Union, types.UnionType):
+            value_types = [arg for arg in args if arg is not type(None)]
+            if len(value_types) != 1 or len(args) != 2:
+                raise TypeError(f"Unsupported union type {value_type}")
+
+            value_decoder = self._compile_decoder(value_types[0])
+            return lambda value: value_decoder(value) if value is not None else None
+
+        if origin is list:
+            item_decoder = self._compile_decoder(args[0] if args else typing.Any)
+
+            def _decode_list(value: typing.Any) -> typing.List[typing.Any]:
+                if not isinstance(value, list):
+                    raise ValueError(f"Not a valid list: {value}")
+                return [item_decoder(item) for item in value]
+
+            return _decode_list
+
+        if origin is dict:
+            if args and args[0] is not str:
+                raise TypeError(f"Unsupported dictionary key type {args[0]}")
+            item_decoder = self._compile_decoder(args[1] if args else typing.Any)
+
+            def _decode_dict(value: typing.Any) -> typing.Dict[str, typing.Any]:
+                if not isinstance(value, dict):
+                    raise ValueError(f"Not a valid mapping: {value}")
+                return {key: item_decoder(item) for key, item in value.items()}
+
+            return _decode_dict
+
+        if origin is not None:
+            raise TypeError(f"Unsupported generic type {value_type}")
+
+        if dataclasses.is_dataclass(value_type):
+            # Nested codecs are looked up lazily, which also allows recursive types
+            def _decode_dataclass(value: typing.Any) -> typing.Any:
+                if type(value) is value_type:  # pylint: disable=unidiomatic-typecheck
+                    return value
+                if value is None:
+                    raise ValueError("Field may not be null")
+                return MessageCodec.for_type(value_type).decode_object(value)
+
+            return _decode_dataclass
+
+        if isinstance(value_type, type) and issubclass(value_type, enum.Enum):
+            return value_type
+
+        if value_type in (str, int, float, bool, uuid.UUID):
+            return self._compile_primitive_decoder(value_type)
+
+        raise TypeError(f"Unsupported type {value_type}")
+
+    @staticmethod
+    def _compile_primitive_decoder(value_type: type) -> ValueDecoder:
+        from marshmallow import fields
+
+        # Values that don't have the exact type are converted by marshmallow to behave exactly like dataclasses_json
+        marshmallow_field = {
+            str: fields.Str,
+            int: fields.Int,
+            float: fields.Float,
+            bool: fields.Bool,
+            uuid.UUID: fields.UUID,
+        }[value_type]()
+
+        if value_type is uuid.UUID:
+
+            def _decode_uuid(value: typing.Any) -> typing.Any:
+                if isinstance(value, uuid.UUID):
+                    return value
+                if isinstance(value, str):
+                    return uuid.UUID(value)
+                return marshmallow_field.deserialize(value)
+
+            return _decode_uuid
+
+        def _decode(value: typing.Any) -> typing.Any:
+            if type(value) is value_type:  # pylint: disable=unidiomatic-typecheck
+                return value
+            return marshmallow_field.deserialize(value)
+
+        return _decode
+
+    @staticmethod
+    def _encode_value(value: typing.Any) -> typing.Any:
+        # Mirrors the conversions of dataclasses_json for all values the json module can't handle by itself
+        if dataclasses.is_dataclass(value):
+            return MessageCodec.for_type(type(value)).encode_object(value)
+        if isinstance(value, uuid.UUID):
+            return str(value)
+        if isinstance(value, enum.Enum):
+            return value.value
+        if isinstance(value, typing.Mapping):
+            return dict(value)
+        if isinstance(value, typing.Collection) and not isinstance(value, (str, bytes)):
+            return list(value)
+        if isinstance(value, datetime.datetime):
+            return value.timestamp()
+        if isinstance(value, decimal.Decimal):
+            return str(value)
+
+        raise TypeError(
+            f"Object of type {type(value).__name__} is not JSON serializable"
+        )
+
+    @staticmethod
+    def _encode_binary_value(value: typing.Any) -> typing.Any:
+        import msgpack
+
+        if isinstance(value, uuid.UUID):
+            return msgpack.ExtType(MessageCodec._UUID_EXT_TYPE, value.bytes)
+
+        return MessageCodec._encode_value(value)
+
+    @staticmethod
+    def _decode_binary_ext(code: int, data: bytes) -> typing.Any:
+        import msgpack
+
+        if code == MessageCodec._UUID_EXT_TYPE:
+            return uuid.UUID(bytes=data)
+
+        return msgpack.ExtType(code, data)
+
+    @staticmethod
+    def _uses_dataclasses_json_config(data_type: type) -> bool:
+        if getattr(data_type, "dataclass_json_config", None):
+            return True
+
+        return any(
+            "dataclasses_json" in field.metadata
+            for field in dataclasses.fields(data_type)
+        )
+
+    @property
+    def data_type(self) -> type:
+        """
+        The data class type of this codec.
+        """
+        return self._data_type
+
+    @property
+    def is_compiled(self) -> bool:
+        """
+        Whether the codec uses compiled decoders (instead of falling back to *dataclasses_json* for decoding).
+        """
+        return self._fields is not None
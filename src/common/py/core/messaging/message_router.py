@@ -1,3 +1,5 @@
+import typing
+
 from .message import Message
 from .meta import MessageMetaInformation
 from ...utils import UnitID
@@ -16,12 +18,14 @@ class MessageRouter:
         Represents errors during routing validation.
         """
 
-    def __init__(self, comp_id: UnitID):
+    def __init__(self, comp_id: UnitID, *, groups: typing.Collection[str] = ()):
         """
         Args:
             comp_id: The component id (required to decide whether we match a given direct target).
+            groups: The named groups the component belongs to (required to decide whether we match a given group target).
         """
         self._comp_id = comp_id
+        self._groups = frozenset(groups)
 
     def verify_message(self, msg: Message, msg_meta: MessageMetaInformation) -> None:
         """
@@ -38,6 +42,8 @@ class MessageRouter:
             self._verify_local_message(msg, msg_meta)
         if msg.target.is_direct:
             self._verify_direct_message(msg, msg_meta)
+        if msg.target.is_group:
+            self._verify_group_message(msg, msg_meta)
 
     def check_local_routing(
         self, msg: Message, msg_meta: MessageMetaInformation
@@ -58,6 +64,9 @@ class MessageRouter:
             # A direct message that has made it to the message bus either stems from this component or is targeted to it
             # If it is targeted to this component, it needs to be dispatched locally
             return msg.target.target_id.equals(self._comp_id)
+        if msg.target.is_group or msg.target.is_broadcast:
+            # Group and broadcast messages are dispatched locally if this component is among the targeted ones
+            return msg.target.addresses(self._comp_id, self._groups)
 
         return False
 
@@ -107,3 +116,9 @@ class MessageRouter:
             raise MessageRouter.RoutingError(
                 "Message coming from another component not directed to this component"
             )
+
+    def _verify_group_message(
+        self, msg: Message, msg_meta: MessageMetaInformation
+    ) -> None:
+        if not msg.target.target:
+            raise MessageRouter.RoutingError("Group message without a group received")
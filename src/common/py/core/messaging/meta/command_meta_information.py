@@ -3,6 +3,8 @@ import typing
 
 from .message_meta_information import MessageMetaInformation
 from ..command_reply import CommandDoneCallback, CommandFailCallback
+from ..message import Trace
+from ...execution import BoundedExecutor
 
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
@@ -15,7 +17,9 @@ class CommandMetaInformation(MessageMetaInformation):
         done_callbacks: Called when a reply was received for this command.
         fail_callbacks: Called when no reply was received for this command or an exception occurred.
         async_callbacks: Whether the callbacks should be invoked asynchronously in their own thread.
+        callbacks_executor: The executor to run asynchronous callbacks in; if not set, a global executor is used.
         timeout: The timeout (in seconds) before a command is deemed not replied.
+        trace: The trace of the command; set when the command is dispatched.
     """
 
     requires_reply: bool = True
@@ -28,5 +32,8 @@ class CommandMetaInformation(MessageMetaInformation):
     )
 
     async_callbacks: bool = False
+    callbacks_executor: BoundedExecutor | None = None
 
     timeout: float = 0.0
+
+    trace: Trace | None = None
@@ -1,4 +1,6 @@
 import dataclasses
+import heapq
+import itertools
 import threading
 import time
 import typing
@@ -6,11 +8,20 @@ import typing
 from ..message import Trace
 from .message_meta_information import MessageMetaInformation
 
+DeadlineCallback = typing.Callable[[float], None]
+
 
 class MessageMetaInformationList:
     """
     List to store message meta information objects.
 
+    Entries with a timeout are additionally kept in a min-heap ordered by their deadlines (based on a monotonic clock), so finding
+    timed out entries only costs time proportional to the number of expired entries. Entries removed before they expired are
+    deleted lazily from the heap. Whenever a new entry becomes the one due next, an optional callback is invoked with its deadline, so
+    that the owner can schedule checking for timed out entries exactly when needed.
+
+    The list can be capped to a maximum number of entries; if the cap is reached, the oldest entries are evicted.
+
     Notes:
         The list is thread-safe.
     """
@@ -20,20 +31,54 @@ class MessageMetaInformationList:
         meta_information: MessageMetaInformation
 
         timeout: float = 0.0
-        timestamp: float = dataclasses.field(default_factory=time.time)
+        timestamp: float = dataclasses.field(default_factory=time.monotonic)
+
+        @property
+        def deadline(self) -> float:
+            """
+            The monotonic time at which the message times out.
+            """
+            return self.timestamp + self.timeout
 
         def has_timed_out(self) -> bool:
             """
             Whether the message has timed out.
             """
-            return time.time() - self.timestamp > self.timeout if self.timeout > 0.0 else False
+            return time.monotonic() > self.deadline if self.timeout > 0.0 else False
 
-    def __init__(self):
+    def __init__(self, max_entries: int = 0):
+        """
+        Args:
+            max_entries: The maximum number of entries (0 for no limit).
+        """
+        # Dictionaries keep their insertion order, so the first entry is always the oldest one
         self._list: typing.Dict[Trace, MessageMetaInformationList._Entry] = {}
+        self._deadlines: typing.List[
+            typing.Tuple[float, int, Trace, MessageMetaInformationList._Entry]
+        ] = []
+        self._counter = itertools.count()
+
+        self._max_entries = max_entries
+
+        self._timed_out_count = 0
+        self._evicted_count = 0
+
+        self._deadline_callback: DeadlineCallback | None = None
 
         self._lock = threading.Lock()
 
-    def add(self, unique: Trace, meta: MessageMetaInformation, timeout: float) -> None:
+    def set_deadline_callback(self, callback: DeadlineCallback | None) -> None:
+        """
+        Sets a callback that is invoked (outside of the list lock) with the new deadline whenever an added entry is due before all others.
+
+        Args:
+            callback: The callback to invoke.
+        """
+        self._deadline_callback = callback
+
+    def add(
+        self, unique: Trace, meta: MessageMetaInformation, timeout: float
+    ) -> typing.List[typing.Tuple[Trace, MessageMetaInformation]]:
         """
         Adds a new entry to the list.
 
@@ -41,10 +86,30 @@ class MessageMetaInformationList:
             unique: The unique trace identifying the message.
             meta: The message meta information.
             timeout: A timeout (in seconds) after which a message is deemed timed out.
+
+        Returns:
+            All entries that had to be evicted to make room for the new one.
         """
         with self._lock:
-            if unique not in self._list:
-                self._list[unique] = MessageMetaInformationList._Entry(meta, timeout=timeout)
+            if unique in self._list:
+                return []
+
+            evicted = self._evict(self._max_entries - 1)
+
+            entry = MessageMetaInformationList._Entry(meta, timeout=timeout)
+            self._list[unique] = entry
+            if timeout > 0.0:
+                heapq.heappush(
+                    self._deadlines,
+                    (entry.deadline, next(self._counter), unique, entry),
+                )
+
+            is_due_next = timeout > 0.0 and self._deadlines[0][3] is entry
+
+        if is_due_next and (callback := self._deadline_callback) is not None:
+            callback(entry.deadline)
+
+        return evicted
 
     def remove(self, unique: Trace) -> None:
         """
@@ -57,6 +122,10 @@ class MessageMetaInformationList:
             if unique in self._list:
                 self._list.pop(unique)
 
+                # Stale heap entries are removed lazily; compact the heap if they outnumber the actual entries
+                if len(self._deadlines) > 2 * len(self._list) + 64:
+                    self._compact_deadlines()
+
     def find(self, unique: Trace) -> MessageMetaInformation | None:
         """
         Finds an entry associated with the given ``unique``.
@@ -74,11 +143,23 @@ class MessageMetaInformationList:
         """
         Finds all entries that have timed out already.
 
+        Each timed out entry is only reported once.
+
         Returns:
             A list of all timed out entries.
         """
+        timed_out: typing.List[Trace] = []
+        now = time.monotonic()
+
         with self._lock:
-            return [unique for unique, entry in self._list.items() if entry.has_timed_out()]
+            while len(self._deadlines) > 0 and self._deadlines[0][0] < now:
+                _, _, unique, entry = heapq.heappop(self._deadlines)
+                if self._list.get(unique) is entry:
+                    timed_out.append(unique)
+
+            self._timed_out_count += len(timed_out)
+
+        return timed_out
 
     def _find(self, unique: Trace) -> _Entry | None:
         with self._lock:
@@ -86,3 +167,60 @@ class MessageMetaInformationList:
                 return self._list[unique]
 
         return None
+
+    def _evict(
+        self, max_entries: int
+    ) -> typing.List[typing.Tuple[Trace, MessageMetaInformation]]:
+        evicted: typing.List[typing.Tuple[Trace, MessageMetaInformation]] = []
+        if self._max_entries > 0:
+            while len(self._list) > max_entries:
+                unique = next(iter(self._list))
+                evicted.append((unique, self._list.pop(unique).meta_information))
+
+            self._evicted_count += len(evicted)
+
+        return evicted
+
+    def _compact_deadlines(self) -> None:
+        self._deadlines = [
+            item for item in self._deadlines if self._list.get(item[2]) is item[3]
+        ]
+        heapq.heapify(self._deadlines)
+
+    @property
+    def max_entries(self) -> int:
+        """
+        The maximum number of entries (0 for no limit).
+        """
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, max_entries: int) -> None:
+        with self._lock:
+            self._max_entries = max_entries
+
+    @property
+    def next_deadline(self) -> float | None:
+        """
+        The monotonic time at which the next entry times out (if any); this might be earlier than the actual deadline, as entries are
+        removed from the heap lazily.
+        """
+        with self._lock:
+            return self._deadlines[0][0] if len(self._deadlines) > 0 else None
+
+    @property
+    def timed_out_count(self) -> int:
+        """
+        The total number of entries that have timed out.
+        """
+        return self._timed_out_count
+
+    @property
+    def evicted_count(self) -> int:
+        """
+        The total number of entries that have been evicted due to the list being full.
+        """
+        return self._evicted_count
+
+    def __len__(self) -> int:
+        return len(self._list)
@@ -1 +1,9 @@
 from .network_engine import NetworkEngine
+from .wire_format import WireFormat, EncodedData
+from .compression import Compression
+from .message_compressor import MessageCompressor
+from .message_batcher import MessageBatcher
+from .encoded_message import EncodedMessage
+from .received_message import ReceivedMessage
+from .outbound_queue import OutboundQueue
+from .reconnect_supervisor import ReconnectSupervisor
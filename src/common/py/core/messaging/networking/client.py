@@ -1,35 +1,78 @@
 import threading
+import time
 import typing
 
 import socketio
 
-from .. import Message
+from .compression import Compression
+from .encoded_message import EncodedMessage
+from .message_batcher import MessageBatcher
+from .message_compressor import MessageCompressor
+from .outbound_queue import OutboundQueue
+from .reconnect_supervisor import ReconnectSupervisor
+from .wire_format import WireFormat, EncodedData
 from ..composers import MessageBuilder
 from ...logging import info, warning, error, debug
+from ...metrics import default_registry
+from ...scheduling import Scheduler
 from ....utils import UnitID
 from ....utils.config import Configuration
 
-ClientMessageHandler = typing.Callable[[str, str], None]
+ClientMessageHandler = typing.Callable[[str, EncodedData], None]
 
 
 class Client(socketio.Client):
     """
     The client connection, based on ``socketio.Client``.
+
+    When connecting, the client offers the binary *MessagePack* wire format (if enabled), compression and batching to the server. The
+    server announces which of these it has accepted right after the connection has been established (see ``Server.NEGOTIATION_EVENT``);
+    until then, and with servers not supporting the negotiation, the client sends uncompressed *JSON* messages one by one.
+
+    Outgoing messages are put into an ``OutboundQueue`` and sent by a dedicated writer thread, so emitting a message never waits for the
+    server. While the client is disconnected, messages are buffered and sent in order once the connection has been re-established;
+    buffered commands and replies are kept, while events are dropped if the queue overflows or if they have become stale.
+
+    If the connection to the server cannot be established or gets lost, a ``ReconnectSupervisor`` keeps on trying to (re)connect, using
+    exponential backoff with full jitter capped at the connection timeout; this keeps many clients from reconnecting in lockstep after a
+    server restart. Only ``disconnect_from_server`` ends this; the inherited ``disconnect`` is also used internally by *socket.io* (e.g.,
+    when a connection attempt fails), so it doesn't stop reconnecting.
     """
 
+    _connect_duration = default_registry().histogram(
+        "rds_client_connect_duration_seconds",
+        "Duration of connection attempts by outcome (success, failure).",
+        ("outcome",),
+    )
+    _reconnect_duration = default_registry().histogram(
+        "rds_client_reconnect_duration_seconds",
+        "Time from losing the connection to the server until it was re-established.",
+        buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0),
+    )
+
     def __init__(
-        self, comp_id: UnitID, config: Configuration, message_builder: MessageBuilder
+        self,
+        comp_id: UnitID,
+        config: Configuration,
+        message_builder: MessageBuilder,
+        *,
+        scheduler: Scheduler,
+        groups: typing.Collection[str] = (),
     ):
         """
         Args:
             comp_id: The component identifier.
             config: The global configuration.
             message_builder: A message builder instance.
+            scheduler: The scheduler used to send message batches.
+            groups: The named message groups the component belongs to; these are announced to the server when connecting.
         """
         self._comp_id = comp_id
+        self._groups = list(groups)
         self._config = config
 
         self._message_builder = message_builder
+        self._scheduler = scheduler
 
         from ....settings import NetworkClientSettingIDs
 
@@ -39,19 +82,90 @@ class Client(socketio.Client):
         self._connection_timeout: int = self._config.value(
             NetworkClientSettingIDs.CONNECTION_TIMEOUT
         )
+        self._binary_encoding: bool = self._config.value(
+            NetworkClientSettingIDs.BINARY_ENCODING
+        )
+        self._compressor = MessageCompressor(
+            self._config.value(NetworkClientSettingIDs.COMPRESSION_THRESHOLD),
+            max_size=self._config.value(NetworkClientSettingIDs.MAX_DECOMPRESSED_SIZE),
+        )
+        self._batch_delay: float = self._config.value(
+            NetworkClientSettingIDs.BATCH_DELAY
+        )
+        self._batch_size: int = self._config.value(NetworkClientSettingIDs.BATCH_SIZE)
 
-        super().__init__(reconnection_delay_max=self._connection_timeout)
+        self._queue = OutboundQueue(
+            self._write_message,
+            max_size=self._config.value(NetworkClientSettingIDs.QUEUE_SIZE),
+            stale_timeout=self._config.value(NetworkClientSettingIDs.STALE_TIMEOUT),
+            name="ClientWriter",
+        )
+        self._set_drop_policies()
+
+        self._supervisor = ReconnectSupervisor(
+            self._attempt_reconnect,
+            base_delay=self._config.value(NetworkClientSettingIDs.RECONNECT_DELAY),
+            max_delay=self._connection_timeout,
+            on_reconnected=self._on_reconnected,
+            name="ClientReconnect",
+        )
+        self._disconnect_requested = False
+
+        # socket.io only flags the client as connected once the connect handler has returned, so the client tracks this on its own
+        self._online = False
+
+        self._wire_format = WireFormat.JSON
+        self._compression = Compression.NONE
+        self._batcher: MessageBatcher | None = None
+
+        # Reconnecting is taken care of by the supervisor, which also covers failed initial connection attempts
+        super().__init__(reconnection=False)
 
         self._message_handler: ClientMessageHandler | None = None
 
         self._lock = threading.RLock()
 
         self._connect_events()
+        self._register_metrics()
+
+    def _set_drop_policies(self) -> None:
+        from .. import Event
+
+        self._queue.set_drop_policy(Event, OutboundQueue.DropPolicy.DROP_STALE)
+
+    def _register_metrics(self) -> None:
+        registry = default_registry()
+
+        registry.gauge(
+            "rds_client_queue_depth", "Number of outgoing messages waiting to be sent."
+        ).set_collector(lambda: {(): self._queue.depth})
+        registry.gauge(
+            "rds_client_queue_max_depth",
+            "Highest number of outgoing messages waiting to be sent at the same time.",
+        ).set_collector(lambda: {(): self._queue.max_depth})
+        registry.counter(
+            "rds_client_queue_rejections_total",
+            "Number of outgoing messages rejected due to a full queue.",
+        ).set_collector(lambda: {(): self._queue.rejected_count})
+        registry.counter(
+            "rds_client_queue_drops_total",
+            "Number of outgoing messages dropped by reason (overflow, stale).",
+            ("reason",),
+        ).set_collector(
+            lambda: {
+                (reason.value,): self._queue.dropped_count(reason)
+                for reason in OutboundQueue.DropReason
+            }
+        )
 
     def _connect_events(self) -> None:
+        from .server import Server
+
         self.on("connect", self._on_connect)
         self.on("connect_error", self._on_connect_error)
         self.on("disconnect", self._on_disconnect)
+        self.on(Server.NEGOTIATION_EVENT, self._on_negotiation)
+        self.on(MessageBatcher.BATCH_EVENT, self._on_batch)
         self.on("*", self._on_message)
 
     def set_message_handler(self, msg_handler: ClientMessageHandler) -> None:
@@ -65,24 +179,35 @@ class Client(socketio.Client):
 
     def run(self) -> None:
         """
-        Automatically connects to a server if one was configured.
+        Starts the writer thread and automatically connects to a server if one was configured; if this fails, the client keeps on trying in
+        the background.
         """
-        self.connect_to_server()
+        self._queue.start()
+        self._supervisor.start()
+
+        if self._server_address != "" and not self.connect_to_server():
+            self._supervisor.request_reconnect()
 
     def process(self) -> None:
         """
         Periodically performs certain tasks.
         """
 
-    def connect_to_server(self) -> None:
+    def connect_to_server(self) -> bool:
         """
         Establishes the connection to the server.
+
+        Returns:
+            Whether the client is connected.
         """
         if self._server_address != "" and not self.connected:
             info(f"Connecting to {self._server_address}", scope="client")
 
             import socketio.exceptions as sioexc
 
+            self._disconnect_requested = False
+            start = time.monotonic()
+
             try:
                 self.connect(
                     self._server_address,
@@ -91,31 +216,111 @@ class Client(socketio.Client):
                     wait_timeout=self._connection_timeout,
                 )
             except sioexc.ConnectionError as exc:
+                Client._connect_duration.observe(time.monotonic() - start, "failure")
                 error(f"Failed to connect to server: {str(exc)}", scope="client")
+            else:
+                Client._connect_duration.observe(time.monotonic() - start, "success")
+
+        return self.connected
+
+    def disconnect_from_server(self) -> None:
+        """
+        Disconnects from the server; the client will not reconnect automatically afterwards.
+        """
+        self._disconnect_requested = True
+        self._supervisor.cancel_reconnect()
+
+        super().disconnect()
 
-    def send_message(self, msg: Message) -> None:
+    def send_message(self, msg: EncodedMessage) -> None:
         """
-        Sends a message to the server (if connected).
+        Queues a message to be sent to the server.
 
-        For this, the message will be encoded as *JSON* first.
+        The message is sent by the writer thread once the client is connected; see ``_write_message``.
 
         Args:
             msg: The message to send.
         """
-        if self.connected:
-            debug(f"Sending message: {msg}", scope="client")
-            with self._lock:
-                self.emit(msg.name, data=msg.to_json())
+        if not self._queue.put(msg):
+            warning(
+                "The outgoing message queue is full, discarding message",
+                scope="client",
+                message=str(msg.message),
+            )
+
+    def _write_message(self, msg: EncodedMessage) -> bool:
+        """
+        Sends a queued message to the server (called by the writer thread).
+
+        For this, the message will be encoded using the negotiated wire format (and compressed if negotiated) first, unless it has already
+        been encoded this way. If batching has been negotiated, the message is added to the current batch instead of being sent immediately.
+
+        Args:
+            msg: The message to send.
+
+        Returns:
+            Whether the message was sent (or added to the current batch); if not, it will be sent again after reconnecting.
+        """
+        with self._lock:
+            if not self._online:
+                return False
+
+            wire_format = self._wire_format
+            compressor = (
+                self._compressor
+                if self._compression == Compression.ZLIB and self._compressor.enabled
+                else None
+            )
+            batcher = self._batcher
+
+        debug(f"Sending message: {msg.message}", scope="client")
+        data = msg.encode(wire_format, compressor)
+
+        if batcher is not None:
+            return batcher.add(msg.message.name, data, msg)
+
+        import socketio.exceptions as sioexc
+
+        try:
+            self.emit(msg.message.name, data=data)
+        except sioexc.SocketIOError:
+            return False
+
+        return True
 
     def _on_connect(self) -> None:
         with self._lock:
             from .. import Channel
             from ....api.network import ClientConnectedEvent
 
+            self._online = True
+
             ClientConnectedEvent.build(self._message_builder).emit(Channel.local())
 
             info("Connected to server", scope="client")
 
+        self._supervisor.connection_established()
+        self._queue.resume()
+
+    def _attempt_reconnect(self) -> None:
+        debug(
+            "Attempting to reconnect to server",
+            scope="client",
+            attempt=self._supervisor.attempt_count,
+        )
+
+        self.connect_to_server()
+
+    def _on_reconnected(self, duration: float) -> None:
+        Client._reconnect_duration.observe(duration)
+
+        info(
+            "Reconnected to server",
+            scope="client",
+            duration=round(duration, 3),
+            attempts=self._supervisor.attempt_count,
+        )
+
     def _on_connect_error(self, reason: typing.Any) -> None:
         with self._lock:
             from .. import Channel
@@ -128,18 +333,121 @@ class Client(socketio.Client):
             warning("Unable to connect to server", scope="client", reason=str(reason))
 
     def _on_disconnect(self) -> None:
+        self._queue.pause()
+
         with self._lock:
             from .. import Channel
             from ....api.network import ClientDisconnectedEvent
 
+            self._online = False
+            self._wire_format = WireFormat.JSON
+            self._compression = Compression.NONE
+            if self._batcher is not None:
+                # Batched messages that haven't been sent yet are sent again after reconnecting
+                self._queue.requeue(self._batcher.close())
+                self._batcher = None
+
             ClientDisconnectedEvent.build(self._message_builder).emit(Channel.local())
 
-            info("Disconnected from server", scope="client")
+            info(
+                "Disconnected from server",
+                scope="client",
+                queued_messages=self._queue.depth,
+            )
+
+        if not self._disconnect_requested:
+            self._supervisor.request_reconnect()
 
-    def _on_message(self, msg_name: str, data: str) -> None:
+    def _on_negotiation(self, data: typing.Any) -> None:
         with self._lock:
-            if self._message_handler is not None:
-                self._message_handler(msg_name, data)
+            try:
+                self._wire_format = WireFormat(data["wire_format"])
+                self._compression = Compression(data["compression"])
+                batching = data.get("batching", False) is True
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                warning(
+                    f"Received invalid negotiation data: {str(exc)}", scope="client"
+                )
+                return
+
+            if batching and self._batch_delay > 0.0 and self._batcher is None:
+                self._batcher = MessageBatcher(
+                    self._emit_batch,
+                    self._scheduler,
+                    max_delay=self._batch_delay,
+                    max_size=self._batch_size,
+                )
+
+            debug(
+                "Negotiated the encoding with the server",
+                scope="client",
+                wire_format=self._wire_format,
+                compression=self._compression,
+                batching=self._batcher is not None,
+            )
 
-    def _get_authentication(self) -> typing.Dict[str, str]:
-        return {"component_id": str(self._comp_id)}
+    def _on_message(self, msg_name: str, data: EncodedData) -> None:
+        with self._lock:
+            self._handle_message(msg_name, data)
+
+    def _on_batch(self, data: typing.Any) -> None:
+        with self._lock:
+            try:
+                messages = MessageBatcher.unbatch(data)
+            except ValueError as exc:
+                warning(
+                    f"Received an invalid message batch: {str(exc)}", scope="client"
+                )
+                return
+
+            for msg_name, msg_data in messages:
+                self._handle_message(msg_name, msg_data)
+
+    def _handle_message(self, msg_name: str, data: EncodedData) -> None:
+        if (
+            MessageCompressor.is_compressed(data)
+            and self._compression != Compression.ZLIB
+        ):
+            warning(
+                "Received a compressed message without having negotiated compression",
+                scope="client",
+            )
+            return
+
+        try:
+            data = self._compressor.decompress(data)
+        except ValueError as exc:
+            warning(f"Received an invalid message: {str(exc)}", scope="client")
+            return
+
+        if self._message_handler is not None:
+            self._message_handler(msg_name, data)
+
+    def _emit_batch(self, msg_name: str, data: typing.Any) -> None:
+        # Batches are sent by the scheduler, so the connection might have been closed in the meantime
+        if not self.connected:
+            raise ConnectionError("Not connected to the server")
+
+        import socketio.exceptions as sioexc
+
+        try:
+            self.emit(msg_name, data=data)
+        except sioexc.SocketIOError as exc:
+            raise ConnectionError(str(exc)) from exc
+
+    def _get_authentication(self) -> typing.Dict[str, typing.Any]:
+        auth: typing.Dict[str, typing.Any] = {"component_id": str(self._comp_id)}
+        if self._groups:
+            auth["groups"] = self._groups
+        if self._binary_encoding:
+            auth["wire_formats"] = [WireFormat.MSGPACK, WireFormat.JSON]
+        auth["compression"] = [Compression.ZLIB, Compression.NONE]
+        auth["batching"] = True
+        return auth
+
+    @property
+    def queue(self) -> OutboundQueue:
+        """
+        The queue of outgoing messages.
+        """
+        return self._queue
@@ -0,0 +1,12 @@
+from enum import StrEnum
+
+
+class Compression(StrEnum):
+    """
+    The compression methods that can be applied to messages sent across the network.
+
+    Compression is negotiated per connection when a client connects; web clients never use it.
+    """
+
+    NONE = "none"
+    ZLIB = "zlib"
@@ -0,0 +1,131 @@
+import dataclasses
+import typing
+
+from .message_compressor import MessageCompressor
+from .wire_format import WireFormat, EncodedData
+from .. import Message, MessageCodec
+
+
+class EncodedMessage:
+    """
+    A message that is about to be sent across the network, along with its encoded representations.
+
+    A single message may be sent to many recipients (through the server and the client, and to clients using different wire
+    formats). Encoding it is thus done lazily and at most once per wire format (and compressor); all connections share the same encoded
+    data.
+
+    Every message consists of its *envelope* (the fields of the ``Message`` base class, which are all that is needed for routing)
+    and its *payload* (all remaining fields). The wire formats lay them out as follows:
+
+    - *JSON*: A single object holding all fields of the message.
+    - *MessagePack*: An array of the envelope map and the separately encoded payload map (``[envelope, payload]``).
+
+    When relaying a received message, only its envelope is known as a ``Message`` object; the payload is then passed along as it was
+    received (see ``EncodedMessage.Payload``). As long as the wire format doesn't change, a relayed binary payload is never touched.
+
+    Notes:
+        An encoded message is meant to be used during a single routing step only and is not thread-safe; it may, however, be handed
+        over to another thread (such as the writer thread of the client) once the routing step is done.
+    """
+
+    ENVELOPE_FIELDS: typing.Final[typing.Tuple[str, ...]] = tuple(
+        field.name for field in dataclasses.fields(Message)
+    )
+
+    class Payload(typing.NamedTuple):
+        """
+        The payload of a received message that has not been decoded.
+
+        For *JSON*, the data is a dictionary of the (plain) payload field values; for *MessagePack*, it is the encoded payload map.
+        """
+
+        wire_format: WireFormat
+        data: typing.Dict[str, typing.Any] | bytes
+
+    def __init__(self, msg: Message, *, payload: Payload | None = None):
+        """
+        Args:
+            msg: The message to encode; if a payload is passed, only its envelope fields are used.
+            payload: The undecoded payload of a relayed message.
+        """
+        self._message = msg
+        self._payload = payload
+
+        self._encodings: typing.Dict[
+            typing.Tuple[WireFormat, MessageCompressor | None], EncodedData
+        ] = {}
+
+    def encode(
+        self, wire_format: WireFormat, compressor: MessageCompressor | None = None
+    ) -> EncodedData:
+        """
+        Gets the message encoded in the given wire format, encoding it if necessary.
+
+        Args:
+            wire_format: The wire format.
+            compressor: The compressor to compress the encoded message with (if it is large enough).
+
+        Returns:
+            The encoded message (a string for JSON, bytes for binary formats and compressed messages).
+        """
+        if (data := self._encodings.get((wire_format, compressor))) is None:
+            if compressor is not None:
+                data = compressor.compress(self.encode(wire_format))
+            elif wire_format == WireFormat.MSGPACK:
+                data = self._encode_binary()
+            else:
+                data = self._encode_json()
+
+            self._encodings[(wire_format, compressor)] = data
+
+        return data
+
+    def _encode_json(self) -> str:
+        if self._payload is None:
+            return MessageCodec.for_type(type(self._message)).encode(self._message)
+
+        fields = MessageCodec.for_type(Message).encode_object(self._message)
+        fields.update(
+            self._payload.data
+            if self._payload.wire_format == WireFormat.JSON
+            else MessageCodec.decode_binary_data(self._payload.data)
+        )
+        return MessageCodec.encode_data(fields)
+
+    def _encode_binary(self) -> bytes:
+        envelope = MessageCodec.for_type(Message).encode_object(self._message)
+
+        if self._payload is None:
+            fields = MessageCodec.for_type(type(self._message)).encode_object(
+                self._message
+            )
+            payload = MessageCodec.encode_binary_data(
+                {name: value for name, value in fields.items() if name not in envelope}
+            )
+        elif self._payload.wire_format == WireFormat.MSGPACK:
+            payload = self._payload.data
+        else:
+            payload = MessageCodec.encode_binary_data(self._payload.data)
+
+        return MessageCodec.encode_binary_data([envelope, payload])
+
+    @property
+    def message(self) -> Message:
+        """
+        The message (or only its envelope for relayed messages).
+        """
+        return self._message
+
+    @property
+    def payload(self) -> Payload | None:
+        """
+        The undecoded payload of a relayed message.
+        """
+        return self._payload
+
+    @property
+    def encoded_formats(self) -> typing.List[WireFormat]:
+        """
+        All wire formats the message has been encoded in so far.
+        """
+        return list(dict.fromkeys(wire_format for wire_format, _ in self._encodings))
@@ -0,0 +1,178 @@
+import threading
+import typing
+
+from .wire_format import EncodedData
+from ...scheduling import Scheduler, ScheduledTask
+
+BatchSender = typing.Callable[[str, typing.Any], None]
+
+
+class MessageBatcher:
+    """
+    Collects the outgoing messages of a single connection and sends them as one batch frame.
+
+    Messages are collected until either the maximum delay has passed since the first message of the batch has been added, or the
+    batch has reached its maximum size; the batch is then sent as a single ``BATCH_EVENT`` holding a list of ``[name, data]`` pairs.
+    If any of the messages is binary, the whole list is packed into a single *MessagePack* blob, as *socket.io* would otherwise transmit
+    each binary message as a separate attachment. Batches that only contain a single message are sent as a regular message instead. The
+    receiving side splits a batch frame into its messages again using ``unbatch``.
+
+    If the connection has been lost (i.e., sending a frame raises a ``ConnectionError``), the messages of the batch are kept; closing the
+    batcher then hands them back, so that they can be sent again once reconnected.
+
+    Notes:
+        Batchers are thread-safe; batches are always sent in the order their messages have been added.
+    """
+
+    BATCH_EVENT = "$batch"
+
+    def __init__(
+        self,
+        send: BatchSender,
+        scheduler: Scheduler,
+        *,
+        max_delay: float,
+        max_size: int,
+    ):
+        """
+        Args:
+            send: The function to send a frame (given its event name and data) through the connection; raises a ``ConnectionError`` if
+                the connection has been lost.
+            scheduler: The scheduler used to send batches once their delay has passed.
+            max_delay: The maximum time (in seconds) a message is held back.
+            max_size: The size (in bytes) of a batch that causes it to be sent immediately.
+        """
+        self._send = send
+        self._scheduler = scheduler
+
+        self._max_delay = max_delay
+        self._max_size = max_size
+
+        self._messages: typing.List[typing.List[typing.Any]] = []
+        self._sources: typing.List[typing.Any] = []
+        self._size = 0
+        self._flush_task: ScheduledTask | None = None
+        self._closed = False
+
+        self._lock = threading.Lock()
+
+    def add(self, msg_name: str, data: EncodedData, source: typing.Any = None) -> bool:
+        """
+        Adds a message to the current batch, sending the batch if it has become large enough.
+
+        Args:
+            msg_name: The name of the message.
+            data: The encoded message.
+            source: The original message, which is handed back if the message hasn't been sent when the batcher is closed.
+
+        Returns:
+            Whether the message was added; messages can't be added to a closed batcher.
+        """
+        with self._lock:
+            if self._closed:
+                return False
+
+            self._messages.append([msg_name, data])
+            self._sources.append(source)
+            self._size += len(data)
+
+            if self._size >= self._max_size:
+                self._send_batch()
+            elif self._flush_task is None:
+                self._flush_task = self._scheduler.schedule(
+                    self.flush, delay=self._max_delay
+                )
+
+            return True
+
+    def flush(self) -> None:
+        """
+        Sends the current batch (if any) immediately.
+        """
+        with self._lock:
+            self._send_batch()
+
+    def close(self) -> typing.List[typing.Any]:
+        """
+        Closes the batcher without sending the current batch.
+
+        Returns:
+            The sources (see ``add``) of all messages that haven't been sent, in the order they were added.
+        """
+        with self._lock:
+            sources = [source for source in self._sources if source is not None]
+
+            self._closed = True
+            self._reset()
+
+            return sources
+
+    def _send_batch(self) -> None:
+        messages = self._messages
+        sources = self._sources
+        size = self._size
+        self._reset()
+
+        try:
+            if len(messages) == 1:
+                self._send(messages[0][0], messages[0][1])
+            elif len(messages) > 1:
+                if any(isinstance(data, bytes) for _, data in messages):
+                    from .. import MessageCodec
+
+                    self._send(
+                        MessageBatcher.BATCH_EVENT,
+                        MessageCodec.encode_binary_data(messages),
+                    )
+                else:
+                    self._send(MessageBatcher.BATCH_EVENT, messages)
+        except ConnectionError:
+            # Keep the messages until the batcher is closed, which hands them back
+            self._messages = messages
+            self._sources = sources
+            self._size = size
+
+    def _reset(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+        self._messages = []
+        self._sources = []
+        self._size = 0
+
+    @staticmethod
+    def unbatch(data: typing.Any) -> typing.List[typing.Tuple[str, EncodedData]]:
+        """
+        Splits the data of a batch frame into its messages.
+
+        Args:
+            data: The batch frame data.
+
+        Returns:
+            A list of the names and data of all messages.
+
+        Raises:
+            ValueError: If the data is not a valid batch.
+        """
+        if isinstance(data, bytes):
+            from .. import MessageCodec
+
+            data = MessageCodec.decode_binary_data(data)
+
+        if not isinstance(data, list):
+            raise ValueError("Invalid message batch")
+
+        messages: typing.List[typing.Tuple[str, EncodedData]] = []
+        for entry in data:
+            if (
+                not isinstance(entry, list)
+                or len(entry) != 2
+                or not isinstance(entry[0], str)
+                or not isinstance(entry[1], (str, bytes))
+            ):
+                raise ValueError("Invalid message in batch")
+
+            messages.append((entry[0], entry[1]))
+
+        return messages
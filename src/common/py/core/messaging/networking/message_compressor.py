@@ -0,0 +1,164 @@
+import time
+import typing
+import zlib
+
+from .wire_format import EncodedData
+from ...metrics import default_registry
+
+
+class MessageCompressor:
+    """
+    Compresses (and decompresses) encoded messages using *zlib*.
+
+    Messages are only compressed if their encoded size reaches a threshold and compressing them actually reduces their size. A
+    compressed message is always sent as binary data, consisting of a marker byte (one that never starts a *MessagePack* message) followed
+    by the compressed data. Decompressing restores the original data: *JSON* messages (which always start with an opening brace) are
+    restored as strings, binary messages as bytes. As a small compressed message can expand into a huge one, the size of decompressed
+    messages can be limited.
+
+    The compressor records the number of bytes saved and the CPU time spent (de)compressing messages in the global metrics registry,
+    which helps tuning the threshold.
+
+    Notes:
+        Compressors are thread-safe.
+    """
+
+    _MARKER = b"\xc1"  # This byte is never used by MessagePack
+
+    _messages_total = default_registry().counter(
+        "rds_compression_messages_total",
+        "Number of messages by compression result (compressed, skipped, decompressed).",
+        ("result",),
+    )
+    _bytes_saved_total = default_registry().counter(
+        "rds_compression_bytes_saved_total",
+        "Number of bytes saved by compressing messages.",
+    )
+    _cpu_seconds_total = default_registry().counter(
+        "rds_compression_cpu_seconds_total",
+        "CPU time spent (de)compressing messages by operation (compress, decompress).",
+        ("operation",),
+    )
+
+    def __init__(
+        self,
+        threshold: int,
+        *,
+        level: int = zlib.Z_DEFAULT_COMPRESSION,
+        max_size: int = 0,
+    ):
+        """
+        Args:
+            threshold: The size (in bytes) an encoded message needs to reach to be compressed; set to 0 to never compress messages.
+            level: The *zlib* compression level.
+            max_size: The maximum size (in bytes) of decompressed messages; set to 0 for no limit.
+        """
+        self._threshold = threshold
+        self._level = level
+        self._max_size = max_size
+
+    def compress(self, data: EncodedData) -> EncodedData:
+        """
+        Compresses an encoded message if it is large enough.
+
+        Args:
+            data: The encoded message.
+
+        Returns:
+            The compressed message or the original data if it hasn't been compressed.
+        """
+        raw_data = data.encode("utf-8") if isinstance(data, str) else data
+        if not self.enabled or len(raw_data) < self._threshold:
+            return data
+
+        start = time.thread_time()
+        compressed_data = MessageCompressor._MARKER + zlib.compress(
+            raw_data, self._level
+        )
+        MessageCompressor._cpu_seconds_total.inc(
+            "compress", amount=time.thread_time() - start
+        )
+
+        if len(compressed_data) >= len(raw_data):
+            MessageCompressor._messages_total.inc("skipped")
+            return data
+
+        MessageCompressor._messages_total.inc("compressed")
+        MessageCompressor._bytes_saved_total.inc(
+            amount=len(raw_data) - len(compressed_data)
+        )
+        return compressed_data
+
+    def decompress(self, data: EncodedData) -> EncodedData:
+        """
+        Decompresses a message if it has been compressed.
+
+        Args:
+            data: The (possibly compressed) message.
+
+        Returns:
+            The decompressed message or the original data if it wasn't compressed.
+
+        Raises:
+            ValueError: If the compressed data is invalid or exceeds the maximum size when decompressed.
+        """
+        if not MessageCompressor.is_compressed(data):
+            return data
+
+        start = time.thread_time()
+        try:
+            # Decompressing stops once the maximum size has been reached, so oversized messages are never fully expanded
+            decompressor = zlib.decompressobj()
+            raw_data = decompressor.decompress(
+                typing.cast(bytes, data)[1:], self._max_size
+            )
+        except zlib.error as exc:
+            raise ValueError(f"Invalid compressed message: {str(exc)}") from exc
+        finally:
+            MessageCompressor._cpu_seconds_total.inc(
+                "decompress", amount=time.thread_time() - start
+            )
+
+        if not decompressor.eof:
+            if 0 < self._max_size <= len(raw_data):
+                raise ValueError(
+                    f"Compressed message exceeds the maximum size of {self._max_size} bytes"
+                )
+            raise ValueError("Invalid compressed message: Incomplete data")
+
+        MessageCompressor._messages_total.inc("decompressed")
+        return raw_data.decode("utf-8") if raw_data[:1] == b"{" else raw_data
+
+    @staticmethod
+    def is_compressed(data: EncodedData) -> bool:
+        """
+        Checks whether a message has been compressed.
+
+        Args:
+            data: The message.
+
+        Returns:
+            Whether the message has been compressed.
+        """
+        return isinstance(data, bytes) and data[:1] == MessageCompressor._MARKER
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether messages are compressed at all.
+        """
+        return self._threshold > 0
+
+    @property
+    def threshold(self) -> int:
+        """
+        The size (in bytes) an encoded message needs to reach to be compressed.
+        """
+        return self._threshold
+
+    @property
+    def max_size(self) -> int:
+        """
+        The maximum size (in bytes) of decompressed messages (0 if unlimited).
+        """
+        return self._max_size
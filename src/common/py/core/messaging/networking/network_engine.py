@@ -2,9 +2,11 @@ import dataclasses
 import typing
 
 from .client import Client
+from .encoded_message import EncodedMessage
 from .network_filter import NetworkFilter
 from .network_filters import NetworkFilters
 from .network_router import NetworkRouter
+from .received_message import ReceivedMessage
 from .server import Server
 from .. import Message, MessageBusProtocol, MessageType, Command, CommandReply, Event
 from ..meta import (
@@ -14,6 +16,7 @@ from ..meta import (
     CommandReplyMetaInformation,
     EventMetaInformation,
 )
+from ...metrics import default_registry
 from ....component import BackendComponentData
 from ....utils import UnitID
 
@@ -26,6 +29,12 @@ class NetworkEngine:
     The network engine takes care of listening to incoming messages, routing them properly, and sending new messages to other components.
     """
 
+    _messages_total = default_registry().counter(
+        "rds_messages_total",
+        "Number of messages by name and direction (local, in, out).",
+        ("message", "direction"),
+    )
+
     def __init__(
         self, comp_data: BackendComponentData, message_bus: MessageBusProtocol
     ):
@@ -72,6 +81,8 @@ class NetworkEngine:
             self._comp_data.comp_id,
             self._comp_data.config,
             MessageBuilder(self._comp_data.comp_id, self._message_bus),
+            scheduler=self._message_bus.scheduler,
+            groups=self._comp_data.groups,
         )
 
     def _create_server(self) -> Server:
@@ -81,6 +92,7 @@ class NetworkEngine:
             self._comp_data.comp_id,
             self._comp_data.config,
             MessageBuilder(self._comp_data.comp_id, self._message_bus),
+            scheduler=self._message_bus.scheduler,
         )
 
     def run(self) -> None:
@@ -113,6 +125,16 @@ class NetworkEngine:
         if self.has_client:
             self._client.process()
 
+    def set_deadline_callback(self, callback: typing.Callable[[float], None]) -> None:
+        """
+        Sets a callback that is invoked whenever a new deadline for the periodic tasks (see ``process``) arises.
+
+        Args:
+            callback: The callback to invoke with the (monotonic) deadline.
+        """
+        if self.has_server:
+            self._server.set_deadline_callback(callback)
+
     def send_message(self, msg: Message, msg_meta: MessageMetaInformation) -> None:
         """
         Sends a message across the network.
@@ -129,8 +151,9 @@ class NetworkEngine:
         except NetworkRouter.RoutingError as exc:
             self._routing_error(str(exc), message=str(msg))
         else:
+            NetworkEngine._messages_total.inc(msg.name, "out")
             self._route_message(
-                msg,
+                EncodedMessage(msg),
                 msg_meta,
                 NetworkRouter.Direction.OUT,
                 skip_components=[self._comp_data.comp_id],
@@ -147,65 +170,97 @@ class NetworkEngine:
         self._filters.install(fltr)
 
     def _handle_received_message(
-        self, entrypoint: MessageMetaInformation.Entrypoint, msg_name: str, data: str
+        self,
+        entrypoint: MessageMetaInformation.Entrypoint,
+        msg_name: str,
+        data: str | bytes,
     ) -> None:
         try:
-            msg = self._unpack_message(msg_name, data)
-            msg_meta = self._create_message_meta_information(msg, entrypoint)
+            received_msg = self._unpack_message(msg_name, data)
+            msg_meta = self._create_message_meta_information(
+                received_msg.message_type, entrypoint
+            )
         except Exception as exc:  # pylint: disable=broad-exception-caught
             self._routing_error(str(exc), data=data)
         else:
             from ...logging import debug
 
+            # Routing and filtering only rely on the envelope; the payload is only decoded once a local handler accesses it
+            envelope = received_msg.envelope
+
+            NetworkEngine._messages_total.inc(envelope.name, "in")
+
             debug(
-                f"Received message: {msg}", scope="network", entrypoint=entrypoint.name
+                f"Received message: {envelope}",
+                scope="network",
+                entrypoint=entrypoint.name,
             )
 
+            if self._router.check_echo(NetworkRouter.Direction.IN, envelope):
+                debug(
+                    f"Dropping message sent by this component: {envelope}",
+                    scope="network",
+                )
+                return
+
             con_type = (
                 NetworkFilter.ConnectionType.SERVER
                 if entrypoint == MessageMetaInformation.Entrypoint.SERVER
                 else NetworkFilter.ConnectionType.CLIENT
             )
 
-            if not self._filters.filter_incoming_message(con_type, msg, msg_meta):
+            if not self._filters.filter_incoming_message(con_type, envelope, msg_meta):
                 if self._router.check_local_routing(
-                    NetworkRouter.Direction.IN, msg, msg_meta
+                    NetworkRouter.Direction.IN, envelope, msg_meta
                 ):
-                    self._message_bus.dispatch(msg, msg_meta)
+                    self._dispatch_received_message(received_msg, msg_meta)
 
-                # Perform rerouting
-                msg = dataclasses.replace(msg, sender=self._comp_data.comp_id)
+                # Perform rerouting, passing the payload along as it was received; the message is never sent back to its sender
+                sender = envelope.sender
+                envelope = dataclasses.replace(envelope, sender=self._comp_data.comp_id)
                 self._route_message(
-                    msg,
+                    EncodedMessage(envelope, payload=received_msg.payload),
                     msg_meta,
                     NetworkRouter.Direction.IN,
-                    skip_components=[self._comp_data.comp_id, msg.sender],
+                    skip_components=[self._comp_data.comp_id, sender],
                 )
 
-    def _unpack_message(self, msg_name: str, data: str) -> Message:
-        # Look up the actual message via its name
+    def _unpack_message(self, msg_name: str, data: str | bytes) -> ReceivedMessage:
+        # Look up the actual message type via its name
         from .. import MessageTypesCatalog
 
         msg_type = MessageTypesCatalog.find_item(msg_name)
         if msg_type is None:
             raise RuntimeError(f"The message type '{msg_name}' is unknown")
 
-        # Unpack the message into its actual type
-        msg = typing.cast(Message, msg_type.schema().loads(data))
-        self._router.verify_message(NetworkRouter.Direction.IN, msg)
+        # Only unpack the envelope of the message; the payload is decoded on demand
+        received_msg = ReceivedMessage(msg_type, data)
+        self._router.verify_message(NetworkRouter.Direction.IN, received_msg.envelope)
+
+        received_msg.envelope.hops.append(self._comp_data.comp_id)
+        return received_msg
 
-        msg.hops.append(self._comp_data.comp_id)
-        return msg
+    def _dispatch_received_message(
+        self, received_msg: ReceivedMessage, msg_meta: MessageMetaInformation
+    ) -> None:
+        try:
+            msg = received_msg.decode()
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            self._routing_error(str(exc), message=str(received_msg.envelope))
+        else:
+            self._message_bus.dispatch(msg, msg_meta)
 
     def _route_message(
         self,
-        msg: Message,
+        encoded_msg: EncodedMessage,
         msg_meta: MessageMetaInformation,
         direction: NetworkRouter.Direction,
         *,
         skip_components: typing.List[UnitID] | None = None,
         apply_filter: bool = False,
     ) -> None:
+        # The message is encoded lazily and only once per wire format, even if it is sent through both the server and the client
+        msg = encoded_msg.message
         send_to_client = True
 
         if self._router.check_server_routing(direction, msg, msg_meta):
@@ -213,7 +268,9 @@ class NetworkEngine:
                 NetworkFilter.ConnectionType.SERVER, msg, msg_meta
             ):
                 send_to_client = (
-                    self._server.send_message(msg, skip_components=skip_components)
+                    self._server.send_message(
+                        encoded_msg, skip_components=skip_components
+                    )
                     == Server.SendTarget.SPREAD
                 )
 
@@ -223,13 +280,16 @@ class NetworkEngine:
             if not apply_filter or not self._filters.filter_outgoing_message(
                 NetworkFilter.ConnectionType.CLIENT, msg, msg_meta
             ):
-                self._client.send_message(msg)
+                self._client.send_message(encoded_msg)
 
     def _create_message_meta_information(
-        self, msg: Message, entrypoint: MessageMetaInformation.Entrypoint, **kwargs
+        self,
+        msg_type: type[Message],
+        entrypoint: MessageMetaInformation.Entrypoint,
+        **kwargs,
     ) -> MessageMetaInformation:
-        for msg_type, meta_type in self._meta_information_types.items():
-            if isinstance(msg, msg_type):
+        for base_type, meta_type in self._meta_information_types.items():
+            if issubclass(msg_type, base_type):
                 return meta_type(entrypoint=entrypoint, **kwargs)
 
         raise RuntimeError("No meta information type associated with message type")
@@ -239,6 +299,13 @@ class NetworkEngine:
 
         error(f"A routing error occurred: {msg}", scope="network", **kwargs)
 
+    @property
+    def next_deadline(self) -> float | None:
+        """
+        The monotonic time at which the periodic tasks (see ``process``) need to be performed next (if at all).
+        """
+        return self._server.next_deadline if self.has_server else None
+
     @property
     def has_server(self) -> bool:
         """
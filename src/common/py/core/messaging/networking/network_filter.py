@@ -7,6 +7,9 @@ from ..meta import MessageMetaInformation
 class NetworkFilter:
     """
     Filters incoming and outgoing network messages.
+
+    Filters only get to see the envelope of received (and relayed) messages, which is a plain ``Message`` holding its routing
+    information; the payload of such messages is not decoded for filtering.
     """
 
     class ConnectionType(IntEnum):
@@ -53,6 +53,8 @@ class NetworkRouter:
             self._verify_local_message(direction, msg)
         elif msg.target.is_direct:
             self._verify_direct_message(direction, msg)
+        elif msg.target.is_group:
+            self._verify_group_message(direction, msg)
 
     def check_local_routing(
         self, direction: Direction, msg: Message, msg_meta: MessageMetaInformation
@@ -78,6 +80,24 @@ class NetworkRouter:
 
         return False
 
+    def check_echo(self, direction: Direction, msg: Message) -> bool:
+        """
+        Checks if the message is a group or broadcast message that was originally sent by this component and came back through the
+        network; such messages have already been dispatched locally and must be dropped.
+
+        Args:
+            direction: The direction (*IN* or *OUT*) of the message.
+            msg: The actual message.
+
+        Returns:
+            Whether the message is an echo.
+        """
+        return (
+            direction == NetworkRouter.Direction.IN
+            and (msg.target.is_group or msg.target.is_broadcast)
+            and msg.origin.equals(self._comp_id)
+        )
+
     def check_client_routing(
         self, direction: Direction, msg: Message, msg_meta: MessageMetaInformation
     ) -> bool:
@@ -150,3 +170,7 @@ class NetworkRouter:
                 raise NetworkRouter.RoutingError(
                     "Direct message to this component sent through the network engine"
                 )
+
+    def _verify_group_message(self, direction: Direction, msg: Message) -> None:
+        if not msg.target.target:
+            raise NetworkRouter.RoutingError("Group message without a group received")
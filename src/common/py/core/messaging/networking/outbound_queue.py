@@ -0,0 +1,349 @@
+import collections
+import dataclasses
+import itertools
+import threading
+import time
+import typing
+from enum import StrEnum
+
+from .encoded_message import EncodedMessage
+from .. import Message
+
+OutboundWriter = typing.Callable[[EncodedMessage], bool]
+
+
+class OutboundQueue:
+    """
+    A bounded queue of outgoing messages that is drained by a dedicated writer thread.
+
+    Messages are put into the queue by the emitting threads, which thus never wait for the connection; the writer thread then passes
+    them on to the actual connection in the order they were queued. While the queue is *paused* (i.e., the connection is down), messages
+    are buffered and written once the queue is resumed. If writing a message fails (e.g., as the connection has just been lost), the
+    message is put back to the front of the queue and the queue pauses until it is resumed again. Messages that have been written but
+    not actually sent before the connection was lost (e.g., as they were still being batched) can be put back as well (see ``requeue``).
+
+    What happens to a message if the queue is full depends on the drop policy of its type (see ``set_drop_policy``):
+
+    - *KEEP*: The message is never dropped in favor of other messages. If the queue is full and no droppable message can be evicted
+      to make room for it, the message is rejected.
+    - *DROP_STALE*: The oldest such message is evicted if the queue is full, and such messages that have been queued for longer than
+      the stale timeout are discarded instead of being written.
+
+    Notes:
+        The queue is thread-safe.
+    """
+
+    class DropPolicy(StrEnum):
+        """
+        Whether queued messages may be dropped.
+        """
+
+        KEEP = "keep"
+        DROP_STALE = "drop_stale"
+
+    class DropReason(StrEnum):
+        """
+        Why a message has been dropped.
+        """
+
+        OVERFLOW = "overflow"
+        STALE = "stale"
+
+    @dataclasses.dataclass(frozen=True)
+    class _Entry:
+        sequence: int
+        message: EncodedMessage
+        policy: "OutboundQueue.DropPolicy"
+        timestamp: float = dataclasses.field(default_factory=time.monotonic)
+
+    def __init__(
+        self,
+        writer: OutboundWriter,
+        *,
+        max_size: int,
+        stale_timeout: float,
+        name: str = "OutboundQueue",
+    ):
+        """
+        Args:
+            writer: The function writing a message to the connection; returns whether the message could be written.
+            max_size: The maximum number of queued messages; 0 for an unbounded queue.
+            stale_timeout: The time (in seconds) after which droppable messages are discarded instead of written; 0 to disable.
+            name: The name of the writer thread.
+        """
+        self._writer = writer
+        self._name = name
+
+        self._max_size = max_size
+        self._stale_timeout = stale_timeout
+
+        self._drop_policies: typing.Dict[type[Message], OutboundQueue.DropPolicy] = {}
+
+        # Messages that may and may not be dropped are kept separately, so that evicting a droppable message never requires a scan; the
+        # sequence numbers restore the overall order when writing
+        self._kept: typing.Deque[OutboundQueue._Entry] = collections.deque()
+        self._droppable: typing.Deque[OutboundQueue._Entry] = collections.deque()
+        self._sequence = itertools.count()
+        self._requeue_sequence = itertools.count(-1, -1)
+
+        self._paused = True
+        self._generation = 0
+        self._running = False
+        self._thread: threading.Thread | None = None
+
+        self._max_depth = 0
+        self._written_count = 0
+        self._rejected_count = 0
+        self._dropped_counts: typing.Dict[OutboundQueue.DropReason, int] = {
+            reason: 0 for reason in OutboundQueue.DropReason
+        }
+
+        self._condition = threading.Condition()
+
+    def set_drop_policy(self, msg_type: type[Message], policy: DropPolicy) -> None:
+        """
+        Sets the drop policy of a message type; it also applies to all derived types that don't have their own policy. Messages of types
+        without any policy are kept.
+
+        Args:
+            msg_type: The message type.
+            policy: The drop policy.
+        """
+        with self._condition:
+            self._drop_policies[msg_type] = policy
+
+    def put(self, msg: EncodedMessage) -> bool:
+        """
+        Adds a message to the queue.
+
+        Args:
+            msg: The message to add.
+
+        Returns:
+            Whether the message was queued; this fails if the queue is full of messages that may not be dropped.
+        """
+        with self._condition:
+            entry = OutboundQueue._Entry(
+                next(self._sequence), msg, self._get_drop_policy(type(msg.message))
+            )
+
+            if 0 < self._max_size <= self.depth:
+                if len(self._droppable) > 0:
+                    self._droppable.popleft()
+                    self._dropped_counts[OutboundQueue.DropReason.OVERFLOW] += 1
+                elif entry.policy == OutboundQueue.DropPolicy.DROP_STALE:
+                    self._dropped_counts[OutboundQueue.DropReason.OVERFLOW] += 1
+                    return True
+                else:
+                    self._rejected_count += 1
+                    return False
+
+            self._entries(entry.policy).append(entry)
+            self._max_depth = max(self._max_depth, self.depth)
+
+            if not self._paused:
+                self._condition.notify()
+
+            return True
+
+    def requeue(self, messages: typing.Sequence[EncodedMessage]) -> None:
+        """
+        Puts messages that have already been written back to the front of the queue, keeping their order. These messages are never
+        rejected, even if the queue is full.
+
+        Args:
+            messages: The messages to put back, oldest first.
+        """
+        with self._condition:
+            # Requeued messages precede all queued ones, so they are numbered downwards
+            for msg in reversed(messages):
+                entry = OutboundQueue._Entry(
+                    next(self._requeue_sequence),
+                    msg,
+                    self._get_drop_policy(type(msg.message)),
+                )
+                self._entries(entry.policy).appendleft(entry)
+
+            self._max_depth = max(self._max_depth, self.depth)
+
+            if not self._paused:
+                self._condition.notify()
+
+    def pause(self) -> None:
+        """
+        Stops writing messages; new messages are buffered until the queue is resumed.
+        """
+        with self._condition:
+            self._paused = True
+            self._generation += 1
+
+    def resume(self) -> None:
+        """
+        Writes all buffered messages and continues writing new ones.
+        """
+        with self._condition:
+            self._paused = False
+            self._generation += 1
+            self._condition.notify()
+
+    def start(self) -> None:
+        """
+        Starts the writer thread.
+        """
+        with self._condition:
+            if self._running:
+                return
+
+            self._running = True
+            self._thread = threading.Thread(
+                target=self._run, name=self._name, daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the writer thread; queued messages are kept.
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._running and (self._paused or self.depth == 0):
+                    self._condition.wait()
+
+                if not self._running:
+                    return
+
+                entry = self._pop_entry()
+                generation = self._generation
+
+            if self._is_stale(entry):
+                with self._condition:
+                    self._dropped_counts[OutboundQueue.DropReason.STALE] += 1
+                continue
+
+            written = self._write(entry)
+
+            with self._condition:
+                if written:
+                    self._written_count += 1
+                else:
+                    # Retry the message once the connection is back; the queue might have been paused and resumed in the meantime
+                    self._reinsert(entry)
+                    if generation == self._generation:
+                        self._paused = True
+
+    def _write(self, entry: _Entry) -> bool:
+        try:
+            return self._writer(entry.message)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            from ...logging import error
+
+            error(
+                f"Unable to write message: {str(exc)}",
+                scope="client",
+                message=str(entry.message.message),
+            )
+
+            # The message is broken, so retrying it makes no sense
+            return True
+
+    def _reinsert(self, entry: _Entry) -> None:
+        # Messages requeued in the meantime were older than the entry, so they need to stay in front of it
+        entries = self._entries(entry.policy)
+
+        index = 0
+        while index < len(entries) and entries[index].sequence < entry.sequence:
+            index += 1
+
+        entries.insert(index, entry)
+
+    def _pop_entry(self) -> _Entry:
+        if len(self._kept) == 0:
+            return self._droppable.popleft()
+        if len(self._droppable) == 0:
+            return self._kept.popleft()
+
+        return (
+            self._kept.popleft()
+            if self._kept[0].sequence < self._droppable[0].sequence
+            else self._droppable.popleft()
+        )
+
+    def _is_stale(self, entry: _Entry) -> bool:
+        return (
+            entry.policy == OutboundQueue.DropPolicy.DROP_STALE
+            and self._stale_timeout > 0.0
+            and time.monotonic() - entry.timestamp > self._stale_timeout
+        )
+
+    def _entries(self, policy: DropPolicy) -> typing.Deque[_Entry]:
+        return (
+            self._droppable
+            if policy == OutboundQueue.DropPolicy.DROP_STALE
+            else self._kept
+        )
+
+    def _get_drop_policy(self, msg_type: type[Message]) -> DropPolicy:
+        for base_type in msg_type.__mro__:
+            if (policy := self._drop_policies.get(base_type)) is not None:
+                return policy
+
+        return OutboundQueue.DropPolicy.KEEP
+
+    @property
+    def max_size(self) -> int:
+        """
+        The maximum number of queued messages (0 if unbounded).
+        """
+        return self._max_size
+
+    @property
+    def depth(self) -> int:
+        """
+        The number of messages currently queued.
+        """
+        return len(self._kept) + len(self._droppable)
+
+    @property
+    def max_depth(self) -> int:
+        """
+        The highest number of messages that have been queued at the same time.
+        """
+        return self._max_depth
+
+    @property
+    def is_paused(self) -> bool:
+        """
+        Whether writing messages is paused.
+        """
+        return self._paused
+
+    @property
+    def written_count(self) -> int:
+        """
+        The total number of written messages.
+        """
+        return self._written_count
+
+    @property
+    def rejected_count(self) -> int:
+        """
+        The total number of messages rejected due to a full queue.
+        """
+        return self._rejected_count
+
+    def dropped_count(self, reason: DropReason) -> int:
+        """
+        Gets the total number of messages dropped for the given reason.
+
+        Args:
+            reason: The drop reason.
+
+        Returns:
+            The number of dropped messages.
+        """
+        return self._dropped_counts[reason]
@@ -0,0 +1,118 @@
+import json
+import typing
+
+from .encoded_message import EncodedMessage
+from .wire_format import WireFormat, EncodedData
+from .. import Message, MessageCodec
+
+
+class ReceivedMessage:
+    """
+    A message received from the network of which only the envelope has been decoded.
+
+    Routing, filtering and verifying a message only require its envelope (see ``EncodedMessage``), so the payload is left undecoded
+    until the full message is actually needed, which is only the case when it is dispatched locally (and even then, its fields are only
+    decoded once they are accessed). Messages that are merely relayed pass their payload along as it is.
+
+    Notes:
+        Binary data is always expected to use the *MessagePack* wire format.
+    """
+
+    _ENVELOPE_FIELDS = frozenset(EncodedMessage.ENVELOPE_FIELDS)
+
+    def __init__(self, msg_type: type[Message], data: EncodedData):
+        """
+        Args:
+            msg_type: The type of the message.
+            data: The encoded message.
+
+        Raises:
+            ValueError: If the data is invalid.
+        """
+        self._message_type = msg_type
+
+        if isinstance(data, bytes):
+            frame = MessageCodec.decode_binary_data(data)
+            if (
+                not isinstance(frame, list)
+                or len(frame) != 2
+                or not isinstance(frame[0], dict)
+                or not isinstance(frame[1], bytes)
+            ):
+                raise ValueError("Invalid binary message frame")
+
+            envelope_fields = frame[0]
+            self._payload = EncodedMessage.Payload(WireFormat.MSGPACK, frame[1])
+        else:
+            fields = json.loads(data)
+            if not isinstance(fields, dict):
+                raise ValueError(f"Invalid message data: {data}")
+
+            envelope_fields = {}
+            payload_fields = {}
+            for name, value in fields.items():
+                if name in ReceivedMessage._ENVELOPE_FIELDS:
+                    envelope_fields[name] = value
+                else:
+                    payload_fields[name] = value
+            self._payload = EncodedMessage.Payload(WireFormat.JSON, payload_fields)
+
+        self._envelope = typing.cast(
+            Message, MessageCodec.for_type(Message).decode_object(envelope_fields)
+        )
+
+    def decode(self) -> Message:
+        """
+        Decodes the full message.
+
+        The envelope fields are taken from the (already decoded) envelope, so any changes made to it are reflected in the message.
+        The payload fields are decoded lazily, i.e., only when they are first accessed (see ``MessageCodec.decode_lazy``); messages
+        that end up not being handled (or only read their envelope) are thus never fully decoded.
+
+        Returns:
+            The decoded message.
+
+        Raises:
+            ValueError: If the data is invalid.
+        """
+        fields = (
+            self._payload.data
+            if self._payload.wire_format == WireFormat.JSON
+            else MessageCodec.decode_binary_data(self._payload.data)
+        )
+        if not isinstance(fields, dict):
+            raise ValueError("Invalid message payload")
+
+        envelope_values = {
+            name: getattr(self._envelope, name)
+            for name in EncodedMessage.ENVELOPE_FIELDS
+        }
+        envelope_values["hops"] = list(self._envelope.hops)
+
+        return typing.cast(
+            Message,
+            MessageCodec.for_type(self._message_type).decode_lazy(
+                fields, values=envelope_values
+            ),
+        )
+
+    @property
+    def message_type(self) -> type[Message]:
+        """
+        The type of the message.
+        """
+        return self._message_type
+
+    @property
+    def envelope(self) -> Message:
+        """
+        The message envelope, consisting of all fields of the ``Message`` base class.
+        """
+        return self._envelope
+
+    @property
+    def payload(self) -> EncodedMessage.Payload:
+        """
+        The undecoded payload.
+        """
+        return self._payload
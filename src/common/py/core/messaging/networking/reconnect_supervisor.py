@@ -0,0 +1,177 @@
+import random
+import threading
+import time
+import typing
+
+ConnectFunction = typing.Callable[[], None]
+ReconnectCallback = typing.Callable[[float], None]
+
+
+class ReconnectSupervisor:
+    """
+    Re-establishes a lost (or never established) connection in the background.
+
+    Once a reconnect has been requested (see ``request_reconnect``), the supervisor keeps on attempting to connect until the connection
+    has been established (see ``connection_established``). The attempts are spaced using exponential backoff with *full jitter*: Before
+    the n-th attempt (starting at 0), the supervisor waits a random time between 0 and ``min(max_delay, base_delay * 2^n)``.
+    Randomizing the entire delay spreads the attempts of many clients that lost their connections at the same time (e.g., due to a
+    server restart) evenly across the backoff window, instead of having all of them reconnect in lockstep.
+
+    Connection attempts block, so they are made from a dedicated thread.
+
+    Notes:
+        The supervisor is thread-safe.
+    """
+
+    def __init__(
+        self,
+        connect: ConnectFunction,
+        *,
+        base_delay: float,
+        max_delay: float,
+        on_reconnected: ReconnectCallback | None = None,
+        name: str = "ReconnectSupervisor",
+    ):
+        """
+        Args:
+            connect: The function making a single connection attempt.
+            base_delay: The maximum delay (in seconds) before the first attempt.
+            max_delay: The maximum delay (in seconds) between two attempts.
+            on_reconnected: Called with the time (in seconds) it took to re-establish the connection after a reconnect was requested.
+            name: The name of the supervisor thread.
+        """
+        self._connect = connect
+        self._on_reconnected = on_reconnected
+        self._name = name
+
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+
+        self._requested_at: float | None = None
+        self._attempt_count = 0
+        self._total_attempt_count = 0
+
+        self._running = False
+        self._thread: threading.Thread | None = None
+
+        self._condition = threading.Condition()
+
+    def request_reconnect(self) -> None:
+        """
+        Requests the connection to be re-established; does nothing if a reconnect is already in progress.
+        """
+        with self._condition:
+            if self._requested_at is None:
+                self._requested_at = time.monotonic()
+                self._attempt_count = 0
+                self._condition.notify_all()
+
+    def connection_established(self) -> None:
+        """
+        Reports that the connection has been established, ending a pending reconnect.
+        """
+        with self._condition:
+            if (requested_at := self._requested_at) is None:
+                return
+
+            self._requested_at = None
+            self._condition.notify_all()
+
+        if self._on_reconnected is not None:
+            self._on_reconnected(time.monotonic() - requested_at)
+
+    def cancel_reconnect(self) -> None:
+        """
+        Cancels a pending reconnect; an attempt that is already being made is not aborted.
+        """
+        with self._condition:
+            self._requested_at = None
+            self._condition.notify_all()
+
+    def start(self) -> None:
+        """
+        Starts the supervisor thread.
+        """
+        with self._condition:
+            if self._running:
+                return
+
+            self._running = True
+            self._thread = threading.Thread(
+                target=self._run, name=self._name, daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the supervisor thread; pending reconnects are kept.
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._wait_for_attempt():
+                    return
+
+                self._attempt_count += 1
+                self._total_attempt_count += 1
+
+            self._connect()
+
+    def _wait_for_attempt(self) -> bool:
+        while self._running:
+            if self._requested_at is None:
+                self._condition.wait()
+                continue
+
+            # Wait for the backoff delay; a cancelled request or stopping the supervisor ends the wait early
+            requested_at = self._requested_at
+            deadline = time.monotonic() + self.next_delay()
+
+            while (
+                self._running
+                and self._requested_at == requested_at
+                and (remaining := deadline - time.monotonic()) > 0.0
+            ):
+                self._condition.wait(remaining)
+
+            if self._running and self._requested_at == requested_at:
+                return True
+
+        return False
+
+    def next_delay(self) -> float:
+        """
+        Randomly picks the delay (in seconds) before the next attempt.
+
+        Returns:
+            The delay.
+        """
+        backoff = min(
+            self._max_delay, self._base_delay * 2 ** min(self._attempt_count, 32)
+        )
+        return random.uniform(0.0, backoff)
+
+    @property
+    def is_reconnecting(self) -> bool:
+        """
+        Whether a reconnect is in progress.
+        """
+        return self._requested_at is not None
+
+    @property
+    def attempt_count(self) -> int:
+        """
+        The number of attempts made during the current (or last) reconnect.
+        """
+        return self._attempt_count
+
+    @property
+    def total_attempt_count(self) -> int:
+        """
+        The total number of attempts made.
+        """
+        return self._total_attempt_count
@@ -1,4 +1,7 @@
+import collections
 import dataclasses
+import heapq
+import itertools
 import threading
 import time
 import typing
@@ -6,20 +9,61 @@ from enum import IntEnum, auto
 
 import socketio
 
-from .. import Message
+from .compression import Compression
+from .encoded_message import EncodedMessage
+from .message_batcher import MessageBatcher
+from .message_compressor import MessageCompressor
+from .wire_format import WireFormat, EncodedData
+from .. import Channel, Message
 from ..composers import MessageBuilder
 from ...logging import info, warning, debug
+from ...scheduling import Scheduler
 from ....utils import UnitID
 from ....utils.config import Configuration
 
-ServerMessageHandler = typing.Callable[[str, str], None]
+ServerMessageHandler = typing.Callable[[str, EncodedData], None]
+DeadlineCallback = typing.Callable[[float], None]
 
 
 class Server(socketio.Server):
     """
     The server connection, based on ``socketio.Server``.
+
+    Clients can offer the binary *MessagePack* wire format, compression and batching when connecting (through their authentication
+    data); if enabled, the server accepts such offers and sends all messages to these clients in binary form, compressing large ones and
+    batching them (see ``MessageBatcher``). The negotiated settings are announced to such clients right away using the ``NEGOTIATION_EVENT``.
+    All other clients (like web clients) receive uncompressed *JSON*. Incoming batches are split up, and incoming messages are decompressed
+    if necessary and decoded depending on whether they are text or binary.
+
+    Each client that doesn't use batching is put into a room of its encoding (wire format and compression), so that broadcasts are
+    encoded once per encoding; messages to clients using batching are added to their batches individually. Likewise, such clients join
+    a room per encoding for each group they belong to (the group of their component type and the named groups they announce when
+    connecting), so that sending a message to a group channel only takes a single emit per encoding in use.
+
+    Notes:
+        The server lock only guards its client registry and is held as briefly as possible; encoding and emitting messages, as well as
+        handling incoming ones, always happens outside of it.
     """
 
+    NEGOTIATION_EVENT = "$negotiation"
+
+    class _Encoding(typing.NamedTuple):
+        wire_format: WireFormat = WireFormat.JSON
+        compression: Compression = Compression.NONE
+
+        @property
+        def room(self) -> str:
+            """
+            The room of all clients using this encoding.
+            """
+            return f"encoding:{self.wire_format}+{self.compression}"
+
+        def group_room(self, group: str) -> str:
+            """
+            Gets the room of all clients of a group using this encoding.
+            """
+            return f"{self.room}/group:{group}"
+
     class SendTarget(IntEnum):
         """
         Enum telling whether an outgoing message is only sent to a single (direct) target or spread across all connected clients.
@@ -28,36 +72,68 @@ class Server(socketio.Server):
         SPREAD = auto()
         DIRECT = auto()
 
+    class _Recipient(typing.NamedTuple):
+        sid: str
+        encoding: "Server._Encoding"
+        batcher: MessageBatcher | None
+
     @dataclasses.dataclass()
     class _ComponentEntry:
         sid: str
 
         timeout: float = 0.0
-        last_activity: float = dataclasses.field(default_factory=time.time)
+        last_activity: float = dataclasses.field(default_factory=time.monotonic)
+
+        @property
+        def deadline(self) -> float:
+            """
+            The monotonic time at which the connected component times out.
+            """
+            return self.last_activity + self.timeout
 
         def has_timed_out(self) -> bool:
             """
             Whether the connected component has timed out.
             """
-            return (
-                time.time() - self.last_activity > self.timeout
-                if self.timeout > 0.0
-                else False
-            )
+            return time.monotonic() > self.deadline if self.timeout > 0.0 else False
+
+    # Activity timestamps are only refreshed if they are older than this (in seconds), so bursts of messages do not rewrite them constantly
+    _ACTIVITY_GRANULARITY = 1.0
 
     def __init__(
-        self, comp_id: UnitID, config: Configuration, message_builder: MessageBuilder
+        self,
+        comp_id: UnitID,
+        config: Configuration,
+        message_builder: MessageBuilder,
+        *,
+        scheduler: Scheduler,
     ):
         """
         Args:
             comp_id: The component identifier.
             config: The global configuration.
             message_builder: A message builder to use.
+            scheduler: The scheduler used to send message batches.
         """
         self._comp_id = comp_id
         self._config = config
 
         self._message_builder = message_builder
+        self._scheduler = scheduler
+
+        from ....settings import NetworkServerSettingIDs
+
+        self._binary_encoding: bool = self._config.value(
+            NetworkServerSettingIDs.BINARY_ENCODING
+        )
+        self._compressor = MessageCompressor(
+            self._config.value(NetworkServerSettingIDs.COMPRESSION_THRESHOLD),
+            max_size=self._config.value(NetworkServerSettingIDs.MAX_DECOMPRESSED_SIZE),
+        )
+        self._batch_delay: float = self._config.value(
+            NetworkServerSettingIDs.BATCH_DELAY
+        )
+        self._batch_size: int = self._config.value(NetworkServerSettingIDs.BATCH_SIZE)
 
         super().__init__(
             async_mode="gevent",
@@ -65,17 +141,33 @@ class Server(socketio.Server):
             cors_credentials=True,
         )
 
+        # Connected components are indexed in both directions, as incoming messages need to be mapped to their components as well
         self._connected_components: typing.Dict[UnitID, Server._ComponentEntry] = {}
+        self._client_components: typing.Dict[str, UnitID] = {}
+        self._client_encodings: typing.Dict[str, Server._Encoding] = {}
+        self._client_batchers: typing.Dict[str, MessageBatcher] = {}
+        self._client_groups: typing.Dict[str, typing.FrozenSet[str]] = {}
+
+        # The number of clients in each room, so that messages are only encoded for encodings that are actually in use
+        self._room_sizes: typing.Counter[str] = collections.Counter()
+
+        # Components with an idle timeout are additionally kept in a min-heap ordered by their (possibly outdated) deadlines
+        self._deadlines: typing.List[
+            typing.Tuple[float, int, UnitID, Server._ComponentEntry]
+        ] = []
+        self._counter = itertools.count()
 
         self._message_handler: ServerMessageHandler | None = None
+        self._deadline_callback: DeadlineCallback | None = None
 
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
 
         self._connect_events()
 
     def _connect_events(self) -> None:
         self.on("connect", self._on_connect)
         self.on("disconnect", self._on_disconnect)
+        self.on(MessageBatcher.BATCH_EVENT, self._on_batch)
         self.on("*", self._on_message)
 
     def set_message_handler(self, msg_handler: ServerMessageHandler) -> None:
@@ -87,6 +179,16 @@ class Server(socketio.Server):
         """
         self._message_handler = msg_handler
 
+    def set_deadline_callback(self, callback: DeadlineCallback | None) -> None:
+        """
+        Sets a callback that is invoked with the idle deadline of each newly connected component (that is subject to the idle timeout),
+        so that purging timed out components can be scheduled accordingly.
+
+        Args:
+            callback: The callback to invoke.
+        """
+        self._deadline_callback = callback
+
     def run(self) -> None:
         """
         So far, does exactly nothing.
@@ -97,91 +199,187 @@ class Server(socketio.Server):
         Periodically purges timed out clients.
         """
         with self._lock:
-            for timed_out_component in self._find_timed_out_components():
-                if timed_out_component in self._connected_components:
-                    debug(
-                        "Component timed out, disconnecting",
-                        scope="server",
-                        component=str(timed_out_component),
-                        timeout=self._connected_components[timed_out_component].timeout,
-                    )
+            timed_out_components = [
+                (comp_id, self._connected_components[comp_id])
+                for comp_id in self._find_timed_out_components()
+            ]
+
+        for comp_id, entry in timed_out_components:
+            debug(
+                "Component timed out, disconnecting",
+                scope="server",
+                component=str(comp_id),
+                timeout=entry.timeout,
+            )
 
-                    self.disconnect(
-                        self._connected_components[timed_out_component].sid
-                    )  # This will trigger _on_disconnect, removing the client from the connected components
+            self.disconnect(
+                entry.sid
+            )  # This will trigger _on_disconnect, removing the client from the connected components
 
     def send_message(
-        self, msg: Message, *, skip_components: typing.List[UnitID] | None = None
+        self,
+        encoded_msg: EncodedMessage,
+        *,
+        skip_components: typing.List[UnitID] | None = None,
     ) -> SendTarget:
         """
         Sends a message to one or more clients.
 
-        For this, the message will be encoded as *JSON* first.
+        For this, the message will be encoded (and compressed) according to the encoding of each recipient first; it is encoded at most
+        once per encoding, regardless of the number of recipients.
 
         Args:
-            msg: The message to send.
+            encoded_msg: The message to send.
             skip_components: A list of components (clients) to be excluded from the targets.
         """
-        with self._lock:
-            debug(f"Sending message: {msg}", scope="server")
+        msg = encoded_msg.message
+
+        debug(f"Sending message: {msg}", scope="server")
 
+        # Only the recipients are determined while holding the lock
+        with self._lock:
             if msg.target.is_direct and msg.target.target_id is not None:
                 self._timestamp_component(msg.target.target_id)
 
             send_to = self._get_message_recipient(msg)
+            skip_sids = self._component_ids_to_clients(skip_components)
+
+            room_encodings: typing.Dict[Server._Encoding, str] = {}
+            recipients: typing.List[Server._Recipient] = []
+
+            if send_to is not None:
+                if skip_sids is None or send_to not in skip_sids:
+                    recipients.append(self._get_recipient(send_to))
+            else:
+                room_encodings = self._get_room_encodings(msg.target)
+                recipients = [
+                    self._get_recipient(sid)
+                    for sid in self._client_batchers
+                    if (skip_sids is None or sid not in skip_sids)
+                    and (
+                        not msg.target.is_group
+                        or msg.target.target in self._client_groups.get(sid, ())
+                    )
+                ]
+
+        for encoding, room in room_encodings.items():
             self.emit(
                 msg.name,
-                data=msg.to_json(),
-                to=send_to,
-                skip_sid=self._component_ids_to_clients(skip_components),
-            )
-            return (
-                Server.SendTarget.DIRECT
-                if msg.target.is_direct and send_to is not None
-                else Server.SendTarget.SPREAD
+                data=self._encode_message(encoded_msg, encoding),
+                to=room,
+                skip_sid=skip_sids,
             )
 
+        for recipient in recipients:
+            self._send_to_recipient(encoded_msg, recipient)
+
+        return (
+            Server.SendTarget.DIRECT
+            if msg.target.is_direct and send_to is not None
+            else Server.SendTarget.SPREAD
+        )
+
     def _on_connect(self, sid: str, _, auth: typing.Dict[str, typing.Any]) -> None:
+        try:
+            comp_id = UnitID.from_string(auth["component_id"])
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            import socketio.exceptions as sioexc
+
+            raise sioexc.ConnectionRefusedError(
+                f"The client {sid} did not provide proper authorization"
+            ) from exc
+
+        from ....settings import NetworkServerSettingIDs
+        from ....component import ComponentType
+
+        encoding = Server._Encoding(
+            self._negotiate_wire_format(auth), self._negotiate_compression(auth)
+        )
+
+        # Incoming batches can always be split up, so the offer is accepted even if the server doesn't batch messages itself
+        batching = auth.get("batching", False) is True
+        batcher = (
+            MessageBatcher(
+                lambda name, data: self.emit(name, data=data, to=sid),
+                self._scheduler,
+                max_delay=self._batch_delay,
+                max_size=self._batch_size,
+            )
+            if batching and self._batch_delay > 0.0
+            else None
+        )
+
+        groups = self._get_client_groups(comp_id, auth)
+
+        if batcher is None:
+            self.enter_room(sid, encoding.room)
+            for group in groups:
+                self.enter_room(sid, encoding.group_room(group))
+
+        # Only clients that made an offer know how to handle the negotiation event; it is sent before the client is registered, so
+        # that no other messages can precede it
+        if "wire_formats" in auth or "compression" in auth or "batching" in auth:
+            self.emit(
+                Server.NEGOTIATION_EVENT,
+                {
+                    "wire_format": encoding.wire_format,
+                    "compression": encoding.compression,
+                    "batching": batching,
+                },
+                to=sid,
+            )
+
+        entry = Server._ComponentEntry(
+            sid,
+            timeout=self._config.value(NetworkServerSettingIDs.IDLE_TIMEOUT)
+            if comp_id.type == ComponentType.WEB
+            else 0.0,
+        )
+
         with self._lock:
-            try:
-                comp_id = UnitID.from_string(auth["component_id"])
-            except Exception as exc:  # pylint: disable=broad-exception-caught
-                import socketio.exceptions as sioexc
-
-                raise sioexc.ConnectionRefusedError(
-                    f"The client {sid} did not provide proper authorization"
-                ) from exc
-
-            if comp_id in self._connected_components:
-                warning(
-                    f"A component with the ID {comp_id} has already been connected to the server",
-                    scope="server",
-                )
-
-            if self._purge_client(sid):
-                warning(
-                    f"A client with the SID {sid} has already been connected to the server",
-                    scope="server",
-                )
-
-            from ....settings import NetworkServerSettingIDs
-            from ....component import ComponentType
-
-            self._connected_components[comp_id] = Server._ComponentEntry(
-                sid,
-                timeout=self._config.value(NetworkServerSettingIDs.IDLE_TIMEOUT)
-                if comp_id.type == ComponentType.WEB
-                else 0.0,
+            comp_connected = comp_id in self._connected_components
+            client_connected = self._purge_client(sid)
+
+            self._client_encodings[sid] = encoding
+            self._client_groups[sid] = groups
+            if batcher is not None:
+                self._client_batchers[sid] = batcher
+            else:
+                self._update_room_sizes(encoding, groups, 1)
+
+            self._register_client(sid, comp_id, entry)
+
+        if comp_connected:
+            warning(
+                f"A component with the ID {comp_id} has already been connected to the server",
+                scope="server",
             )
 
-            from .. import Channel
-            from ....api.network import ServerConnectedEvent
+        if client_connected:
+            warning(
+                f"A client with the SID {sid} has already been connected to the server",
+                scope="server",
+            )
 
-            ServerConnectedEvent.build(
-                self._message_builder, comp_id=comp_id, client_id=sid
-            ).emit(Channel.local())
+        if entry.timeout > 0.0 and (callback := self._deadline_callback) is not None:
+            callback(entry.deadline)
 
-            info("Client connected", scope="server", session=sid, component=comp_id)
+        from ....api.network import ServerConnectedEvent
+
+        ServerConnectedEvent.build(
+            self._message_builder, comp_id=comp_id, client_id=sid
+        ).emit(Channel.local())
+
+        info(
+            "Client connected",
+            scope="server",
+            session=sid,
+            component=comp_id,
+            wire_format=encoding.wire_format,
+            compression=encoding.compression,
+            batching=batcher is not None,
+            groups=", ".join(sorted(groups)),
+        )
 
     def _on_disconnect(self, sid: str) -> None:
         with self._lock:
@@ -189,53 +387,199 @@ class Server(socketio.Server):
 
             self._purge_client(sid)
 
-            from .. import Channel
-            from ....api.network import ServerDisconnectedEvent
+        from ....api.network import ServerDisconnectedEvent
 
-            ServerDisconnectedEvent.build(
-                self._message_builder, comp_id=comp_id, client_id=sid
-            ).emit(Channel.local())
+        ServerDisconnectedEvent.build(
+            self._message_builder, comp_id=comp_id, client_id=sid
+        ).emit(Channel.local())
+
+        info("Client disconnected", scope="server", session=sid)
+
+    def _on_message(self, msg_name: str, sid: str, data: EncodedData) -> None:
+        with self._lock:
+            if (comp_id := self._lookup_client(sid)) is not None:
+                self._timestamp_component(comp_id)
 
-            info("Client disconnected", scope="server", session=sid)
+        self._handle_message(sid, msg_name, data)
 
-    def _on_message(self, msg_name: str, sid: str, data: str) -> None:
+    def _on_batch(self, sid: str, data: typing.Any) -> None:
         with self._lock:
             if (comp_id := self._lookup_client(sid)) is not None:
                 self._timestamp_component(comp_id)
 
-            if self._message_handler is not None:
-                self._message_handler(msg_name, data)
+        try:
+            messages = MessageBatcher.unbatch(data)
+        except ValueError as exc:
+            warning(
+                f"Received an invalid message batch: {str(exc)}",
+                scope="server",
+                session=sid,
+            )
+            return
+
+        for msg_name, msg_data in messages:
+            self._handle_message(sid, msg_name, msg_data)
+
+    def _handle_message(self, sid: str, msg_name: str, data: EncodedData) -> None:
+        # Only clients that negotiated compression may send compressed messages
+        if MessageCompressor.is_compressed(data) and (
+            (encoding := self._client_encodings.get(sid)) is None
+            or encoding.compression != Compression.ZLIB
+        ):
+            warning(
+                "Received a compressed message without having negotiated compression",
+                scope="server",
+                session=sid,
+            )
+            return
+
+        try:
+            data = self._compressor.decompress(data)
+        except ValueError as exc:
+            warning(
+                f"Received an invalid message: {str(exc)}",
+                scope="server",
+                session=sid,
+            )
+            return
+
+        if self._message_handler is not None:
+            self._message_handler(msg_name, data)
 
     def _timestamp_component(self, comp_id: UnitID) -> None:
-        if comp_id in self._connected_components:
-            self._connected_components[comp_id].last_activity = time.time()
+        if (entry := self._connected_components.get(comp_id)) is not None:
+            now = time.monotonic()
+            if now - entry.last_activity >= Server._ACTIVITY_GRANULARITY:
+                entry.last_activity = now
 
     def _find_timed_out_components(self) -> typing.List[UnitID]:
         """
         Finds all components that have timed out already.
 
+        Only heap entries whose deadlines have passed are visited: Entries of components that have been active in the meantime are
+        pushed again using their new deadlines, while entries of disconnected components are dropped. Timed out components are
+        checked again after another timeout period in case they are still connected by then.
+
         Returns:
             A list of all timed out components.
         """
-        return [
-            comp_id
-            for comp_id, entry in self._connected_components.items()
-            if entry.has_timed_out()
+        timed_out: typing.List[UnitID] = []
+        now = time.monotonic()
+
+        while len(self._deadlines) > 0 and self._deadlines[0][0] < now:
+            _, _, comp_id, entry = heapq.heappop(self._deadlines)
+            if self._connected_components.get(comp_id) is not entry:
+                continue
+
+            if entry.deadline < now:
+                timed_out.append(comp_id)
+                self._push_deadline(comp_id, entry, now + entry.timeout)
+            else:
+                self._push_deadline(comp_id, entry, entry.deadline)
+
+        return timed_out
+
+    def _push_deadline(
+        self, comp_id: UnitID, entry: _ComponentEntry, deadline: float
+    ) -> None:
+        heapq.heappush(self._deadlines, (deadline, next(self._counter), comp_id, entry))
+
+    def _compact_deadlines(self) -> None:
+        self._deadlines = [
+            item
+            for item in self._deadlines
+            if self._connected_components.get(item[2]) is item[3]
         ]
+        heapq.heapify(self._deadlines)
+
+    def _negotiate_wire_format(self, auth: typing.Dict[str, typing.Any]) -> WireFormat:
+        if self._binary_encoding:
+            offered_formats = auth.get("wire_formats", [])
+            if (
+                isinstance(offered_formats, list)
+                and WireFormat.MSGPACK in offered_formats
+            ):
+                return WireFormat.MSGPACK
+
+        return WireFormat.JSON
+
+    def _negotiate_compression(
+        self, auth: typing.Dict[str, typing.Any]
+    ) -> Compression:
+        # Incoming messages can always be decompressed, so the offer is accepted even if the server doesn't compress messages itself
+        offered_compressions = auth.get("compression", [])
+        if (
+            isinstance(offered_compressions, list)
+            and Compression.ZLIB in offered_compressions
+        ):
+            return Compression.ZLIB
+
+        return Compression.NONE
+
+    def _get_recipient(self, sid: str) -> _Recipient:
+        return Server._Recipient(
+            sid,
+            self._client_encodings.get(sid, Server._Encoding()),
+            self._client_batchers.get(sid),
+        )
+
+    def _send_to_recipient(
+        self, encoded_msg: EncodedMessage, recipient: _Recipient
+    ) -> None:
+        data = self._encode_message(encoded_msg, recipient.encoding)
+
+        if recipient.batcher is not None:
+            recipient.batcher.add(encoded_msg.message.name, data)
+        else:
+            self.emit(encoded_msg.message.name, data=data, to=recipient.sid)
+
+    def _encode_message(
+        self, encoded_msg: EncodedMessage, encoding: _Encoding
+    ) -> EncodedData:
+        return encoded_msg.encode(
+            encoding.wire_format,
+            (
+                self._compressor
+                if encoding.compression == Compression.ZLIB
+                and self._compressor.enabled
+                else None
+            ),
+        )
+
+    def _register_client(
+        self, sid: str, comp_id: UnitID, entry: _ComponentEntry
+    ) -> None:
+        # If the component was already connected through another client, that client no longer belongs to it
+        if (prev_entry := self._connected_components.get(comp_id)) is not None:
+            self._client_components.pop(prev_entry.sid, None)
+
+        self._connected_components[comp_id] = entry
+        self._client_components[sid] = comp_id
+
+        if entry.timeout > 0.0:
+            self._push_deadline(comp_id, entry, entry.deadline)
 
     def _purge_client(self, sid: str) -> bool:
-        if (comp_id := self._lookup_client(sid)) is not None:
-            self._connected_components.pop(comp_id)
+        encoding = self._client_encodings.pop(sid, None)
+        groups = self._client_groups.pop(sid, frozenset())
+        if (batcher := self._client_batchers.pop(sid, None)) is not None:
+            batcher.close()
+        elif encoding is not None:
+            self._update_room_sizes(encoding, groups, -1)
+
+        if (comp_id := self._client_components.pop(sid, None)) is not None:
+            self._connected_components.pop(comp_id, None)
+
+            # Stale heap entries are removed lazily; compact the heap if they outnumber the actual entries
+            if len(self._deadlines) > 2 * len(self._connected_components) + 64:
+                self._compact_deadlines()
+
             return True
 
         return False
 
     def _lookup_client(self, sid: str) -> UnitID | None:
-        for comp_id, client_entry in self._connected_components.items():
-            if client_entry.sid == sid:
-                return comp_id
-
-        return None
+        return self._client_components.get(sid)
 
     def _component_id_to_client(self, comp_id: UnitID) -> str | None:
         return (
@@ -245,7 +589,7 @@ class Server(socketio.Server):
         )
 
     def _component_ids_to_clients(
-        self, comp_ids: typing.List[UnitID]
+        self, comp_ids: typing.List[UnitID] | None
     ) -> typing.List[str] | None:
         return (
             [
@@ -253,10 +597,54 @@ class Server(socketio.Server):
                 for sid in map(self._component_id_to_client, comp_ids)
                 if sid is not None
             ]
-            if len(comp_ids) > 0
+            if comp_ids
             else None
         )
 
+    def _get_client_groups(
+        self, comp_id: UnitID, auth: typing.Dict[str, typing.Any]
+    ) -> typing.FrozenSet[str]:
+        groups = {Channel.type_group(comp_id.type)}
+
+        offered_groups = auth.get("groups", [])
+        if isinstance(offered_groups, list):
+            for group in offered_groups:
+                # Component type groups are implicit and can't be joined explicitly
+                if (
+                    isinstance(group, str)
+                    and group != ""
+                    and not group.startswith(Channel.TYPE_GROUP_PREFIX)
+                ):
+                    groups.add(group)
+                else:
+                    warning(
+                        f"Ignoring invalid group {group} requested by component {comp_id}",
+                        scope="server",
+                    )
+
+        return frozenset(groups)
+
+    def _update_room_sizes(
+        self, encoding: _Encoding, groups: typing.FrozenSet[str], delta: int
+    ) -> None:
+        for room in [encoding.room, *map(encoding.group_room, groups)]:
+            self._room_sizes[room] += delta
+            if self._room_sizes[room] <= 0:
+                del self._room_sizes[room]
+
+    def _get_room_encodings(self, target: Channel) -> typing.Dict[_Encoding, str]:
+        room_encodings: typing.Dict[Server._Encoding, str] = {}
+
+        for wire_format, compression in itertools.product(WireFormat, Compression):
+            encoding = Server._Encoding(wire_format, compression)
+            room = (
+                encoding.group_room(target.target) if target.is_group else encoding.room
+            )
+            if self._room_sizes[room] > 0:
+                room_encodings[encoding] = room
+
+        return room_encodings
+
     def _get_message_recipient(self, msg: Message) -> str | None:
         if msg.target.is_direct:
             return self._component_id_to_client(msg.target.target_id)
@@ -273,3 +661,12 @@ class Server(socketio.Server):
             return "*" if allowed_origins == "*" else allowed_origins.split(",")
 
         return None
+
+    @property
+    def next_deadline(self) -> float | None:
+        """
+        The monotonic time at which the next component might time out (if any); this might be earlier than the actual deadline, as
+        activity is only taken into account once that time has come.
+        """
+        with self._lock:
+            return self._deadlines[0][0] if len(self._deadlines) > 0 else None
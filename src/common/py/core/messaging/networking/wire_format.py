@@ -0,0 +1,15 @@
+from enum import StrEnum
+
+EncodedData = str | bytes
+
+
+class WireFormat(StrEnum):
+    """
+    The formats messages can be encoded in when being sent across the network.
+
+    *JSON* is always supported (and used by web clients); the compact binary *MessagePack* format is negotiated between Python components
+    when a client connects.
+    """
+
+    JSON = "json"
+    MSGPACK = "msgpack"
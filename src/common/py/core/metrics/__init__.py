@@ -0,0 +1,14 @@
+from .counter import Counter
+from .gauge import Gauge
+from .histogram import Histogram
+from .metric import Metric, MetricLabels, MetricSamples, MetricCollector
+from .metrics_registry import MetricsRegistry
+
+_registry = MetricsRegistry()
+
+
+def default_registry() -> MetricsRegistry:
+    """
+    Gets the global metrics registry.
+    """
+    return _registry
@@ -0,0 +1,66 @@
+import typing
+
+from .metric import Metric, MetricLabels, MetricSamples
+
+
+class Counter(Metric):
+    """
+    A metric whose value only ever increases (e.g., the number of processed messages).
+    """
+
+    def __init__(self, name: str, description: str, labels: typing.Sequence[str] = ()):
+        """
+        Args:
+            name: The name of the metric.
+            description: A short description of the metric.
+            labels: The names of the labels of the metric.
+        """
+        super().__init__(name, description, labels)
+
+        self._values: MetricSamples = {}
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        """
+        Increments the counter.
+
+        Args:
+            *label_values: The values of the labels (in the order of the label names).
+            amount: The amount to add.
+
+        Raises:
+            ValueError: If the number of label values is wrong.
+        """
+        with self._lock:
+            if (value := self._values.get(label_values)) is None:
+                self._check_label_values(label_values)
+                value = 0.0
+
+            self._values[label_values] = value + amount
+
+    def value(self, *label_values: str) -> float:
+        """
+        Gets the current value of the counter.
+
+        Args:
+            *label_values: The values of the labels (in the order of the label names).
+
+        Returns:
+            The counter value.
+        """
+        return self._values.get(typing.cast(MetricLabels, label_values), 0.0)
+
+    def _render_samples(self) -> typing.List[str]:
+        if self._collector is not None:
+            values = self._collector()
+        else:
+            with self._lock:
+                values = self._values.copy()
+
+        return [
+            self._format_sample(label_values, value)
+            for label_values, value in values.items()
+        ]
+
+    @property
+    def metric_type(self) -> str:
+        return "counter"
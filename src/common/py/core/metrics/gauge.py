@@ -0,0 +1,64 @@
+import typing
+
+from .metric import Metric, MetricLabels, MetricSamples
+
+
+class Gauge(Metric):
+    """
+    A metric whose value can go up and down (e.g., the depth of a queue).
+    """
+
+    def __init__(self, name: str, description: str, labels: typing.Sequence[str] = ()):
+        """
+        Args:
+            name: The name of the metric.
+            description: A short description of the metric.
+            labels: The names of the labels of the metric.
+        """
+        super().__init__(name, description, labels)
+
+        self._values: MetricSamples = {}
+
+    def set(self, value: float, *label_values: str) -> None:
+        """
+        Sets the value of the gauge.
+
+        Args:
+            value: The new value.
+            *label_values: The values of the labels (in the order of the label names).
+
+        Raises:
+            ValueError: If the number of label values is wrong.
+        """
+        self._check_label_values(label_values)
+
+        with self._lock:
+            self._values[label_values] = value
+
+    def value(self, *label_values: str) -> float:
+        """
+        Gets the current value of the gauge.
+
+        Args:
+            *label_values: The values of the labels (in the order of the label names).
+
+        Returns:
+            The gauge value.
+        """
+        return self._values.get(typing.cast(MetricLabels, label_values), 0.0)
+
+    def _render_samples(self) -> typing.List[str]:
+        if self._collector is not None:
+            values = self._collector()
+        else:
+            with self._lock:
+                values = self._values.copy()
+
+        return [
+            self._format_sample(label_values, value)
+            for label_values, value in values.items()
+        ]
+
+    @property
+    def metric_type(self) -> str:
+        return "gauge"
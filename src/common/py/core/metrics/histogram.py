@@ -0,0 +1,121 @@
+import bisect
+import dataclasses
+import typing
+
+from .metric import Metric, MetricLabels
+
+
+class Histogram(Metric):
+    """
+    A metric that counts observed values (e.g., execution times) in configurable buckets.
+
+    Observing a value only requires a binary search over the bucket bounds; buckets are made cumulative when the histogram is rendered.
+
+    Notes:
+        Histograms do not support collectors.
+    """
+
+    DEFAULT_BUCKETS: typing.Tuple[float, ...] = (
+        0.0005,
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+    )
+
+    @dataclasses.dataclass(kw_only=True)
+    class _Series:
+        bucket_counts: typing.List[int]
+        total: float = 0.0
+        count: int = 0
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: typing.Sequence[str] = (),
+        *,
+        buckets: typing.Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """
+        Args:
+            name: The name of the metric.
+            description: A short description of the metric.
+            labels: The names of the labels of the metric.
+            buckets: The (inclusive) upper bounds of the buckets; an implicit bucket for all values (+Inf) is always added.
+        """
+        super().__init__(name, description, labels)
+
+        self._buckets: typing.Tuple[float, ...] = tuple(sorted(buckets))
+        self._series: typing.Dict[MetricLabels, Histogram._Series] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        """
+        Records a new value.
+
+        Args:
+            value: The observed value.
+            *label_values: The values of the labels (in the order of the label names).
+
+        Raises:
+            ValueError: If the number of label values is wrong.
+        """
+        bucket = bisect.bisect_left(self._buckets, value)
+
+        with self._lock:
+            if (series := self._series.get(label_values)) is None:
+                self._check_label_values(label_values)
+                series = Histogram._Series(bucket_counts=[0] * (len(self._buckets) + 1))
+                self._series[label_values] = series
+
+            series.bucket_counts[bucket] += 1
+            series.total += value
+            series.count += 1
+
+    def _render_samples(self) -> typing.List[str]:
+        with self._lock:
+            series_list = [
+                (label_values, series.bucket_counts[:], series.total, series.count)
+                for label_values, series in self._series.items()
+            ]
+
+        lines: typing.List[str] = []
+        for label_values, bucket_counts, total, count in series_list:
+            cumulative = 0
+            for bound, bucket_count in zip(
+                self._buckets + (float("inf"),), bucket_counts
+            ):
+                cumulative += bucket_count
+                lines.append(
+                    self._format_sample(
+                        label_values,
+                        cumulative,
+                        suffix="_bucket",
+                        extra_labels=[("le", self._format_value(bound))],
+                    )
+                )
+
+            lines.append(self._format_sample(label_values, total, suffix="_sum"))
+            lines.append(self._format_sample(label_values, count, suffix="_count"))
+
+        return lines
+
+    @property
+    def metric_type(self) -> str:
+        return "histogram"
+
+    @property
+    def buckets(self) -> typing.Tuple[float, ...]:
+        """
+        The upper bounds of the buckets.
+        """
+        return self._buckets
@@ -0,0 +1,124 @@
+import abc
+import threading
+import typing
+
+MetricLabels = typing.Tuple[str, ...]
+MetricSamples = typing.Dict[MetricLabels, float]
+MetricCollector = typing.Callable[[], MetricSamples]
+
+
+class Metric(abc.ABC):
+    """
+    Base class for all metrics.
+
+    A metric has a name, a description and a (possibly empty) list of label names; each distinct combination of label values forms
+    its own time series. Instead of being updated directly, a metric can also get its values from a *collector* function that is
+    only invoked when the metric is rendered; this is useful for values that are already tracked elsewhere (like queue depths).
+
+    Notes:
+        Metrics are thread-safe.
+    """
+
+    def __init__(self, name: str, description: str, labels: typing.Sequence[str] = ()):
+        """
+        Args:
+            name: The name of the metric.
+            description: A short description of the metric.
+            labels: The names of the labels of the metric.
+        """
+        self._name = name
+        self._description = description
+        self._labels: MetricLabels = tuple(labels)
+
+        self._collector: MetricCollector | None = None
+
+        self._lock = threading.Lock()
+
+    def set_collector(self, collector: MetricCollector | None) -> None:
+        """
+        Sets a function that provides the values of the metric when it is rendered.
+
+        Args:
+            collector: A function returning the values by their label values; pass *None* to remove the collector.
+        """
+        self._collector = collector
+
+    def render(self) -> typing.List[str]:
+        """
+        Renders the metric in the Prometheus text exposition format.
+
+        Returns:
+            The rendered lines.
+        """
+        lines = [
+            f"# HELP {self._name} {self._description}",
+            f"# TYPE {self._name} {self.metric_type}",
+        ]
+        lines.extend(self._render_samples())
+        return lines
+
+    @abc.abstractmethod
+    def _render_samples(self) -> typing.List[str]: ...
+
+    def _format_sample(
+        self,
+        label_values: MetricLabels,
+        value: float,
+        *,
+        suffix: str = "",
+        extra_labels: typing.Sequence[typing.Tuple[str, str]] = (),
+    ) -> str:
+        labels = list(zip(self._labels, label_values)) + list(extra_labels)
+        if len(labels) > 0:
+            label_list = ",".join(
+                f'{label_name}="{self._escape_label_value(label_value)}"'
+                for label_name, label_value in labels
+            )
+            return f"{self._name}{suffix}{{{label_list}}} {self._format_value(value)}"
+
+        return f"{self._name}{suffix} {self._format_value(value)}"
+
+    def _check_label_values(self, label_values: MetricLabels) -> None:
+        if len(label_values) != len(self._labels):
+            raise ValueError(
+                f"Metric {self._name} requires {len(self._labels)} label values, but got {len(label_values)}"
+            )
+
+    @staticmethod
+    def _escape_label_value(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    @staticmethod
+    def _format_value(value: float) -> str:
+        if value == float("inf"):
+            return "+Inf"
+
+        return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+    @property
+    @abc.abstractmethod
+    def metric_type(self) -> str:
+        """
+        The type of the metric as used in the exposition format.
+        """
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the metric.
+        """
+        return self._name
+
+    @property
+    def description(self) -> str:
+        """
+        The description of the metric.
+        """
+        return self._description
+
+    @property
+    def labels(self) -> MetricLabels:
+        """
+        The label names of the metric.
+        """
+        return self._labels
@@ -0,0 +1,129 @@
+import threading
+import typing
+
+from .counter import Counter
+from .gauge import Gauge
+from .histogram import Histogram
+from .metric import Metric
+
+MetricType = typing.TypeVar("MetricType", bound=Metric)
+
+
+class MetricsRegistry:
+    """
+    Holds all metrics and renders them in the Prometheus text exposition format.
+
+    Metrics are created through the registry; requesting a metric that already exists returns the existing instance, so that
+    different parts of the code can share the same metric.
+
+    Notes:
+        The registry is thread-safe.
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self):
+        self._metrics: typing.Dict[str, Metric] = {}
+
+        self._lock = threading.Lock()
+
+    def counter(
+        self, name: str, description: str, labels: typing.Sequence[str] = ()
+    ) -> Counter:
+        """
+        Gets or creates a counter.
+
+        Args:
+            name: The name of the metric.
+            description: A short description of the metric.
+            labels: The names of the labels of the metric.
+
+        Returns:
+            The counter.
+
+        Raises:
+            ValueError: If a metric of a different type already uses this name.
+        """
+        return self._get_metric(
+            Counter, name, lambda: Counter(name, description, labels)
+        )
+
+    def gauge(
+        self, name: str, description: str, labels: typing.Sequence[str] = ()
+    ) -> Gauge:
+        """
+        Gets or creates a gauge.
+
+        Args:
+            name: The name of the metric.
+            description: A short description of the metric.
+            labels: The names of the labels of the metric.
+
+        Returns:
+            The gauge.
+
+        Raises:
+            ValueError: If a metric of a different type already uses this name.
+        """
+        return self._get_metric(Gauge, name, lambda: Gauge(name, description, labels))
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        labels: typing.Sequence[str] = (),
+        *,
+        buckets: typing.Sequence[float] = Histogram.DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """
+        Gets or creates a histogram.
+
+        Args:
+            name: The name of the metric.
+            description: A short description of the metric.
+            labels: The names of the labels of the metric.
+            buckets: The upper bounds of the buckets.
+
+        Returns:
+            The histogram.
+
+        Raises:
+            ValueError: If a metric of a different type already uses this name.
+        """
+        return self._get_metric(
+            Histogram,
+            name,
+            lambda: Histogram(name, description, labels, buckets=buckets),
+        )
+
+    def render(self) -> str:
+        """
+        Renders all metrics in the Prometheus text exposition format.
+
+        Returns:
+            The rendered metrics.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines: typing.List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _get_metric(
+        self,
+        metric_type: type[MetricType],
+        name: str,
+        factory: typing.Callable[[], MetricType],
+    ) -> MetricType:
+        with self._lock:
+            if (metric := self._metrics.get(name)) is None:
+                metric = factory()
+                self._metrics[name] = metric
+            elif not isinstance(metric, metric_type):
+                raise ValueError(
+                    f"A metric named '{name}' of a different type already exists"
+                )
+
+            return typing.cast(MetricType, metric)
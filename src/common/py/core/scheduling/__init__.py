@@ -0,0 +1,2 @@
+from .scheduled_task import ScheduledTask, ScheduledCallback
+from .scheduler import Scheduler
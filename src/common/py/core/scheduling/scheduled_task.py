@@ -0,0 +1,42 @@
+import dataclasses
+import typing
+
+ScheduledCallback = typing.Callable[[], None]
+
+
+@dataclasses.dataclass(eq=False, kw_only=True)
+class ScheduledTask:
+    """
+    A task that has been scheduled for (possibly repeated) execution by a ``Scheduler``.
+
+    Attributes:
+        callback: The function to call once the task is due.
+        interval: The interval (in seconds) for periodic tasks; 0 for tasks that are only executed once.
+        deadline: The monotonic time when the task is due next.
+    """
+
+    callback: ScheduledCallback
+    interval: float = 0.0
+    deadline: float = 0.0
+
+    _cancelled: bool = dataclasses.field(default=False, init=False)
+
+    def cancel(self) -> None:
+        """
+        Cancels the task; it will not be executed anymore.
+        """
+        self._cancelled = True
+
+    @property
+    def is_periodic(self) -> bool:
+        """
+        Whether this is a periodic task.
+        """
+        return self.interval > 0.0
+
+    @property
+    def is_cancelled(self) -> bool:
+        """
+        Whether the task has been cancelled.
+        """
+        return self._cancelled
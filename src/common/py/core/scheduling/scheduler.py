@@ -0,0 +1,175 @@
+import heapq
+import itertools
+import threading
+import time
+import typing
+
+from .scheduled_task import ScheduledTask, ScheduledCallback
+
+
+class Scheduler:
+    """
+    Executes scheduled tasks in a single, long-lived thread.
+
+    Tasks are kept in a heap ordered by their deadlines, which are based on a monotonic clock. The scheduler thread only wakes up when the next
+    task is due (or when a new task has been scheduled), so no thread needs to be created for each single execution.
+
+    Periodic tasks are re-armed relative to their previous deadline to avoid drifting; if the scheduler falls behind, missed executions are skipped.
+
+    Notes:
+        The scheduler is thread-safe.
+    """
+
+    def __init__(self, name: str = "Scheduler"):
+        """
+        Args:
+            name: The name of the scheduler thread.
+        """
+        self._name = name
+
+        self._tasks: typing.List[typing.Tuple[float, int, ScheduledTask]] = []
+        self._counter = itertools.count()
+
+        self._thread: threading.Thread | None = None
+        self._running = False
+
+        self._condition = threading.Condition()
+
+    def schedule(
+        self, callback: ScheduledCallback, *, delay: float = 0.0
+    ) -> ScheduledTask:
+        """
+        Schedules a task to be executed once.
+
+        Args:
+            callback: The function to call.
+            delay: The delay (in seconds) before the task is executed.
+
+        Returns:
+            The scheduled task.
+        """
+        task = ScheduledTask(callback=callback, deadline=time.monotonic() + delay)
+        self._push(task)
+        return task
+
+    def schedule_periodic(
+        self,
+        callback: ScheduledCallback,
+        interval: float,
+        *,
+        delay: float | None = None,
+    ) -> ScheduledTask:
+        """
+        Schedules a task to be executed periodically.
+
+        Args:
+            callback: The function to call.
+            interval: The interval (in seconds) between executions.
+            delay: The delay (in seconds) before the first execution; defaults to ``interval``.
+
+        Returns:
+            The scheduled task.
+
+        Raises:
+            ValueError: If the interval is not positive.
+        """
+        if interval <= 0.0:
+            raise ValueError("The interval of a periodic task must be positive")
+
+        task = ScheduledTask(
+            callback=callback,
+            interval=interval,
+            deadline=time.monotonic() + (delay if delay is not None else interval),
+        )
+        self._push(task)
+        return task
+
+    def start(self) -> None:
+        """
+        Starts the scheduler thread.
+        """
+        with self._condition:
+            if self._running:
+                return
+
+            self._running = True
+            self._thread = threading.Thread(
+                target=self._run, name=self._name, daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the scheduler thread; pending tasks are kept.
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+
+    def _push(self, task: ScheduledTask) -> None:
+        with self._condition:
+            heapq.heappush(self._tasks, (task.deadline, next(self._counter), task))
+
+            # Only wake up the scheduler if the new task is due before all others
+            if self._tasks[0][2] is task:
+                self._condition.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if (due_tasks := self._wait_for_due_tasks()) is None:
+                    return
+
+            for task in due_tasks:
+                self._execute(task)
+
+                if task.is_periodic and not task.is_cancelled:
+                    task.deadline += task.interval
+                    if task.deadline <= (now := time.monotonic()):
+                        task.deadline = now + task.interval
+
+                    self._push(task)
+
+    def _wait_for_due_tasks(self) -> typing.List[ScheduledTask] | None:
+        while self._running:
+            # Cancelled tasks are removed lazily when they reach the top of the heap
+            while len(self._tasks) > 0 and self._tasks[0][2].is_cancelled:
+                heapq.heappop(self._tasks)
+
+            if len(self._tasks) == 0:
+                self._condition.wait()
+                continue
+
+            now = time.monotonic()
+            if self._tasks[0][0] > now:
+                self._condition.wait(self._tasks[0][0] - now)
+                continue
+
+            due_tasks: typing.List[ScheduledTask] = []
+            while len(self._tasks) > 0 and self._tasks[0][0] <= now:
+                if not (task := heapq.heappop(self._tasks)[2]).is_cancelled:
+                    due_tasks.append(task)
+            return due_tasks
+
+        return None
+
+    def _execute(self, task: ScheduledTask) -> None:
+        try:
+            task.callback()
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            import traceback
+            from ..logging import error, debug
+
+            error(
+                f"An exception occurred within a scheduled task: {str(exc)}",
+                scope="scheduler",
+                exception=type(exc),
+            )
+            debug(f"Traceback:\n{''.join(traceback.format_exc())}", scope="scheduler")
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Whether the scheduler thread is running.
+        """
+        return self._running
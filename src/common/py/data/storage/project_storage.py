@@ -1,4 +1,6 @@
 import abc
+import typing
+from enum import StrEnum
 
 from .storage import Storage
 from ..entities.project import Project, ProjectID
@@ -8,3 +10,37 @@ class ProjectStorage(Storage[Project, ProjectID], abc.ABC):
     """
     Storage for projects.
     """
+
+    class SortKey(StrEnum):
+        """
+        The project fields projects can be sorted by.
+        """
+
+        PROJECT_ID = "project_id"
+        CREATION_TIME = "creation_time"
+        TITLE = "title"
+
+    @abc.abstractmethod
+    def list_page(
+        self, *, cursor: str = "", limit: int = 0, sort: SortKey = SortKey.PROJECT_ID
+    ) -> typing.Tuple[typing.List[Project], str, int]:
+        """
+        Retrieves a single page of stored projects.
+
+        Pages are based on the sort order and not on offsets (*keyset pagination*), so adding or removing projects never causes
+        following pages to skip or repeat projects. Projects with equal sort values are ordered by their IDs.
+
+        Args:
+            cursor: The opaque cursor pointing to the start of the page, as returned for the previous page; an empty cursor
+                requests the first page.
+            limit: The maximum number of projects per page; if 0, all (remaining) projects are returned.
+            sort: The project field to sort by.
+
+        Returns:
+            The projects of the page, the cursor of the next page (which is empty if this is the last page), and the storage version
+            the page reflects.
+
+        Raises:
+            StorageException: If the cursor is invalid or the projects couldn't be listed.
+        """
+        raise NotImplementedError()
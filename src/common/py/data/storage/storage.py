@@ -8,6 +8,9 @@ EntityKeyType = typing.TypeVar("EntityKeyType")  # pylint: disable=invalid-name
 class Storage(typing.Generic[EntityType, EntityKeyType], abc.ABC):
     """
     Defines a general storage interface for basic CRUD operations.
+
+    Every storage keeps a version (a sequence number) that is increased by each modification, allowing clients to keep track of
+    individual changes instead of always fetching all entities.
     """
 
     def __init__(self):
@@ -23,20 +26,26 @@ class Storage(typing.Generic[EntityType, EntityKeyType], abc.ABC):
         raise NotImplementedError()
 
     @abc.abstractmethod
-    def add(self, entity: EntityType) -> None:
+    def add(self, entity: EntityType) -> int:
         """
         Adds a new entity or updates an existing one.
 
+        Returns:
+            The storage version after the modification.
+
         Raises:
               StorageException: If the entity couldn't be added.
         """
         raise NotImplementedError()
 
     @abc.abstractmethod
-    def remove(self, entity: EntityType) -> None:
+    def remove(self, entity: EntityType) -> int:
         """
         Removes an entity.
 
+        Returns:
+            The storage version after the modification.
+
         Raises:
               StorageException: If the entity couldn't be removed.
         """
@@ -67,3 +76,11 @@ class Storage(typing.Generic[EntityType, EntityKeyType], abc.ABC):
             StorageException: If the entities couldn't be listed.
         """
         raise NotImplementedError()
+
+    @property
+    @abc.abstractmethod
+    def version(self) -> int:
+        """
+        The current version of the storage.
+        """
+        raise NotImplementedError()
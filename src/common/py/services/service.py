@@ -4,6 +4,8 @@ from .service_context import ServiceContextType, ServiceContext
 from ..core.messaging import Message, MessageType, MessageBusProtocol
 from ..core.messaging.composers import MessageBuilder
 from ..core.messaging.handlers import MessageHandler, MessageService
+from ..core.execution import BoundedExecutor
+from ..core.scheduling import ScheduledCallback
 from ..utils import UnitID
 
 
@@ -19,6 +21,8 @@ class Service(MessageService):
     dispatched locally. They also create instances of ``ServiceContext`` (or a subclass) that represent a single *unit of work*
     when executing a message handler.
 
+    Services can also declare periodic tasks using the ``periodic_task`` decorator; these are executed by the scheduler of the message bus.
+
     Message handlers are defined using the ``message_handler`` decorator, as can be seen in this example (``svc`` being a ``Service`` instance)::
 
         @svc.message_handler("msg/event", Event)
@@ -33,6 +37,7 @@ class Service(MessageService):
         *,
         message_bus: MessageBusProtocol,
         context_type: type[ServiceContextType] = ServiceContext,
+        executor: BoundedExecutor | None = None,
     ):
         """
         Args:
@@ -40,8 +45,14 @@ class Service(MessageService):
             name: The service name.
             message_bus: The global message bus.
             context_type: The type to use when creating a service context.
+            executor: The executor to run asynchronous handlers and callbacks in.
         """
-        super().__init__(comp_id, message_bus=message_bus, context_type=context_type)
+        super().__init__(
+            comp_id,
+            message_bus=message_bus,
+            context_type=context_type,
+            executor=executor,
+        )
 
         self._name = name
 
@@ -62,10 +73,16 @@ class Service(MessageService):
             def h(msg: Event, ctx: ServiceContext) -> None:
                 ctx.logger.info(f"EVENT HANDLER CALLED")
 
+        Handlers can also be coroutine functions; these are run on a shared event loop, which is best suited for I/O-bound handlers::
+
+            @svc.message_handler("msg/event", Event)
+            async def h(msg: Event, ctx: ServiceContext) -> None:
+                await some_io_operation()
+
         Args:
             message_type: The type of the message.
             name_filter: A more generic message name filter to match against; wildcards (*) are supported as well.
-            is_async: Whether to execute the handler asynchronously in its own thread.
+            is_async: Whether to execute the handler asynchronously using the service's executor (ignored for coroutine functions).
         """
 
         def decorator(handler: MessageHandler) -> MessageHandler:
@@ -79,6 +96,29 @@ class Service(MessageService):
 
         return decorator
 
+    def periodic_task(
+        self, interval: float, *, delay: float | None = None
+    ) -> typing.Callable[[ScheduledCallback], ScheduledCallback]:
+        """
+        A decorator to declare a task that is executed periodically by the message bus scheduler.
+
+        Use this instead of starting own timers or threads::
+
+            @svc.periodic_task(60.0)
+            def cleanup() -> None:
+                ...
+
+        Args:
+            interval: The interval (in seconds) between executions.
+            delay: The delay (in seconds) before the first execution; defaults to ``interval``.
+        """
+
+        def decorator(task: ScheduledCallback) -> ScheduledCallback:
+            self._message_bus.scheduler.schedule_periodic(task, interval, delay=delay)
+            return task
+
+        return decorator
+
     @property
     def name(self) -> str:
         """
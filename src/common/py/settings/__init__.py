@@ -1,4 +1,6 @@
 from .general_setting_ids import GeneralSettingIDs
 from .component_setting_ids import ComponentSettingIDs
 from .network_setting_ids import NetworkServerSettingIDs, NetworkClientSettingIDs
+from .message_bus_setting_ids import MessageBusSettingIDs
+from .service_setting_ids import ServiceSettingIDs
 from .default_settings import get_default_settings
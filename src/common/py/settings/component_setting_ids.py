@@ -8,5 +8,7 @@ class ComponentSettingIDs:
     
     Attributes:
         INSTANCE: The component's instance name (value type: ``string``).
+        GROUPS: A comma-separated list of named message groups the component belongs to (value type: ``string``).
     """
     INSTANCE = SettingID("component", "instance")
+    GROUPS = SettingID("component", "groups")
@@ -14,12 +14,35 @@ def get_default_settings() -> typing.Dict[SettingID, typing.Any]:
     from .component_setting_ids import ComponentSettingIDs
     from .general_setting_ids import GeneralSettingIDs
     from .network_setting_ids import NetworkServerSettingIDs, NetworkClientSettingIDs
+    from .message_bus_setting_ids import MessageBusSettingIDs
+    from .service_setting_ids import ServiceSettingIDs
 
     return {
         GeneralSettingIDs.DEBUG: False,
         ComponentSettingIDs.INSTANCE: "default",
+        ComponentSettingIDs.GROUPS: "",
         NetworkServerSettingIDs.ALLOWED_ORIGINS: "",
         NetworkServerSettingIDs.IDLE_TIMEOUT: 30 * 60,
+        NetworkServerSettingIDs.BINARY_ENCODING: True,
+        NetworkServerSettingIDs.COMPRESSION_THRESHOLD: 16 * 1024,
+        NetworkServerSettingIDs.MAX_DECOMPRESSED_SIZE: 64 * 1024 * 1024,
+        NetworkServerSettingIDs.BATCH_DELAY: 0.0,
+        NetworkServerSettingIDs.BATCH_SIZE: 64 * 1024,
         NetworkClientSettingIDs.SERVER_ADDRESS: "",
         NetworkClientSettingIDs.CONNECTION_TIMEOUT: 10,
+        NetworkClientSettingIDs.BINARY_ENCODING: True,
+        NetworkClientSettingIDs.COMPRESSION_THRESHOLD: 16 * 1024,
+        NetworkClientSettingIDs.MAX_DECOMPRESSED_SIZE: 64 * 1024 * 1024,
+        NetworkClientSettingIDs.BATCH_DELAY: 0.0,
+        NetworkClientSettingIDs.BATCH_SIZE: 64 * 1024,
+        NetworkClientSettingIDs.QUEUE_SIZE: 10000,
+        NetworkClientSettingIDs.STALE_TIMEOUT: 30.0,
+        NetworkClientSettingIDs.RECONNECT_DELAY: 1.0,
+        MessageBusSettingIDs.TICK: 1.0,
+        MessageBusSettingIDs.MAX_PENDING_COMMANDS: 50000,
+        MessageBusSettingIDs.QUEUED_DISPATCH: False,
+        ServiceSettingIDs.WORKERS: 4,
+        ServiceSettingIDs.QUEUE_SIZE: 1000,
+        ServiceSettingIDs.OVERFLOW_POLICY: "block",
+        ServiceSettingIDs.SHARDED: False,
     }
@@ -0,0 +1,16 @@
+from ..utils.config import SettingID
+
+
+class MessageBusSettingIDs:
+    # pylint: disable=too-few-public-methods
+    """
+    Identifiers for message bus settings.
+
+    Attributes:
+        TICK: The minimum interval (in seconds) between two runs of the periodic tasks of the message bus; the bus only wakes up when a deadline (like a command timeout) is due, handling all deadlines due within this interval at once (value type: ``float``).
+        MAX_PENDING_COMMANDS: The maximum number of pending (not yet replied) commands; the oldest ones are evicted if more are issued (value type: ``int``).
+        QUEUED_DISPATCH: Whether messages emitted from within a message handler are queued and dispatched after the handler has returned instead of recursively (value type: ``bool``).
+    """
+    TICK = SettingID("message_bus", "tick")
+    MAX_PENDING_COMMANDS = SettingID("message_bus", "max_pending_commands")
+    QUEUED_DISPATCH = SettingID("message_bus", "queued_dispatch")
@@ -9,9 +9,19 @@ class NetworkServerSettingIDs:
     Attributes:
         ALLOWED_ORIGINS: A comma-separated list of allowed origins; use the asterisk (*) to allow all (value type: ``string``).
         IDLE_TIMEOUT: The time (in seconds) until idle clients will be disconnected automatically; set to 0 to disable.
+        BINARY_ENCODING: Whether clients may negotiate the binary MessagePack wire format (value type: ``bool``).
+        COMPRESSION_THRESHOLD: The size (in bytes) from which messages sent to clients supporting compression are compressed; set to 0 to disable (value type: ``int``).
+        MAX_DECOMPRESSED_SIZE: The maximum size (in bytes) of compressed messages received from clients once decompressed; set to 0 for no limit (value type: ``int``).
+        BATCH_DELAY: The maximum time (in seconds) messages to clients supporting batching are held back to be sent as a batch; set to 0 to disable (value type: ``float``).
+        BATCH_SIZE: The size (in bytes) from which a batch of messages is sent immediately (value type: ``int``).
     """
     ALLOWED_ORIGINS = SettingID("network.server", "allowed_origins")
     IDLE_TIMEOUT = SettingID("network.server", "idle_timeout")
+    BINARY_ENCODING = SettingID("network.server", "binary_encoding")
+    COMPRESSION_THRESHOLD = SettingID("network.server", "compression_threshold")
+    MAX_DECOMPRESSED_SIZE = SettingID("network.server", "max_decompressed_size")
+    BATCH_DELAY = SettingID("network.server", "batch_delay")
+    BATCH_SIZE = SettingID("network.server", "batch_size")
 
 
 class NetworkClientSettingIDs:
@@ -22,6 +32,22 @@ class NetworkClientSettingIDs:
     Attributes:
         SERVER_ADDRESS: The address of the server the client should automatically connect to (value type: ``string``).
         CONNECTION_TIMEOUT: The maximum time (in seconds) for connection attempts (value type: ``float``).
+        BINARY_ENCODING: Whether the client offers the binary MessagePack wire format to the server (value type: ``bool``).
+        COMPRESSION_THRESHOLD: The size (in bytes) from which messages sent to the server are compressed (if negotiated); set to 0 to disable (value type: ``int``).
+        MAX_DECOMPRESSED_SIZE: The maximum size (in bytes) of compressed messages received from the server once decompressed; set to 0 for no limit (value type: ``int``).
+        BATCH_DELAY: The maximum time (in seconds) messages to the server are held back to be sent as a batch (if negotiated); set to 0 to disable (value type: ``float``).
+        BATCH_SIZE: The size (in bytes) from which a batch of messages is sent immediately (value type: ``int``).
+        QUEUE_SIZE: The maximum number of outgoing messages buffered by the client (e.g., while disconnected); set to 0 for no limit (value type: ``int``).
+        STALE_TIMEOUT: The time (in seconds) after which buffered events are discarded instead of sent; set to 0 to disable (value type: ``float``).
+        RECONNECT_DELAY: The maximum delay (in seconds) before the first reconnection attempt; it doubles with each failed attempt, up to the connection timeout (value type: ``float``).
     """
     SERVER_ADDRESS = SettingID("network.client", "server_address")
     CONNECTION_TIMEOUT = SettingID("network.client", "connection_timeout")
+    BINARY_ENCODING = SettingID("network.client", "binary_encoding")
+    COMPRESSION_THRESHOLD = SettingID("network.client", "compression_threshold")
+    MAX_DECOMPRESSED_SIZE = SettingID("network.client", "max_decompressed_size")
+    BATCH_DELAY = SettingID("network.client", "batch_delay")
+    BATCH_SIZE = SettingID("network.client", "batch_size")
+    QUEUE_SIZE = SettingID("network.client", "queue_size")
+    STALE_TIMEOUT = SettingID("network.client", "stale_timeout")
+    RECONNECT_DELAY = SettingID("network.client", "reconnect_delay")
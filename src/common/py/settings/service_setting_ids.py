@@ -0,0 +1,18 @@
+from ..utils.config import SettingID
+
+
+class ServiceSettingIDs:
+    # pylint: disable=too-few-public-methods
+    """
+    Identifiers for service-specific settings; these serve as defaults for all services.
+
+    Attributes:
+        WORKERS: The number of worker threads each service uses for asynchronous handlers and callbacks (value type: ``int``).
+        QUEUE_SIZE: The maximum number of messages waiting for a worker of a service; set to 0 for no limit (value type: ``int``).
+        OVERFLOW_POLICY: What to do with new messages if the queue is full; possible values are "block", "reject" and "drop"; with "block", messages received by the network server are rejected instead, as waiting would stall all of its connections (value type: ``string``).
+        SHARDED: Whether messages of the same trace are executed in order, using one single-threaded lane per worker (value type: ``bool``).
+    """
+    WORKERS = SettingID("services", "workers")
+    QUEUE_SIZE = SettingID("services", "queue_size")
+    OVERFLOW_POLICY = SettingID("services", "overflow_policy")
+    SHARDED = SettingID("services", "sharded")
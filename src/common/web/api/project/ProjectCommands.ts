@@ -10,15 +10,34 @@ import { Project, type ProjectID } from "../../data/entities/project/Project";
 import { ProjectOptions } from "../../data/entities/project/ProjectOptions";
 
 /**
- * Command to fetch all projects of the current user. Requires a ``ListProjectsReply`` reply.
+ * The project fields projects can be sorted by.
+ */
+export type ProjectsSortKey = "project_id" | "creation_time" | "title";
+
+/**
+ * Command to fetch the projects of the current user, either all at once or page by page. Requires a ``ListProjectsReply`` reply.
+ *
+ * @param cursor - The cursor of the page to fetch (as returned by the previous page); empty for the first page.
+ * @param limit - The maximum number of projects to fetch; if 0, all projects are fetched.
+ * @param sort - The project field to sort the projects by.
  */
 @Message.define("command/project/list")
 export class ListProjectsCommand extends Command {
+    public readonly cursor: string = "";
+    public readonly limit: number = 0;
+    public readonly sort: ProjectsSortKey = "project_id";
+
     /**
      * Helper function to easily build this message.
      */
-    public static build(messageBuilder: MessageBuilder, chain: Message | null = null): CommandComposer<ListProjectsCommand> {
-        return messageBuilder.buildCommand(ListProjectsCommand, {}, chain);
+    public static build(
+        messageBuilder: MessageBuilder,
+        cursor: string = "",
+        limit: number = 0,
+        sort: ProjectsSortKey = "project_id",
+        chain: Message | null = null
+    ): CommandComposer<ListProjectsCommand> {
+        return messageBuilder.buildCommand(ListProjectsCommand, { cursor: cursor, limit: limit, sort: sort }, chain);
     }
 }
 
@@ -26,12 +45,19 @@ export class ListProjectsCommand extends Command {
  * Reply to ``ListProjectsCommand``.
  *
  * @param projects - The projects list.
+ * @param version - The projects storage version the list reflects; subsequent project change events continue from this version.
+ * @param cursor - The cursor of the returned page (empty for the first page).
+ * @param next_cursor - The cursor of the next page; empty if there are no more projects.
  */
 @Message.define("command/project/list/reply")
 export class ListProjectsReply extends CommandReply {
     // @ts-ignore
     @Type(() => Project)
     public readonly projects: Project[] = [];
+    public readonly version: number = 0;
+
+    public readonly cursor: string = "";
+    public readonly next_cursor: string = "";
 
     /**
      * Helper function to easily build this message.
@@ -40,10 +66,17 @@ export class ListProjectsReply extends CommandReply {
         messageBuilder: MessageBuilder,
         cmd: ListProjectsCommand,
         projects: Project[],
+        version: number = 0,
+        next_cursor: string = "",
         success: boolean = true,
         message: string = ""
     ): CommandReplyComposer<ListProjectsReply> {
-        return messageBuilder.buildCommandReply(ListProjectsReply, cmd, success, message, { projects: projects });
+        return messageBuilder.buildCommandReply(ListProjectsReply, cmd, success, message, {
+            projects: projects,
+            version: version,
+            cursor: cmd.cursor,
+            next_cursor: next_cursor
+        });
     }
 }
 
@@ -4,23 +4,89 @@ import { EventComposer } from "../../core/messaging/composers/EventComposer";
 import { MessageBuilder } from "../../core/messaging/composers/MessageBuilder";
 import { Event } from "../../core/messaging/Event";
 import { Message } from "../../core/messaging/Message";
-import { Project } from "../../data/entities/project/Project";
+import { Project, type ProjectID } from "../../data/entities/project/Project";
 
 /**
- * Emitted whenever the user's projects list has been updated.
+ * Emitted to send a full snapshot of the user's projects list.
  *
  * @param projects - The projects list.
+ * @param version - The projects storage version the snapshot reflects.
  */
 @Message.define("event/project/list")
 export class ProjectsListEvent extends Event {
     // @ts-ignore
     @Type(() => Project)
     public readonly projects: Project[] = [];
+    public readonly version: number = 0;
 
     /**
      * Helper function to easily build this message.
      */
-    public static build(messageBuilder: MessageBuilder, projects: Project[], chain: Message | null = null): EventComposer<ProjectsListEvent> {
-        return messageBuilder.buildEvent(ProjectsListEvent, { projects: projects }, chain);
+    public static build(messageBuilder: MessageBuilder, projects: Project[], version: number, chain: Message | null = null): EventComposer<ProjectsListEvent> {
+        return messageBuilder.buildEvent(ProjectsListEvent, { projects: projects, version: version }, chain);
+    }
+}
+
+/**
+ * Emitted whenever a project has been added.
+ *
+ * Project change events are only meaningful if applied in the order of their versions; if a version is skipped, the full
+ * projects list needs to be fetched again.
+ *
+ * @param project - The new project.
+ * @param version - The projects storage version after the change.
+ */
+@Message.define("event/project/added")
+export class ProjectAddedEvent extends Event {
+    // @ts-ignore
+    @Type(() => Project)
+    public readonly project: Project = new Project(0, 0, "");
+    public readonly version: number = 0;
+
+    /**
+     * Helper function to easily build this message.
+     */
+    public static build(messageBuilder: MessageBuilder, project: Project, version: number, chain: Message | null = null): EventComposer<ProjectAddedEvent> {
+        return messageBuilder.buildEvent(ProjectAddedEvent, { project: project, version: version }, chain);
+    }
+}
+
+/**
+ * Emitted whenever a project (including its features) has been updated.
+ *
+ * @param project - The updated project.
+ * @param version - The projects storage version after the change.
+ */
+@Message.define("event/project/updated")
+export class ProjectUpdatedEvent extends Event {
+    // @ts-ignore
+    @Type(() => Project)
+    public readonly project: Project = new Project(0, 0, "");
+    public readonly version: number = 0;
+
+    /**
+     * Helper function to easily build this message.
+     */
+    public static build(messageBuilder: MessageBuilder, project: Project, version: number, chain: Message | null = null): EventComposer<ProjectUpdatedEvent> {
+        return messageBuilder.buildEvent(ProjectUpdatedEvent, { project: project, version: version }, chain);
+    }
+}
+
+/**
+ * Emitted whenever a project has been removed.
+ *
+ * @param project_id - The ID of the removed project.
+ * @param version - The projects storage version after the change.
+ */
+@Message.define("event/project/removed")
+export class ProjectRemovedEvent extends Event {
+    public readonly project_id: ProjectID = 0;
+    public readonly version: number = 0;
+
+    /**
+     * Helper function to easily build this message.
+     */
+    public static build(messageBuilder: MessageBuilder, project_id: ProjectID, version: number, chain: Message | null = null): EventComposer<ProjectRemovedEvent> {
+        return messageBuilder.buildEvent(ProjectRemovedEvent, { project_id: project_id, version: version }, chain);
     }
 }
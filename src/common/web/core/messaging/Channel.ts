@@ -5,19 +5,26 @@ import { UnitID } from "../../utils/UnitID";
  */
 export const enum ChannelType {
     Local = "local",
-    Direct = "direct"
+    Direct = "direct",
+    Group = "group",
+    Broadcast = "broadcast"
 }
 
 /**
  * The target of a message.
  *
  * Message targets are represented by so-called *channels*. These can be *local* for messages that will only
- * be dispatched locally and not across the network or *direct* for specific (remote) targets.
+ * be dispatched locally and not across the network, *direct* for specific (remote) targets, *group* for all
+ * components belonging to a group, or *broadcast* for all components.
+ *
+ * Each component implicitly belongs to the group of its component type (see ``componentType``).
  */
 export class Channel {
+    public static readonly typeGroupPrefix = "type:";
+
     /**
      * @param type - The channel type.
-     * @param target - The actual target in case of a direct channel.
+     * @param target - The actual target in case of a direct channel, or the group name in case of a group channel.
      */
     public constructor(readonly type: string, readonly target?: string) {
     }
@@ -49,6 +56,38 @@ export class Channel {
         return this.type == ChannelType.Direct;
     }
 
+    /**
+     * Whether this is a group channel.
+     */
+    public get isGroup(): boolean {
+        return this.type == ChannelType.Group;
+    }
+
+    /**
+     * Whether this is a broadcast channel.
+     */
+    public get isBroadcast(): boolean {
+        return this.type == ChannelType.Broadcast;
+    }
+
+    /**
+     * Checks whether a component is targeted by this channel.
+     *
+     * @param compID - The component ID.
+     * @param groups - The named groups the component belongs to.
+     *
+     * @returns - Whether the component is targeted; local channels never target a specific component.
+     */
+    public addresses(compID: UnitID, groups: string[] = []): boolean {
+        if (this.isDirect) {
+            return this.targetID ? this.targetID.equals(compID) : false;
+        } else if (this.isGroup) {
+            return this.target ? groups.includes(this.target) || this.target == Channel.typeGroup(compID.type) : false;
+        }
+
+        return this.isBroadcast;
+    }
+
     /**
      * Gets the string representation of this channel.
      */
@@ -69,4 +108,32 @@ export class Channel {
     public static direct(target: string | UnitID) {
         return new Channel(ChannelType.Direct, String(target));
     }
+
+    /**
+     * Creates a new group channel targeting all components of a named group.
+     */
+    public static group(name: string): Channel {
+        return new Channel(ChannelType.Group, name);
+    }
+
+    /**
+     * Creates a new group channel targeting all components of the given type.
+     */
+    public static componentType(compType: string): Channel {
+        return Channel.group(Channel.typeGroup(compType));
+    }
+
+    /**
+     * Creates a new broadcast channel targeting all components.
+     */
+    public static broadcast(): Channel {
+        return new Channel(ChannelType.Broadcast);
+    }
+
+    /**
+     * Gets the name of the group all components of the given type belong to.
+     */
+    public static typeGroup(compType: string): string {
+        return `${Channel.typeGroupPrefix}${compType}`;
+    }
 }
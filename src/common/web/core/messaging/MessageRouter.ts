@@ -31,6 +31,8 @@ export class MessageRouter {
             this.verifyLocalMessage(msg, msgMeta);
         } else if (msg.target.isDirect) {
             this.verifyDirectMessage(msg, msgMeta);
+        } else if (msg.target.isGroup) {
+            this.verifyGroupMessage(msg, msgMeta);
         }
     }
 
@@ -47,6 +49,9 @@ export class MessageRouter {
             // A direct message that has made it to the message bus either stems from this component or is targeted to it
             // If it is targeted to this component, it needs to be dispatched locally
             return msg.target.targetID.equals(this._compID);
+        } else if (msg.target.isGroup || msg.target.isBroadcast) {
+            // Group and broadcast messages are dispatched locally if this component is among the targeted ones
+            return msg.target.addresses(this._compID);
         }
 
         return false;
@@ -79,4 +84,10 @@ export class MessageRouter {
             throw new Error("Message coming from another component not directed to this component");
         }
     }
+
+    private verifyGroupMessage(msg: Message, msgMeta: MessageMetaInformation): void {
+        if (!msg.target.target) {
+            throw new Error("Group message without a group received");
+        }
+    }
 }
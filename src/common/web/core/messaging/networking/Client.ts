@@ -13,8 +13,13 @@ type ClientMessageHandler = (msgName: string, data: string) => void;
 
 /**
  * The client connection, based on ``socketio``.
+ *
+ * The client always uses uncompressed *JSON* messages, but accepts message batches from the server.
  */
 export class Client {
+    private static readonly _negotiationEvent = "$negotiation";
+    private static readonly _batchEvent = "$batch";
+
     private readonly _compID: UnitID;
     private readonly _config: Configuration;
 
@@ -61,7 +66,7 @@ export class Client {
         this._socket.on("connect", () => this.onConnect());
         this._socket.on("connect_error", (reason: any) => this.onConnectError(reason));
         this._socket.on("disconnect", () => this.onDisconnect());
-        this._socket.onAny((msgName: string, data: string) => this.onMessage(msgName, data));
+        this._socket.onAny((msgName: string, data: any) => this.onMessage(msgName, data));
     }
 
     /**
@@ -133,13 +138,27 @@ export class Client {
         logging.info("Disconnected from server", "client");
     }
 
-    private onMessage(msgName: string, data: string): void {
+    private onMessage(msgName: string, data: any): void {
+        if (msgName == Client._negotiationEvent) {
+            return; // Nothing to negotiate, as only JSON is supported
+        }
+
+        if (msgName == Client._batchEvent) {
+            for (const [batchedMsgName, batchedData] of data as [string, string][]) {
+                this.handleMessage(batchedMsgName, batchedData);
+            }
+        } else {
+            this.handleMessage(msgName, data);
+        }
+    }
+
+    private handleMessage(msgName: string, data: string): void {
         if (this._messageHandler) {
             this._messageHandler(msgName, data);
         }
     }
 
     private getAuthentication(): Record<string, any> {
-        return { "component_id": this._compID.toString() };
+        return { "component_id": this._compID.toString(), "batching": true };
     }
 }
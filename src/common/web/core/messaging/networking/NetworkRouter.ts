@@ -39,6 +39,8 @@ export class NetworkRouter {
             this.verifyLocalMessage(direction, msg);
         } else if (msg.target.isDirect) {
             this.verifyDirectMessage(direction, msg);
+        } else if (msg.target.isGroup) {
+            this.verifyGroupMessage(direction, msg);
         }
     }
 
@@ -57,6 +59,9 @@ export class NetworkRouter {
         } else if (direction == NetworkRouterDirection.In) {
             if (msg.target.isDirect && msg.target.targetID) {
                 return msg.target.targetID.equals(this._compID);
+            } else if (msg.target.isGroup || msg.target.isBroadcast) {
+                // Messages sent by this component itself have already been dispatched locally
+                return !msg.origin.equals(this._compID) && msg.target.addresses(this._compID);
             }
         }
 
@@ -95,4 +100,10 @@ export class NetworkRouter {
             }
         }
     }
+
+    private verifyGroupMessage(direction: NetworkRouterDirection, msg: Message): void {
+        if (!msg.target.target) {
+            throw new Error("Group message without a group received");
+        }
+    }
 }
@@ -7,9 +7,11 @@ import { Project, type ProjectID } from "@common/data/entities/project/Project";
  * The projects store for all project-specific data.
  *
  * @param projects - List of all projects.
+ * @param projectsVersion - The projects storage version the list reflects.
  */
 export const projectsStore = defineStore("projectsStore", () => {
     const projects = ref<Project[]>([]);
+    const projectsVersion = ref<number>(0);
     const activeProject = ref<ProjectID | null | undefined>(undefined);
 
     let pendingDeletions = ref<ProjectID[]>([]);
@@ -38,8 +40,32 @@ export const projectsStore = defineStore("projectsStore", () => {
         pendingDeletions.value = pendingDeletions.value.filter(elem => elem != projectID);
     }
 
+    function applySnapshot(projectsList: Project[], version: number): void {
+        projects.value = projectsList;
+        projectsVersion.value = version;
+    }
+
+    function appendPage(projectsList: Project[]): void {
+        // Projects may already have been added by change events in the meantime, so these are replaced
+        const pageIDs = new Set(projectsList.map(proj => proj.project_id));
+        projects.value = [...projects.value.filter(proj => !pageIDs.has(proj.project_id)), ...projectsList];
+    }
+
+    function applyChange(version: number, change: (projectsList: Project[]) => Project[]): boolean {
+        if (version <= projectsVersion.value) {
+            return true; // The change is already reflected by the current list
+        } else if (version > projectsVersion.value + 1) {
+            return false; // At least one change has been missed
+        }
+
+        projects.value = change(projects.value);
+        projectsVersion.value = version;
+        return true;
+    }
+
     function reset(): void {
         projects.value = [] as Project[];
+        projectsVersion.value = 0;
         activeProject.value = undefined;
 
         pendingDeletions.value = [] as ProjectID[];
@@ -51,11 +77,15 @@ export const projectsStore = defineStore("projectsStore", () => {
 
     return {
         projects,
+        projectsVersion,
         activeProject,
         pendingDeletions,
         resolveActiveProject,
         markForDeletion,
         unmarkForDeletion,
+        applySnapshot,
+        appendPage,
+        applyChange,
         reset,
         resetPendingDeletions
     };
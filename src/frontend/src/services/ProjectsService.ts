@@ -1,13 +1,38 @@
-import { CreateProjectReply, DeleteProjectReply, ListProjectsReply, UpdateProjectReply } from "@common/api/project/ProjectCommands";
-import { ProjectsListEvent } from "@common/api/project/ProjectEvents";
+import { CreateProjectReply, DeleteProjectReply, ListProjectsCommand, ListProjectsReply, UpdateProjectReply } from "@common/api/project/ProjectCommands";
+import { ProjectAddedEvent, ProjectRemovedEvent, ProjectsListEvent, ProjectUpdatedEvent } from "@common/api/project/ProjectEvents";
 import { WebComponent } from "@common/component/WebComponent";
+import { Channel } from "@common/core/messaging/Channel";
+import { Message } from "@common/core/messaging/Message";
+import { Project } from "@common/data/entities/project/Project";
 import { Service } from "@common/services/Service";
 
 import { FrontendServiceContext } from "@/services/FrontendServiceContext";
+import { FrontendSettingIDs } from "@/settings/FrontendSettingIDs";
+
+function replaceProject(projects: Project[], project: Project): Project[] {
+    const index = projects.findIndex(proj => proj.project_id === project.project_id);
+    return index >= 0 ? projects.map((proj, i) => (i === index ? project : proj)) : [...projects, project];
+}
+
+function applyProjectChange(msg: Message, ctx: FrontendServiceContext, version: number, change: (projects: Project[]) => Project[]): void {
+    if (!ctx.projectsStore.applyChange(version, change)) {
+        // A change has been missed, so fall back to fetching the full projects list
+        ctx.logger.debug(`Missed a projects change (version ${version}), fetching all projects`, "projects");
+        requestProjectsPage(msg, ctx);
+    }
+}
+
+function requestProjectsPage(msg: Message, ctx: FrontendServiceContext, cursor: string = ""): void {
+    const pageSize = ctx.config.value(FrontendSettingIDs.ProjectsPageSize);
+    ListProjectsCommand.build(ctx.messageBuilder, cursor, pageSize).emit(Channel.direct(msg.origin));
+}
 
 /**
  * Creates the projects service.
  *
+ * The projects list is fetched page by page, with each page being requested once the previous one has arrived. Changes to single
+ * projects are received as versioned change events; if a version is missed, the full projects list is fetched again.
+ *
  * @param comp - The main component instance.
  *
  * @returns - The newly created service.
@@ -20,9 +45,17 @@ export default function(comp: WebComponent): Service {
                 if (msg.success) {
                     ctx.logger.debug("Retrieved projects list", "projects", { projects: JSON.stringify(msg.projects) });
 
-                    ctx.projectsStore.resetPendingDeletions();
-                    // @ts-ignore
-                    ctx.projectsStore.projects = msg.projects;
+                    // The version of the first page is kept, so that changes made while fetching further pages are applied again
+                    if (msg.cursor === "") {
+                        ctx.projectsStore.resetPendingDeletions();
+                        ctx.projectsStore.applySnapshot(msg.projects, msg.version);
+                    } else {
+                        ctx.projectsStore.appendPage(msg.projects);
+                    }
+
+                    if (msg.next_cursor !== "") {
+                        requestProjectsPage(msg, ctx, msg.next_cursor);
+                    }
                 } else {
                     ctx.logger.error("Unable to retrieve the projects list", "projects", { reason: msg.message });
                 }
@@ -32,8 +65,25 @@ export default function(comp: WebComponent): Service {
                 ctx.logger.debug("Projects list update received", "projects", { projects: JSON.stringify(msg.projects) });
 
                 ctx.projectsStore.resetPendingDeletions();
-                // @ts-ignore
-                ctx.projectsStore.projects = msg.projects;
+                ctx.projectsStore.applySnapshot(msg.projects, msg.version);
+            });
+
+            svc.messageHandler(ProjectAddedEvent, (msg: ProjectAddedEvent, ctx: FrontendServiceContext) => {
+                ctx.logger.debug(`Project ${msg.project.project_id} added`, "projects", { version: msg.version });
+
+                applyProjectChange(msg, ctx, msg.version, (projects: Project[]) => replaceProject(projects, msg.project));
+            });
+
+            svc.messageHandler(ProjectUpdatedEvent, (msg: ProjectUpdatedEvent, ctx: FrontendServiceContext) => {
+                ctx.logger.debug(`Project ${msg.project.project_id} updated`, "projects", { version: msg.version });
+
+                applyProjectChange(msg, ctx, msg.version, (projects: Project[]) => replaceProject(projects, msg.project));
+            });
+
+            svc.messageHandler(ProjectRemovedEvent, (msg: ProjectRemovedEvent, ctx: FrontendServiceContext) => {
+                ctx.logger.debug(`Project ${msg.project_id} removed`, "projects", { version: msg.version });
+
+                applyProjectChange(msg, ctx, msg.version, (projects: Project[]) => projects.filter(proj => proj.project_id !== msg.project_id));
             });
 
             svc.messageHandler(CreateProjectReply, (msg: CreateProjectReply, ctx: FrontendServiceContext) => {
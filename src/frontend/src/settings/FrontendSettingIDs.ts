@@ -4,7 +4,9 @@ import { SettingID } from "@common/utils/config/SettingID";
  * Identifiers for frontend settings.
  *
  * @property RegularCommandTimeout - The timeout in seconds for commands which are usually executed quickly (value type: ``number``).
+ * @property ProjectsPageSize - The number of projects fetched per page; 0 fetches all projects at once (value type: ``number``).
  */
 export class FrontendSettingIDs {
     public static readonly RegularCommandTimeout = new SettingID("frontend", "regular_command_timeout");
+    public static readonly ProjectsPageSize = new SettingID("frontend", "projects_page_size");
 }
@@ -11,6 +11,7 @@ export function getFrontendSettings(): Map<SettingID, any> {
     let settings = new Map<SettingID, any>();
 
     settings.set(FrontendSettingIDs.RegularCommandTimeout, 10.0);
+    settings.set(FrontendSettingIDs.ProjectsPageSize, 50);
 
     return settings;
 }
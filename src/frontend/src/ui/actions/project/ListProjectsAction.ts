@@ -5,16 +5,20 @@ import { ActionNotifier } from "@common/ui/actions/notifiers/ActionNotifier";
 import { OverlayNotifier } from "@common/ui/actions/notifiers/OverlayNotifier";
 import { OverlayNotificationType } from "@common/ui/notifications/OverlayNotifications";
 
+import { FrontendSettingIDs } from "@/settings/FrontendSettingIDs";
 import { FrontendCommandAction } from "@/ui/actions/FrontendCommandAction";
 
 /**
  * Action to retrieve all projects.
+ *
+ * Only the first page of projects is requested by this action; the projects service fetches all remaining pages.
  */
 export class ListProjectsAction extends FrontendCommandAction<ListProjectsCommand, CommandComposer<ListProjectsCommand>> {
     public prepare(): CommandComposer<ListProjectsCommand> {
         this.prepareNotifiers();
 
-        this._composer = ListProjectsCommand.build(this.messageBuilder).timeout(this._regularTimeout);
+        const pageSize = this._component.data.config.value(FrontendSettingIDs.ProjectsPageSize);
+        this._composer = ListProjectsCommand.build(this.messageBuilder, "", pageSize).timeout(this._regularTimeout);
         return this._composer;
     }
 
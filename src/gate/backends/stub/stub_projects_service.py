@@ -1,4 +1,5 @@
 import time
+import typing
 
 from common.py.component import BackendComponent
 from common.py.services import Service
@@ -35,20 +36,50 @@ def create_stub_projects_service(comp: BackendComponent) -> Service:
     )
 
     from .stub_service_context import StubServiceContext
-    from .stub_utils import send_projects_list
+    from .stub_utils import (
+        send_project_added,
+        send_project_updated,
+        send_project_removed,
+    )
 
     svc = comp.create_service("Projects service", context_type=StubServiceContext)
 
     @svc.message_handler(ListProjectsCommand)
     def list_projects(msg: ListProjectsCommand, ctx: StubServiceContext) -> None:
+        success = False
+        message = ""
+
+        projects: typing.List[Project] = []
+        next_cursor = ""
+        version = 0
+
+        try:
+            if msg.limit < 0:
+                raise ValueError(f"Invalid page limit {msg.limit}")
+
+            # The version is read together with the page, so it matches the listed projects exactly
+            projects, next_cursor, version = ctx.storage_pool.project_storage.list_page(
+                cursor=msg.cursor, limit=msg.limit, sort=msg.sort
+            )
+            success = True
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            message = str(exc)
+
         ListProjectsReply.build(
-            ctx.message_builder, msg, projects=ctx.storage_pool.project_storage.list()
+            ctx.message_builder,
+            msg,
+            projects=projects,
+            version=version,
+            next_cursor=next_cursor,
+            success=success,
+            message=message,
         ).emit()
 
     @svc.message_handler(CreateProjectCommand)
     def create_project(msg: CreateProjectCommand, ctx: StubServiceContext) -> None:
         success = False
         message = ""
+        version = 0
 
         project = Project(
             project_id=ctx.storage_pool.project_storage.next_id(),
@@ -61,7 +92,7 @@ def create_stub_projects_service(comp: BackendComponent) -> Service:
         try:
             ProjectVerifier(project).verify_create()
 
-            ctx.storage_pool.project_storage.add(project)
+            version = ctx.storage_pool.project_storage.add(project)
             success = True
         except Exception as exc:  # pylint: disable=broad-exception-caught
             message = str(exc)
@@ -74,12 +105,14 @@ def create_stub_projects_service(comp: BackendComponent) -> Service:
             message=message,
         ).emit()
 
-        send_projects_list(msg, ctx)
+        if success:
+            send_project_added(msg, ctx, project=project, version=version)
 
     @svc.message_handler(UpdateProjectCommand)
     def update_project(msg: UpdateProjectCommand, ctx: StubServiceContext) -> None:
         success = False
         message = ""
+        version = 0
 
         if (
             project := ctx.storage_pool.project_storage.get(msg.project_id)
@@ -93,7 +126,7 @@ def create_stub_projects_service(comp: BackendComponent) -> Service:
                 )
                 ProjectVerifier(project_upd).verify_update()
 
-                ctx.storage_pool.project_storage.add(project_upd)
+                version = ctx.storage_pool.project_storage.add(project_upd)
                 success = True
             except Exception as exc:  # pylint: disable=broad-exception-caught
                 message = str(exc)
@@ -108,7 +141,8 @@ def create_stub_projects_service(comp: BackendComponent) -> Service:
             message=message,
         ).emit()
 
-        send_projects_list(msg, ctx)
+        if success:
+            send_project_updated(msg, ctx, project=project_upd, version=version)
 
     @svc.message_handler(UpdateProjectFeaturesCommand)
     def update_project_features(
@@ -116,6 +150,7 @@ def create_stub_projects_service(comp: BackendComponent) -> Service:
     ) -> None:
         success = False
         message = ""
+        version = 0
 
         if (
             project := ctx.storage_pool.project_storage.get(msg.project_id)
@@ -133,7 +168,7 @@ def create_stub_projects_service(comp: BackendComponent) -> Service:
 
                 project_upd = clone_entity(project, features=project_features_upd)
 
-                ctx.storage_pool.project_storage.add(project_upd)
+                version = ctx.storage_pool.project_storage.add(project_upd)
                 success = True
             except Exception as exc:  # pylint: disable=broad-exception-caught
                 message = str(exc)
@@ -149,12 +184,14 @@ def create_stub_projects_service(comp: BackendComponent) -> Service:
             message=message,
         ).emit()
 
-        send_projects_list(msg, ctx)
+        if success:
+            send_project_updated(msg, ctx, project=project_upd, version=version)
 
     @svc.message_handler(DeleteProjectCommand)
     def delete_project(msg: DeleteProjectCommand, ctx: StubServiceContext) -> None:
         success = False
         message = ""
+        version = 0
 
         if (
             project := ctx.storage_pool.project_storage.get(msg.project_id)
@@ -162,7 +199,7 @@ def create_stub_projects_service(comp: BackendComponent) -> Service:
             try:
                 ProjectVerifier(project).verify_delete()
 
-                ctx.storage_pool.project_storage.remove(project)
+                version = ctx.storage_pool.project_storage.remove(project)
                 success = True
             except Exception as exc:  # pylint: disable=broad-exception-caught
                 message = str(exc)
@@ -177,6 +214,7 @@ def create_stub_projects_service(comp: BackendComponent) -> Service:
             message=message,
         ).emit()
 
-        send_projects_list(msg, ctx)
+        if success:
+            send_project_removed(msg, ctx, project_id=msg.project_id, version=version)
 
     return svc
@@ -1,5 +1,6 @@
 from common.py.core.logging import LoggerProtocol
 from common.py.core.messaging.composers import MessageBuilder
+from common.py.core.messaging.handlers import MessageBuilderFactory, LoggerFactory
 from common.py.core.messaging.meta import MessageMetaInformation
 from common.py.data.entities.user import UserConfiguration
 from common.py.services import ServiceContext
@@ -19,9 +20,9 @@ class StubServiceContext(ServiceContext):
     def __init__(
         self,
         msg_meta: MessageMetaInformation,
-        msg_builder: MessageBuilder,
+        msg_builder: MessageBuilder | MessageBuilderFactory,
         *,
-        logger: LoggerProtocol,
+        logger: LoggerProtocol | LoggerFactory,
         config: Configuration,
     ):
         super().__init__(msg_meta, msg_builder, logger=logger, config=config)
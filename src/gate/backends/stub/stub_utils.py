@@ -1,13 +1,34 @@
 from common.py.core.messaging import Message, Channel
+from common.py.data.entities.project import Project, ProjectID
 
 from .stub_service_context import StubServiceContext
 
 
-def send_projects_list(msg: Message, ctx: StubServiceContext) -> None:
-    from common.py.api.project import ProjectsListEvent
+def send_project_added(
+    msg: Message, ctx: StubServiceContext, *, project: Project, version: int
+) -> None:
+    from common.py.api.project import ProjectAddedEvent
 
-    ProjectsListEvent.build(
-        ctx.message_builder,
-        projects=ctx.storage_pool.project_storage.list(),
-        chain=msg,
+    ProjectAddedEvent.build(
+        ctx.message_builder, project=project, version=version, chain=msg
+    ).emit(Channel.direct(msg.origin))
+
+
+def send_project_updated(
+    msg: Message, ctx: StubServiceContext, *, project: Project, version: int
+) -> None:
+    from common.py.api.project import ProjectUpdatedEvent
+
+    ProjectUpdatedEvent.build(
+        ctx.message_builder, project=project, version=version, chain=msg
+    ).emit(Channel.direct(msg.origin))
+
+
+def send_project_removed(
+    msg: Message, ctx: StubServiceContext, *, project_id: ProjectID, version: int
+) -> None:
+    from common.py.api.project import ProjectRemovedEvent
+
+    ProjectRemovedEvent.build(
+        ctx.message_builder, project_id=project_id, version=version, chain=msg
     ).emit(Channel.direct(msg.origin))
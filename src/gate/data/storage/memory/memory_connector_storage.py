@@ -1,3 +1,5 @@
+import itertools
+import threading
 import typing
 
 from common.py.data.entities.connector import ConnectorID, Connector
@@ -11,14 +13,26 @@ class MemoryConnectorStorage(ConnectorStorage):
 
     _connectors: typing.Dict[ConnectorID, Connector] = {}
 
+    _versions = itertools.count(1)
+    _version = 0
+
+    # The storage data is shared among all instances, so they need to share their lock as well
+    _shared_lock = threading.RLock()
+
+    def __init__(self):
+        super().__init__()
+
+        self._lock = MemoryConnectorStorage._shared_lock
+
     def next_id(self) -> ConnectorID:
         raise NotImplementedError("Connectors do not support automatic IDs")
 
-    def add(self, entity: Connector) -> None:
+    def add(self, entity: Connector) -> int:
         with self._lock:
             MemoryConnectorStorage._connectors[entity.connector_id] = entity
+            return self._increase_version()
 
-    def remove(self, entity: Connector) -> None:
+    def remove(self, entity: Connector) -> int:
         with self._lock:
             try:
                 del MemoryConnectorStorage._connectors[entity.connector_id]
@@ -29,6 +43,8 @@ class MemoryConnectorStorage(ConnectorStorage):
                     f"A connector with ID {entity.connector_id} was not found"
                 ) from exc
 
+            return self._increase_version()
+
     def get(self, key: ConnectorID) -> Connector | None:
         with self._lock:
             if key in MemoryConnectorStorage._connectors:
@@ -38,3 +54,13 @@ class MemoryConnectorStorage(ConnectorStorage):
     def list(self) -> typing.List[Connector]:
         with self._lock:
             return list(MemoryConnectorStorage._connectors.values())
+
+    @property
+    def version(self) -> int:
+        with self._lock:
+            return MemoryConnectorStorage._version
+
+    def _increase_version(self) -> int:
+        # Must be called while holding the lock, so that the version is changed together with the data
+        MemoryConnectorStorage._version = next(MemoryConnectorStorage._versions)
+        return MemoryConnectorStorage._version
@@ -1,3 +1,8 @@
+import base64
+import heapq
+import itertools
+import threading
+import json
 import typing
 
 from common.py.data.entities.project import Project, ProjectID
@@ -11,6 +16,17 @@ class MemoryProjectStorage(ProjectStorage):
 
     _projects: typing.Dict[ProjectID, Project] = {}
 
+    _versions = itertools.count(1)
+    _version = 0
+
+    # The storage data is shared among all instances, so they need to share their lock as well
+    _shared_lock = threading.RLock()
+
+    def __init__(self):
+        super().__init__()
+
+        self._lock = MemoryProjectStorage._shared_lock
+
     def next_id(self) -> ProjectID:
         with self._lock:
             ids = MemoryProjectStorage._projects.keys()
@@ -19,16 +35,17 @@ class MemoryProjectStorage(ProjectStorage):
             else:
                 return 1000
 
-    def add(self, entity: Project) -> None:
+    def add(self, entity: Project) -> int:
         with self._lock:
             MemoryProjectStorage._projects[entity.project_id] = entity
+            return self._increase_version()
 
-    def remove(self, entity: Project) -> None:
+    def remove(self, entity: Project) -> int:
         with self._lock:
             from common.py.data.entities import clone_entity
 
             proj_deleted = clone_entity(entity, status=Project.Status.DELETED)
-            self.add(proj_deleted)
+            MemoryProjectStorage._projects[entity.project_id] = proj_deleted
 
             try:
                 del MemoryProjectStorage._projects[entity.project_id]
@@ -39,6 +56,8 @@ class MemoryProjectStorage(ProjectStorage):
                     f"A project with ID {entity.project_id} was not found"
                 ) from exc
 
+            return self._increase_version()
+
     def get(self, key: ProjectID) -> Project | None:
         with self._lock:
             if key in MemoryProjectStorage._projects:
@@ -48,3 +67,76 @@ class MemoryProjectStorage(ProjectStorage):
     def list(self) -> typing.List[Project]:
         with self._lock:
             return list(MemoryProjectStorage._projects.values())
+
+    def list_page(
+        self,
+        *,
+        cursor: str = "",
+        limit: int = 0,
+        sort: ProjectStorage.SortKey = ProjectStorage.SortKey.PROJECT_ID,
+    ) -> typing.Tuple[typing.List[Project], str, int]:
+        def sort_key(project: Project) -> typing.Tuple[typing.Any, ProjectID]:
+            return getattr(project, sort), project.project_id
+
+        after = self._decode_cursor(cursor, sort) if cursor != "" else None
+
+        with self._lock:
+            projects = (
+                project
+                for project in MemoryProjectStorage._projects.values()
+                if after is None or sort_key(project) > after
+            )
+
+            # Only keep as many projects as needed (plus one to detect whether another page follows)
+            if limit > 0:
+                page = heapq.nsmallest(limit + 1, projects, key=sort_key)
+            else:
+                page = sorted(projects, key=sort_key)
+
+            version = MemoryProjectStorage._version
+
+        if 0 < limit < len(page):
+            page = page[:limit]
+            return page, self._encode_cursor(sort, sort_key(page[-1])), version
+
+        return page, "", version
+
+    @staticmethod
+    def _encode_cursor(
+        sort: ProjectStorage.SortKey, key: typing.Tuple[typing.Any, ProjectID]
+    ) -> str:
+        data = json.dumps([sort, key[0], key[1]]).encode("utf-8")
+        return base64.urlsafe_b64encode(data).decode("ascii")
+
+    @staticmethod
+    def _decode_cursor(
+        cursor: str, sort: ProjectStorage.SortKey
+    ) -> typing.Tuple[typing.Any, ProjectID]:
+        from common.py.data.storage import StorageException
+
+        try:
+            data = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        except ValueError as exc:
+            raise StorageException(f"Invalid cursor: {cursor}") from exc
+
+        value_type = str if sort == ProjectStorage.SortKey.TITLE else (int, float)
+        if (
+            not isinstance(data, list)
+            or len(data) != 3
+            or data[0] != sort
+            or not isinstance(data[1], value_type)
+            or not isinstance(data[2], int)
+        ):
+            raise StorageException(f"Invalid cursor for sorting by {sort}: {cursor}")
+
+        return data[1], data[2]
+
+    @property
+    def version(self) -> int:
+        with self._lock:
+            return MemoryProjectStorage._version
+
+    def _increase_version(self) -> int:
+        # Must be called while holding the lock, so that the version is changed together with the data
+        MemoryProjectStorage._version = next(MemoryProjectStorage._versions)
+        return MemoryProjectStorage._version